@@ -2,6 +2,7 @@
 模型注册表 - 管理模型版本、元数据和部署
 """
 
+import asyncio
 import json
 import pickle  # nosec B403
 from dataclasses import asdict, dataclass
@@ -18,6 +19,9 @@ settings = get_settings()
 logger = structlog.get_logger()
 # settings imported above
 
+# 服务进程内提交的缓存失效任务, 保留引用直到完成
+_background_tasks: set[asyncio.Task[None]] = set()
+
 
 @dataclass
 class ModelMetadata:
@@ -161,6 +165,8 @@ class ModelRegistry:
             self._set_active_version(model_id, version)
 
         self._save_index()
+        if make_active:
+            self._invalidate_model_caches(version)
 
         logger.info(
             "模型注册成功",
@@ -187,6 +193,43 @@ class ModelRegistry:
 
         self.index["active_versions"][model_id] = version
 
+    def _invalidate_model_caches(self, version: str) -> None:
+        """
+        活跃版本变更后让模型列表与预测缓存失效
+
+        在服务的事件循环内调用时后台执行; 训练脚本等同步调用方使用独立的
+        缓存管理器同步完成。失效失败只记录日志, 不影响版本切换。
+        """
+        from football_predict_system.core.cache import CacheManager
+        from football_predict_system.domain.services.model_service import (
+            get_model_service,
+        )
+
+        service = get_model_service()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            task = loop.create_task(service.on_model_promoted(version))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+            return
+
+        async def invalidate() -> None:
+            # 连接属于这个临时事件循环, 用完即关闭
+            cache_manager = CacheManager()
+            try:
+                await service.on_model_promoted(version, cache_manager)
+            finally:
+                await cache_manager.close()
+
+        try:
+            asyncio.run(invalidate())
+        except Exception as e:
+            logger.warning("模型缓存失效失败", version=version, error=str(e))
+
     def load_model(self, model_id: str, version: str | None = None) -> Any:
         """
         加载模型
@@ -301,6 +344,7 @@ class ModelRegistry:
         old_active = self.get_active_version(model_id)
         self._set_active_version(model_id, version)
         self._save_index()
+        self._invalidate_model_caches(version)
 
         logger.info(
             "模型版本已提升",
@@ -13,7 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from prefect import serve
 from prefect.client.schemas.schedules import CronSchedule
 
+from football_predict_system.data_platform.config import get_data_platform_config
 from football_predict_system.data_platform.flows.data_collection import (
+    cache_warming_flow,
     daily_data_collection_flow,
     data_quality_check_flow,
     historical_backfill_flow,
@@ -44,6 +46,18 @@ async def deploy_flows():
         parameters={},
     )
 
+    # Cache warming - ahead of upcoming kickoff windows
+    schedule_config = get_data_platform_config().schedule
+    warming_deployment = await cache_warming_flow.to_deployment(
+        name="cache-warming",
+        description="Pre-warm prediction, team and league caches before kickoff",
+        tags=["cache", "warming", "production"],
+        schedule=CronSchedule(cron=schedule_config.cache_warming_cron),
+        parameters={
+            "lookahead_hours": schedule_config.cache_warming_lookahead_hours,
+        },
+    )
+
     # Historical backfill - manual trigger only
     backfill_deployment = await historical_backfill_flow.to_deployment(
         name="historical-backfill",
@@ -62,6 +76,7 @@ async def deploy_flows():
     await serve(
         daily_deployment,
         quality_deployment,
+        warming_deployment,
         backfill_deployment,
         print_starting_urls=True,
     )
@@ -73,7 +88,8 @@ if __name__ == "__main__":
     print("Deploying flows:")
     print("  1. Daily Data Collection (every 6 hours)")
     print("  2. Data Quality Check (every hour)")
-    print("  3. Historical Backfill (manual)")
+    print("  3. Cache Warming (hourly, ahead of kickoff)")
+    print("  4. Historical Backfill (manual)")
     print("=" * 50)
 
     asyncio.run(deploy_flows())
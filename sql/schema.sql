@@ -110,6 +110,18 @@ CREATE TABLE IF NOT EXISTS data_collection_logs (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- API keys (only SHA-256 hashes of the keys are stored)
+CREATE TABLE IF NOT EXISTS api_keys (
+    key_hash CHAR(64) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    user_id VARCHAR(100) NOT NULL,
+    role VARCHAR(20) NOT NULL DEFAULT 'api_client',
+    requests_per_minute INTEGER,
+    expires_at TIMESTAMP,
+    revoked_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- 索引优化
 CREATE INDEX IF NOT EXISTS idx_real_matches_api_id ON real_matches(api_id);
 CREATE INDEX IF NOT EXISTS idx_real_matches_date ON real_matches(utc_date);
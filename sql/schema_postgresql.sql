@@ -26,7 +26,12 @@ CREATE TABLE IF NOT EXISTS matches (
     match_date TIMESTAMP NOT NULL,
     home_score INTEGER,
     away_score INTEGER,
+    home_score_ht INTEGER,
+    away_score_ht INTEGER,
+    result VARCHAR(10),
     status VARCHAR(20),
+    matchday INTEGER,
+    venue VARCHAR(100),
     competition_id INTEGER,
     season_year INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -84,6 +89,18 @@ CREATE TABLE IF NOT EXISTS predictions (
     FOREIGN KEY (match_id) REFERENCES matches(id)
 );
 
+-- API keys (only SHA-256 hashes of the keys are stored)
+CREATE TABLE IF NOT EXISTS api_keys (
+    key_hash CHAR(64) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    user_id VARCHAR(100) NOT NULL,
+    role VARCHAR(20) NOT NULL DEFAULT 'api_client',
+    requests_per_minute INTEGER,
+    expires_at TIMESTAMP,
+    revoked_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_teams_external_api_id ON teams(external_api_id);
 CREATE INDEX IF NOT EXISTS idx_matches_external_api_id ON matches(external_api_id);
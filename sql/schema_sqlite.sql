@@ -26,6 +26,9 @@ CREATE TABLE IF NOT EXISTS matches (
     match_date TEXT NOT NULL,
     home_score INTEGER,
     away_score INTEGER,
+    home_score_ht INTEGER,
+    away_score_ht INTEGER,
+    result VARCHAR(10),
     status VARCHAR(20) DEFAULT 'scheduled',
     season VARCHAR(10),
     matchday INTEGER,
@@ -73,6 +76,18 @@ CREATE TABLE IF NOT EXISTS data_collection_logs (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- API keys (only SHA-256 hashes of the keys are stored)
+CREATE TABLE IF NOT EXISTS api_keys (
+    key_hash CHAR(64) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    user_id VARCHAR(100) NOT NULL,
+    role VARCHAR(20) NOT NULL DEFAULT 'api_client',
+    requests_per_minute INTEGER,
+    expires_at TIMESTAMP,
+    revoked_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(match_date);
 CREATE INDEX IF NOT EXISTS idx_matches_home_team ON matches(home_team_id);
@@ -0,0 +1,64 @@
+"""
+Authentication API endpoints for v1.
+
+Exchanges credentials for a JWT access token. Password hashes are checked
+on the bcrypt thread pool, so a burst of logins does not stall other
+requests.
+"""
+
+from fastapi import APIRouter, HTTPException, status
+from pydantic import BaseModel
+
+from ...core.exceptions import RateLimitError
+from ...core.security import get_auth_service
+
+router = APIRouter()
+
+
+class TokenRequest(BaseModel):
+    """Login credentials."""
+
+    username: str
+    password: str
+
+
+class TokenResponse(BaseModel):
+    """Issued access token."""
+
+    access_token: str
+    token_type: str = "bearer"
+    expires_in: int
+
+
+@router.post(
+    "/token",
+    response_model=TokenResponse,
+    summary="Issue an access token",
+    description="Exchange a username and password for a JWT access token",
+)
+async def create_token(credentials: TokenRequest) -> TokenResponse:
+    """Authenticate a user and issue an access token."""
+    auth_service = get_auth_service()
+    try:
+        user = await auth_service.authenticate_user_async(
+            credentials.username, credentials.password
+        )
+    except RateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 1))},
+        )
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    jwt_manager = auth_service.jwt_manager
+    return TokenResponse(
+        access_token=jwt_manager.create_access_token(user["user_id"], user["role"]),
+        expires_in=jwt_manager.config.jwt_expire_minutes * 60,
+    )
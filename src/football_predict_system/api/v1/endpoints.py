@@ -7,12 +7,12 @@ This module aggregates all API v1 endpoint routers.
 from fastapi import APIRouter
 
 # Import endpoint routers
+from .auth import router as auth_router
 from .models import router as models_router
+from .monitoring import router as monitoring_router
 from .predictions import router as predictions_router
 
 # from .data import router as data_router
-# from .monitoring import router as monitoring_router
-
 
 router = APIRouter()
 
@@ -20,7 +20,8 @@ router = APIRouter()
 router.include_router(predictions_router, prefix="/predict", tags=["predictions"])
 router.include_router(models_router, prefix="/models", tags=["models"])
 # router.include_router(data_router, prefix="/data", tags=["data"])
-# router.include_router(monitoring_router, prefix="/monitoring", tags=["monitoring"])
+router.include_router(monitoring_router, prefix="/monitoring", tags=["monitoring"])
+router.include_router(auth_router, prefix="/auth", tags=["auth"])
 
 
 @router.get("/status", tags=["general"])
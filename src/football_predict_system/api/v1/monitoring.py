@@ -0,0 +1,74 @@
+"""
+Monitoring API endpoints for v1.
+
+Operational views of the running worker for administrators, authenticated
+with an admin API key.
+"""
+
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from ...core.metrics import get_operation_metrics
+from ...core.query_stats import get_query_stats
+from ...core.security import APIKey, UserRole, require_api_key
+
+router = APIRouter()
+
+
+async def require_admin(client: APIKey = Depends(require_api_key)) -> APIKey:
+    """Allow only API keys with the admin role."""
+    if client.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API key required",
+        )
+    return client
+
+
+@router.get(
+    "/operations",
+    summary="Operation latency percentiles",
+    description=(
+        "Call count, errors and p50/p95/p99 latency of every instrumented "
+        "operation in this worker since startup"
+    ),
+)
+async def get_operation_latencies(
+    admin: APIKey = Depends(require_admin),
+) -> dict[str, dict[str, Any]]:
+    """Get latency percentiles per operation."""
+    return get_operation_metrics().summary()
+
+
+@router.get(
+    "/queries",
+    summary="Database statement statistics",
+    description=(
+        "Calls, total and p50/p95/p99 latency, rows and errors per normalized "
+        "database statement in this worker since startup or the last reset"
+    ),
+)
+async def get_query_statistics(
+    limit: int = Query(50, ge=1, le=1000),
+    order_by: Literal["total_ms", "count", "mean_ms", "p99_ms", "rows", "errors"] = (
+        "total_ms"
+    ),
+    admin: APIKey = Depends(require_admin),
+) -> dict[str, Any]:
+    """Get the most expensive statements."""
+    query_stats = get_query_stats()
+    return {
+        "statements": query_stats.summary(limit=limit, order_by=order_by),
+        "evictions": query_stats.evictions,
+    }
+
+
+@router.delete(
+    "/queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Reset database statement statistics",
+)
+async def reset_query_statistics(admin: APIKey = Depends(require_admin)) -> None:
+    """Discard collected statement statistics."""
+    get_query_stats().reset()
@@ -2,18 +2,20 @@
 Caching system package.
 
 This package provides production-grade caching capabilities with:
-- Multi-level caching (memory + Redis)
+- Multi-level caching (memory + Redis, optional local disk tier)
 - Cache invalidation strategies
 - Performance monitoring
-- Distributed caching support
+- Distributed caching support (Redis or in-process backend)
 """
 
 import redis
 
+from .backends import CacheBackend, InMemoryBackend, create_backend
 from .decorators import cached
+from .disk import DiskCache
 from .invalidator import CacheInvalidator
-from .manager import CacheManager
-from .models import CacheStats
+from .manager import NEGATIVE_CACHE_MARKER, CacheManager
+from .models import CacheStats, WarmingReport
 from .warmer import CacheWarmer
 
 # Global cache manager instance
@@ -29,11 +31,17 @@ async def get_cache_manager() -> CacheManager:
 
 
 __all__ = [
+    "NEGATIVE_CACHE_MARKER",
+    "CacheBackend",
     "CacheInvalidator",
     "CacheManager",
     "CacheStats",
     "CacheWarmer",
+    "DiskCache",
+    "InMemoryBackend",
+    "WarmingReport",
     "cached",
+    "create_backend",
     "get_cache_manager",
     "redis",
 ]
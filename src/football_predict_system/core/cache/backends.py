@@ -0,0 +1,316 @@
+"""
+Cache storage backends.
+
+``CacheBackend`` is the subset of the ``redis.asyncio`` client API that the
+cache layer relies on. ``redis.asyncio.Redis`` satisfies it as-is; the
+in-process ``InMemoryBackend`` implements the same calls with equivalent TTL
+semantics so single-node deployments and benchmarks can run without Redis.
+The backend is selected with ``CACHE__BACKEND`` (``redis`` or ``memory``).
+"""
+
+import asyncio
+import fnmatch
+import math
+import time
+from collections.abc import AsyncIterator, Mapping
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+import redis.asyncio as redis
+
+from ..logging import get_logger
+
+if TYPE_CHECKING:
+    from ..config import Settings
+
+logger = get_logger(__name__)
+
+# Expired keys are swept from the in-memory store every this many writes
+SWEEP_EVERY_WRITES = 1000
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Key/value operations used by the cache layer."""
+
+    async def get(self, name: str) -> bytes | None: ...
+
+    async def mget(self, keys: list[str], *args: str) -> list[bytes | None]: ...
+
+    async def set(
+        self,
+        name: str | bytes,
+        value: Any,
+        ex: float | timedelta | None = None,
+        px: float | timedelta | None = None,
+    ) -> bool | None: ...
+
+    async def setex(self, name: str, time: int, value: Any) -> bool: ...
+
+    async def delete(self, *names: str | bytes) -> int: ...
+
+    async def exists(self, *names: str | bytes) -> int: ...
+
+    async def ttl(self, name: str) -> int: ...
+
+    async def keys(self, pattern: str = "*") -> list[bytes]: ...
+
+    def scan_iter(
+        self, match: str | None = None, count: int | None = None
+    ) -> AsyncIterator[bytes]: ...
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]: ...
+
+    async def hincrby(self, name: str, key: str, amount: int = 1) -> int: ...
+
+    async def publish(self, channel: str, message: Any) -> int: ...
+
+    def pipeline(self, transaction: bool = True) -> Any: ...
+
+    async def ping(self) -> bool: ...
+
+    async def info(self, section: str | bytes | None = None) -> Mapping[str, Any]: ...
+
+    async def close(self) -> None: ...
+
+
+def _encode(value: Any) -> bytes:
+    """Encode a value the way redis-py does before sending it."""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, int | float):
+        return repr(value).encode("utf-8")
+    raise TypeError(f"Invalid input of type: {type(value).__name__!r}")
+
+
+def _ttl_seconds(
+    ex: float | timedelta | None, px: float | timedelta | None
+) -> float | None:
+    """TTL in seconds from redis-py style ``ex`` (seconds) or ``px`` (ms)."""
+    if isinstance(ex, timedelta):
+        return ex.total_seconds()
+    if ex is not None:
+        return float(ex)
+    if isinstance(px, timedelta):
+        return px.total_seconds()
+    if px is not None:
+        return px / 1000
+    return None
+
+
+def _name(name: str | bytes) -> str:
+    """Normalize a key name; Redis accepts both str and bytes."""
+    return name.decode("utf-8") if isinstance(name, bytes) else name
+
+
+class InMemoryPipeline:
+    """Buffered command pipeline for ``InMemoryBackend``."""
+
+    def __init__(self, backend: "InMemoryBackend") -> None:
+        self._backend = backend
+        self._commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "InMemoryPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._commands.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or not hasattr(self._backend, name):
+            raise AttributeError(name)
+
+        def queue(*args: Any, **kwargs: Any) -> "InMemoryPipeline":
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        """Run buffered commands in order and return their results."""
+        commands, self._commands = self._commands, []
+        return [
+            await getattr(self._backend, name)(*args, **kwargs)
+            for name, args, kwargs in commands
+        ]
+
+
+class InMemoryBackend:
+    """In-process cache backend with Redis-compatible TTL semantics."""
+
+    def __init__(self) -> None:
+        self.logger = get_logger(__name__)
+        # key -> (value, absolute expiry on the monotonic clock or None)
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+        self._hashes: dict[str, dict[bytes, bytes]] = {}
+        self._channels: dict[str, list[asyncio.Queue[bytes]]] = {}
+        self._writes = 0
+
+    def _live(self, name: str | bytes) -> bytes | None:
+        """Get a value, dropping it if expired."""
+        name = _name(name)
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[name]
+            return None
+        return value
+
+    def _store(self, name: str | bytes, value: Any, ttl: float | None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[_name(name)] = (_encode(value), expires_at)
+        self._writes += 1
+        if self._writes % SWEEP_EVERY_WRITES == 0:
+            self._sweep()
+
+    def _sweep(self) -> int:
+        """Remove all expired keys."""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, expires_at) in self._data.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+    def _matching(self, pattern: str | None) -> list[str]:
+        return [
+            key
+            for key in list(self._data)
+            if self._live(key) is not None
+            and (pattern is None or fnmatch.fnmatchcase(key, pattern))
+        ]
+
+    async def get(self, name: str) -> bytes | None:
+        """Get a value."""
+        return self._live(name)
+
+    async def mget(self, keys: list[str], *args: str) -> list[bytes | None]:
+        """Get several values."""
+        return [self._live(name) for name in [*keys, *args]]
+
+    async def set(
+        self,
+        name: str | bytes,
+        value: Any,
+        ex: float | timedelta | None = None,
+        px: float | timedelta | None = None,
+    ) -> bool:
+        """Set a value with an optional TTL (``ex`` seconds or ``px`` ms)."""
+        self._store(name, value, _ttl_seconds(ex, px))
+        return True
+
+    async def setex(self, name: str, time: int, value: Any) -> bool:
+        """Set a value with a TTL in seconds."""
+        if time <= 0:
+            raise redis.ResponseError("invalid expire time in 'setex' command")
+        self._store(name, value, time)
+        return True
+
+    async def delete(self, *names: str | bytes) -> int:
+        """Delete keys, returning how many existed."""
+        deleted = 0
+        for name in map(_name, names):
+            existed = self._live(name) is not None or name in self._hashes
+            self._data.pop(name, None)
+            self._hashes.pop(name, None)
+            deleted += existed
+        return deleted
+
+    async def exists(self, *names: str | bytes) -> int:
+        """Count how many of the keys exist."""
+        return sum(
+            1
+            for name in map(_name, names)
+            if self._live(name) is not None or name in self._hashes
+        )
+
+    async def ttl(self, name: str) -> int:
+        """Remaining TTL: -2 if missing, -1 if the key never expires."""
+        name = _name(name)
+        if self._live(name) is None:
+            return -1 if name in self._hashes else -2
+        expires_at = self._data[name][1]
+        if expires_at is None:
+            return -1
+        return max(0, math.floor(expires_at - time.monotonic() + 0.5))
+
+    async def keys(self, pattern: str = "*") -> list[bytes]:
+        """List live keys matching a glob pattern."""
+        return [key.encode("utf-8") for key in self._matching(pattern)]
+
+    async def scan_iter(
+        self, match: str | None = None, count: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """Iterate live keys matching a glob pattern."""
+        for key in self._matching(match):
+            yield key.encode("utf-8")
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        """Get all fields of a hash."""
+        return dict(self._hashes.get(_name(name), {}))
+
+    async def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        """Increment an integer hash field."""
+        fields = self._hashes.setdefault(_name(name), {})
+        field = _encode(key)
+        value = int(fields.get(field, b"0")) + amount
+        fields[field] = str(value).encode("utf-8")
+        return value
+
+    def subscribe(self, channel: str) -> asyncio.Queue[bytes]:
+        """Subscribe to a channel; published messages land on the queue."""
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._channels.setdefault(channel, []).append(queue)
+        return queue
+
+    async def publish(self, channel: str, message: Any) -> int:
+        """Publish a message, returning the number of receivers."""
+        subscribers = self._channels.get(channel, [])
+        payload = _encode(message)
+        for queue in subscribers:
+            queue.put_nowait(payload)
+        return len(subscribers)
+
+    def pipeline(self, transaction: bool = True) -> InMemoryPipeline:
+        """Create a command pipeline."""
+        return InMemoryPipeline(self)
+
+    async def ping(self) -> bool:
+        """Always reachable."""
+        return True
+
+    async def info(self, section: str | bytes | None = None) -> dict[str, Any]:
+        """Backend information in the shape of ``INFO``."""
+        used = sum(len(k) + len(v) for k, (v, _) in self._data.items())
+        return {
+            "redis_version": "in-memory",
+            "connected_clients": 1,
+            "used_memory_human": f"{used / 1024:.2f}K",
+            "db0": {"keys": len(self._data) + len(self._hashes)},
+        }
+
+    async def close(self) -> None:
+        """Nothing to release; data lives as long as the process."""
+
+
+def create_backend(settings: "Settings") -> CacheBackend:
+    """Create the cache backend selected in settings."""
+    if settings.cache.backend == "memory":
+        logger.info("Using in-memory cache backend")
+        return InMemoryBackend()
+
+    client: CacheBackend = redis.from_url(
+        settings.redis.url,
+        max_connections=settings.redis.max_connections,
+        retry_on_timeout=settings.redis.retry_on_timeout,
+        socket_timeout=settings.redis.socket_timeout,
+        decode_responses=False,  # We handle encoding ourselves
+    )
+    return client
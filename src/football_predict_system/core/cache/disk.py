@@ -0,0 +1,256 @@
+"""
+Persistent local disk cache tier.
+
+SQLite-backed key/value store in WAL mode used as an optional L3 tier
+beneath the memory cache, so a restarted worker serves warm data without
+going back to Redis or the database. Calls block on SQLite; async callers
+run them in a worker thread.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# Fraction of the size bound to shrink to once eviction kicks in
+EVICTION_TARGET_RATIO = 0.9
+
+
+class DiskCache:
+    """Size-bounded SQLite cache with per-entry TTLs."""
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={max_bytes}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at "
+            "ON cache_entries (expires_at)"
+        )
+
+        self._total_bytes = 0
+        with self._lock:
+            self._purge_expired(time.time())
+            self._total_bytes = int(
+                self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+                ).fetchone()[0]
+            )
+
+    def get(self, key: str) -> tuple[bytes, float] | None:
+        """Get a payload and its remaining TTL in seconds."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache_entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache read error", key=key, error=str(e))
+            return None
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            self.delete(key)
+            return None
+        return bytes(value), remaining
+
+    def set(self, key: str, value: bytes, ttl: int) -> bool:
+        """Store a payload with a TTL."""
+        return self.set_many({key: value}, ttl) == 1
+
+    def set_many(self, items: dict[str, bytes], ttl: int) -> int:
+        """Store several payloads with the same TTL in one transaction."""
+        if not items:
+            return 0
+
+        expires_at = time.time() + ttl
+        try:
+            with self._lock:
+                total_before = self._total_bytes
+                self._conn.execute("BEGIN")
+                try:
+                    for key, value in items.items():
+                        row = self._conn.execute(
+                            "SELECT size FROM cache_entries WHERE key = ?", (key,)
+                        ).fetchone()
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO cache_entries "
+                            "(key, value, expires_at, size) VALUES (?, ?, ?, ?)",
+                            (key, value, expires_at, len(value)),
+                        )
+                        self._total_bytes += len(value) - (row[0] if row else 0)
+                    self._evict()
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    self._total_bytes = total_before
+                    raise
+            return len(items)
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache write error", count=len(items), error=str(e))
+            return 0
+
+    def delete(self, key: str) -> bool:
+        """Delete a single entry."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE key = ? RETURNING size", (key,)
+                ).fetchone()
+                if row:
+                    self._total_bytes -= row[0]
+            return row is not None
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache delete error", key=key, error=str(e))
+            return False
+
+    def delete_many(self, keys: list[str]) -> int:
+        """Delete several entries in one transaction."""
+        if not keys:
+            return 0
+
+        try:
+            with self._lock:
+                total_before = self._total_bytes
+                deleted = 0
+                self._conn.execute("BEGIN")
+                try:
+                    for key in keys:
+                        row = self._conn.execute(
+                            "DELETE FROM cache_entries WHERE key = ? RETURNING size",
+                            (key,),
+                        ).fetchone()
+                        if row:
+                            self._total_bytes -= row[0]
+                            deleted += 1
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    self._total_bytes = total_before
+                    raise
+            return deleted
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache delete error", count=len(keys), error=str(e))
+            return 0
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete all entries whose key starts with prefix."""
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE substr(key, 1, ?) = ? "
+                    "RETURNING size",
+                    (len(prefix), prefix),
+                ).fetchall()
+                self._total_bytes -= sum(row[0] for row in rows)
+            return len(rows)
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache prefix delete error", error=str(e))
+            return 0
+
+    def recent_entries(self, limit: int) -> list[tuple[str, bytes, float]]:
+        """Return the longest-lived unexpired entries with remaining TTLs."""
+        now = time.time()
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT key, value, expires_at FROM cache_entries "
+                    "WHERE expires_at > ? ORDER BY expires_at DESC LIMIT ?",
+                    (now, limit),
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache scan error", error=str(e))
+            return []
+        return [
+            (key, bytes(value), expires_at - now) for key, value, expires_at in rows
+        ]
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries."""
+        try:
+            with self._lock:
+                return self._purge_expired(time.time())
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache purge error", error=str(e))
+            return 0
+
+    def stats(self) -> dict[str, int]:
+        """Get disk cache size information."""
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries"
+            ).fetchone()[0]
+        return {
+            "entries": int(entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
+
+    def _purge_expired(self, now: float) -> int:
+        """Remove expired entries; caller must hold the lock."""
+        rows = self._conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at <= ? RETURNING size", (now,)
+        ).fetchall()
+        self._total_bytes -= sum(row[0] for row in rows)
+        return len(rows)
+
+    def _evict(self) -> None:
+        """Evict entries until under the size bound; caller must hold the lock."""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        self._purge_expired(time.time())
+        target = int(self.max_bytes * EVICTION_TARGET_RATIO)
+        evicted = 0
+
+        # Entries closest to expiry are the cheapest to lose
+        while self._total_bytes > target:
+            rows = self._conn.execute(
+                "DELETE FROM cache_entries WHERE key IN ("
+                "SELECT key FROM cache_entries ORDER BY expires_at LIMIT 100"
+                ") RETURNING size"
+            ).fetchall()
+            if not rows:
+                break
+            self._total_bytes -= sum(row[0] for row in rows)
+            evicted += len(rows)
+
+        if evicted:
+            self.logger.info(
+                "Disk cache evicted entries",
+                evicted=evicted,
+                total_bytes=self._total_bytes,
+            )
@@ -60,6 +60,10 @@ class CacheInvalidator:
             )
             return 0
 
+    async def invalidate_namespace(self, namespace: str) -> int:
+        """Invalidate a whole namespace by bumping its generation."""
+        return await self.cache_manager.bump_namespace(namespace)
+
     async def invalidate_by_tags(self, tags: list[str]) -> int:
         """Invalidate cache entries by tags."""
         total_deleted = 0
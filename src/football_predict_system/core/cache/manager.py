@@ -1,11 +1,22 @@
 """
 Cache manager implementation.
 
-Handles multi-level caching with Redis backend and memory cache.
+Handles multi-level caching with Redis backend, memory cache and an optional
+persistent local disk tier.
+
+The disk tier is read before Redis so restarted workers start warm. Like
+the memory tier it cannot see deletes made on other nodes, so its entries
+live at most ``disk_max_ttl`` seconds; its SQLite calls run in a worker
+thread to keep the event loop free.
+
+Each namespace has a generation counter stored in Redis and mirrored locally.
+The generation is embedded in every key, so bumping it invalidates the whole
+namespace in O(1); entries from older generations simply age out via TTL.
 """
 
 import asyncio
 import json
+import time
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from functools import wraps
@@ -15,10 +26,15 @@ import redis.asyncio as redis
 
 from ..config import get_settings
 from ..logging import get_logger
+from .backends import CacheBackend, create_backend
+from .disk import DiskCache
 from .models import CacheStats
 
 logger = get_logger(__name__)
 
+# Value stored for lookups known to have no backing entity
+NEGATIVE_CACHE_MARKER = {"__missing__": True}
+
 
 class CacheManager:
     """Manages multi-level caching with Redis backend."""
@@ -26,28 +42,133 @@ class CacheManager:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.logger = get_logger(__name__)
-        self._redis_client: redis.Redis | None = None  # type: ignore
+        self._redis_client: CacheBackend | None = None
         self._memory_cache: dict[str, dict[str, Any]] = {}
         self._stats = CacheStats()
         self._max_memory_items = 1000
         self._default_ttl = 3600  # 1 hour
+        self._disk_cache: DiskCache | None = None
+        if self.settings.cache.disk_enabled:
+            self._disk_cache = DiskCache(
+                self.settings.cache.disk_path,
+                max_bytes=self.settings.cache.disk_max_bytes,
+            )
+        self._generations: dict[str, int] = {}
+        self._generations_synced_at = 0.0
 
-    async def get_redis_client(self) -> redis.Redis:  # type: ignore
-        """Get or create Redis client."""
+    async def get_redis_client(self) -> CacheBackend:
+        """Get or create the cache backend client (Redis unless configured)."""
         if self._redis_client is None:
-            self._redis_client = redis.from_url(
-                self.settings.redis.url,
-                max_connections=self.settings.redis.max_connections,
-                retry_on_timeout=self.settings.redis.retry_on_timeout,
-                socket_timeout=self.settings.redis.socket_timeout,
-                decode_responses=False,  # We handle encoding ourselves
-            )
+            self._redis_client = create_backend(self.settings)
         return self._redis_client
 
     def _generate_key(self, namespace: str, key: str) -> str:
-        """Generate cache key with namespace."""
+        """Generate cache key with namespace and its current generation."""
+        generation = self._generations.get(namespace, 0)
+        if generation:
+            return f"{self.settings.app_name}:{namespace}:v{generation}:{key}"
         return f"{self.settings.app_name}:{namespace}:{key}"
 
+    @property
+    def _generations_key(self) -> str:
+        """Redis hash holding the generation of every namespace."""
+        return f"{self.settings.app_name}:cache_generations"
+
+    def get_generation(self, namespace: str) -> int:
+        """Get the locally mirrored generation of a namespace."""
+        return self._generations.get(namespace, 0)
+
+    async def sync_generations(self, force: bool = False) -> None:
+        """Refresh the local generation mirror from Redis when it is stale."""
+        now = time.monotonic()
+        interval = self.settings.cache.generation_sync_interval
+        if not force and now - self._generations_synced_at < interval:
+            return
+        self._generations_synced_at = now
+
+        try:
+            redis_client = await self.get_redis_client()
+            remote = await redis_client.hgetall(self._generations_key)
+        except redis.RedisError as e:
+            self.logger.warning("Cache generation sync error", error=str(e))
+            return
+
+        for namespace, generation in remote.items():
+            name = namespace.decode() if isinstance(namespace, bytes) else namespace
+            # Never go backwards, e.g. after a bump made while Redis was down
+            self._generations[name] = max(
+                self._generations.get(name, 0), int(generation)
+            )
+
+    async def bump_namespace(self, namespace: str) -> int:
+        """Invalidate a namespace in O(1) by advancing its generation."""
+        generation = self._generations.get(namespace, 0) + 1
+
+        try:
+            redis_client = await self.get_redis_client()
+            remote = await redis_client.hincrby(self._generations_key, namespace, 1)
+            generation = max(generation, int(remote))
+        except redis.RedisError as e:
+            self._stats.errors += 1
+            self.logger.error(
+                "Cache generation bump error", namespace=namespace, error=str(e)
+            )
+
+        self._generations[namespace] = generation
+
+        # Free memory slots held by entries that can no longer be reached
+        prefix = f"{self.settings.app_name}:{namespace}:"
+        for cache_key in [k for k in self._memory_cache if k.startswith(prefix)]:
+            del self._memory_cache[cache_key]
+
+        self.logger.info(
+            "Cache namespace generation bumped",
+            namespace=namespace,
+            generation=generation,
+        )
+        return generation
+
+    def _store_in_memory(self, cache_key: str, value: Any, ttl: float) -> None:
+        """Store value in memory cache if there is room (max 5 minutes)."""
+        if len(self._memory_cache) < self._max_memory_items:
+            self._memory_cache[cache_key] = {
+                "value": value,
+                "expires_at": datetime.now() + timedelta(seconds=min(ttl, 300)),
+            }
+
+    def _disk_ttl(self, ttl: int) -> int:
+        """TTL of a disk entry, bounded so other nodes' changes show up."""
+        return min(ttl, self.settings.cache.disk_max_ttl)
+
+    async def _get_from_disk(self, cache_key: str) -> Any | None:
+        """Read from the disk tier, promoting hits into memory."""
+        if self._disk_cache is None:
+            return None
+
+        disk_entry = await asyncio.to_thread(self._disk_cache.get, cache_key)
+        if disk_entry is None:
+            return None
+
+        payload, remaining_ttl = disk_entry
+        try:
+            value = json.loads(payload.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            await asyncio.to_thread(self._disk_cache.delete, cache_key)
+            return None
+
+        self._store_in_memory(cache_key, value, remaining_ttl)
+        self._record_hit(value)
+        self._stats.disk_hits += 1
+        self.logger.debug("Cache hit (disk)", key=cache_key)
+        return value
+
+    def _record_hit(self, value: Any) -> None:
+        """Count a cache hit; hits on negative entries are counted apart."""
+        if value == NEGATIVE_CACHE_MARKER:
+            self._stats.negative_hits += 1
+        else:
+            self._stats.hits += 1
+
     def _is_expired(self, cache_entry: dict[str, Any]) -> bool:
         """Check if cache entry is expired."""
         if "expires_at" not in cache_entry:
@@ -55,7 +176,8 @@ class CacheManager:
         return bool(datetime.now() > cache_entry["expires_at"])
 
     async def get(self, key: str, namespace: str = "default") -> Any | None:
-        """Get value from cache (memory first, then Redis)."""
+        """Get value from cache (memory first, then local disk, then Redis)."""
+        await self.sync_generations()
         cache_key = self._generate_key(namespace, key)
 
         try:
@@ -63,13 +185,18 @@ class CacheManager:
             if cache_key in self._memory_cache:
                 entry = self._memory_cache[cache_key]
                 if not self._is_expired(entry):
-                    self._stats.hits += 1
+                    self._record_hit(entry["value"])
                     self.logger.debug("Cache hit (memory)", key=cache_key)
                     return entry["value"]
                 else:
                     # Remove expired entry
                     del self._memory_cache[cache_key]
 
+            # Try local disk cache
+            value = await self._get_from_disk(cache_key)
+            if value is not None:
+                return value
+
             # Try Redis cache
             redis_client = await self.get_redis_client()
             cached_data = await redis_client.get(cache_key)
@@ -80,14 +207,18 @@ class CacheManager:
                     value = json.loads(cached_data.decode("utf-8"))
 
                     # Store in memory cache for faster access
-                    if len(self._memory_cache) < self._max_memory_items:
-                        self._memory_cache[cache_key] = {
-                            "value": value,
-                            "expires_at": datetime.now()
-                            + timedelta(seconds=300),  # 5 min in memory
-                        }
-
-                    self._stats.hits += 1
+                    self._store_in_memory(cache_key, value, 300)
+
+                    # Keep a local copy so restarts do not go back to Redis
+                    if self._disk_cache is not None:
+                        await asyncio.to_thread(
+                            self._disk_cache.set,
+                            cache_key,
+                            cached_data,
+                            self.settings.cache.disk_max_ttl,
+                        )
+
+                    self._record_hit(value)
                     self.logger.debug("Cache hit (Redis)", key=cache_key)
                     return value
 
@@ -124,6 +255,7 @@ class CacheManager:
         namespace: str = "default",
     ) -> bool:
         """Set value in cache (both memory and Redis)."""
+        await self.sync_generations()
         cache_key = self._generate_key(namespace, key)
         ttl = ttl or self._default_ttl
 
@@ -131,6 +263,15 @@ class CacheManager:
             # Serialize the value
             serialized_value = json.dumps(value, default=str)
 
+            # Keep a local copy for restarts
+            if self._disk_cache is not None:
+                await asyncio.to_thread(
+                    self._disk_cache.set,
+                    cache_key,
+                    serialized_value.encode("utf-8"),
+                    self._disk_ttl(ttl),
+                )
+
             # Store in Redis
             redis_client = await self.get_redis_client()
             await redis_client.setex(cache_key, ttl, serialized_value)
@@ -160,13 +301,94 @@ class CacheManager:
             self.logger.error("Cache data encode error", key=cache_key, error=str(e))
             return False
 
+    async def set_many(
+        self,
+        items: dict[str, Any],
+        ttl: int | None = None,
+        namespace: str = "default",
+    ) -> int:
+        """Set several values in one pipelined Redis round-trip."""
+        if not items:
+            return 0
+
+        await self.sync_generations()
+
+        ttl = ttl or self._default_ttl
+
+        try:
+            serialized = {
+                self._generate_key(namespace, key): json.dumps(value, default=str)
+                for key, value in items.items()
+            }
+
+            if self._disk_cache is not None:
+                await asyncio.to_thread(
+                    self._disk_cache.set_many,
+                    {k: v.encode("utf-8") for k, v in serialized.items()},
+                    self._disk_ttl(ttl),
+                )
+
+            redis_client = await self.get_redis_client()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for cache_key, payload in serialized.items():
+                    pipe.setex(cache_key, ttl, payload)
+                await pipe.execute()
+
+            memory_ttl = min(ttl, 300)  # Max 5 minutes in memory
+            expires_at = datetime.now() + timedelta(seconds=memory_ttl)
+            for key, value in items.items():
+                if len(self._memory_cache) >= self._max_memory_items:
+                    break
+                self._memory_cache[self._generate_key(namespace, key)] = {
+                    "value": value,
+                    "expires_at": expires_at,
+                }
+
+            self._stats.sets += len(serialized)
+            self.logger.debug(
+                "Cache bulk set", namespace=namespace, count=len(serialized), ttl=ttl
+            )
+            return len(serialized)
+
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            self._stats.errors += 1
+            self.logger.error(
+                "Redis connection error", namespace=namespace, error=str(e)
+            )
+            return 0
+        except redis.RedisError as e:
+            self._stats.errors += 1
+            self.logger.error(
+                "Redis operation error", namespace=namespace, error=str(e)
+            )
+            return 0
+        except (TypeError, ValueError) as e:
+            self._stats.errors += 1
+            self.logger.error(
+                "Cache data encode error", namespace=namespace, error=str(e)
+            )
+            return 0
+
+    async def set_missing(
+        self, key: str, namespace: str = "default", ttl: int | None = None
+    ) -> bool:
+        """Record that a lookup found nothing (negative cache entry)."""
+        ttl = ttl or self.settings.cache.negative_ttl
+        stored = await self.set(key, NEGATIVE_CACHE_MARKER, ttl, namespace)
+        if stored:
+            self._stats.negative_sets += 1
+        return stored
+
     async def delete(self, key: str, namespace: str = "default") -> bool:
         """Delete value from cache."""
+        await self.sync_generations()
         cache_key = self._generate_key(namespace, key)
 
         try:
             # Remove from memory cache
             self._memory_cache.pop(cache_key, None)
+            if self._disk_cache is not None:
+                await asyncio.to_thread(self._disk_cache.delete, cache_key)
 
             # Remove from Redis
             redis_client = await self.get_redis_client()
@@ -185,8 +407,46 @@ class CacheManager:
             self.logger.error("Redis operation error", key=cache_key, error=str(e))
             return False
 
+    async def delete_many(self, keys: list[str], namespace: str = "default") -> int:
+        """Delete several values in one Redis round-trip."""
+        if not keys:
+            return 0
+
+        await self.sync_generations()
+
+        cache_keys = [self._generate_key(namespace, key) for key in keys]
+
+        try:
+            for cache_key in cache_keys:
+                self._memory_cache.pop(cache_key, None)
+            if self._disk_cache is not None:
+                await asyncio.to_thread(self._disk_cache.delete_many, cache_keys)
+
+            redis_client = await self.get_redis_client()
+            result = await redis_client.delete(*cache_keys)
+
+            self._stats.deletes += len(cache_keys)
+            self.logger.debug(
+                "Cache bulk delete", namespace=namespace, count=len(cache_keys)
+            )
+            return int(result)
+
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            self._stats.errors += 1
+            self.logger.error(
+                "Redis connection error", namespace=namespace, error=str(e)
+            )
+            return 0
+        except redis.RedisError as e:
+            self._stats.errors += 1
+            self.logger.error(
+                "Redis operation error", namespace=namespace, error=str(e)
+            )
+            return 0
+
     async def exists(self, key: str, namespace: str = "default") -> bool:
         """Check if key exists in cache."""
+        await self.sync_generations()
         cache_key = self._generate_key(namespace, key)
 
         # Check memory cache first
@@ -197,6 +457,12 @@ class CacheManager:
             else:
                 del self._memory_cache[cache_key]
 
+        # Check local disk
+        if self._disk_cache is not None:
+            disk_entry = await asyncio.to_thread(self._disk_cache.get, cache_key)
+            if disk_entry is not None:
+                return True
+
         # Check Redis
         try:
             redis_client = await self.get_redis_client()
@@ -209,6 +475,12 @@ class CacheManager:
     async def clear_namespace(self, namespace: str) -> int:
         """Clear all keys in a namespace."""
         try:
+            if self._disk_cache is not None:
+                await asyncio.to_thread(
+                    self._disk_cache.delete_prefix,
+                    f"{self.settings.app_name}:{namespace}:",
+                )
+
             pattern = f"{self.settings.app_name}:{namespace}:*"
             redis_client = await self.get_redis_client()
             keys = await redis_client.keys(pattern)
@@ -308,9 +580,15 @@ class CacheManager:
                     "hits": self._stats.hits,
                     "misses": self._stats.misses,
                     "hit_rate": self._stats.hit_rate,
+                    "negative_hits": self._stats.negative_hits,
+                    "negative_hit_rate": self._stats.negative_hit_rate,
                 },
                 "memory_cache_size": len(self._memory_cache),
             }
+            if self._disk_cache is not None:
+                health_status["disk_cache"] = await asyncio.to_thread(
+                    self._disk_cache.stats
+                )
 
             self.logger.debug("Cache health check passed", **health_status)
             return health_status
@@ -330,6 +608,7 @@ class CacheManager:
 
     async def get_ttl(self, key: str, namespace: str = "default") -> int:
         """Get TTL for a cache key."""
+        await self.sync_generations()
         try:
             cache_key = self._generate_key(namespace, key)
             redis_client = await self.get_redis_client()
@@ -339,6 +618,28 @@ class CacheManager:
             self.logger.error("Failed to get TTL", key=key, error=str(e))
             return -1
 
+    async def load_memory_from_disk(self) -> int:
+        """Pre-fill the memory cache from the local disk tier."""
+        if self._disk_cache is None:
+            return 0
+
+        entries = await asyncio.to_thread(
+            self._disk_cache.recent_entries,
+            self._max_memory_items - len(self._memory_cache),
+        )
+        loaded = 0
+        for cache_key, payload, remaining_ttl in entries:
+            try:
+                value = json.loads(payload.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                await asyncio.to_thread(self._disk_cache.delete, cache_key)
+                continue
+            self._store_in_memory(cache_key, value, remaining_ttl)
+            loaded += 1
+
+        self.logger.info("Memory cache loaded from disk", entries=loaded)
+        return loaded
+
     def clear_memory_cache(self) -> None:
         """Clear all items from memory cache."""
         self._memory_cache.clear()
@@ -349,7 +650,10 @@ class CacheManager:
         return self._stats
 
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connection and local disk cache."""
         if self._redis_client:
             await self._redis_client.close()
             self._redis_client = None
+        if self._disk_cache is not None:
+            await asyncio.to_thread(self._disk_cache.close)
+            self._disk_cache = None
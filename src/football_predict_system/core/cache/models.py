@@ -11,9 +11,38 @@ class CacheStats(BaseModel):
     sets: int = 0
     deletes: int = 0
     errors: int = 0
+    disk_hits: int = 0
+    negative_hits: int = 0
+    negative_sets: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total lookups, including those answered by a negative entry."""
+        return self.hits + self.negative_hits + self.misses
 
     @property
     def hit_rate(self) -> float:
-        """Calculate cache hit rate."""
-        total = self.hits + self.misses
-        return self.hits / total if total > 0 else 0.0
+        """Calculate cache hit rate; negative hits do not count as hits."""
+        return self.hits / self.lookups if self.lookups > 0 else 0.0
+
+    @property
+    def negative_hit_rate(self) -> float:
+        """Share of lookups answered by a negative entry."""
+        return self.negative_hits / self.lookups if self.lookups > 0 else 0.0
+
+
+class WarmingReport(BaseModel):
+    """Outcome of a cache warming run."""
+
+    namespace: str
+    keys_warmed: int = 0
+    keys_failed: int = 0
+    batches: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def keys_per_second(self) -> float:
+        """Calculate warming throughput."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.keys_warmed / self.duration_seconds
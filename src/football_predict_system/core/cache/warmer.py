@@ -2,15 +2,25 @@
 Cache warming strategies.
 
 Handles cache warming to improve performance by pre-loading frequently accessed data.
+
+Warming runs in three steps: entities are read from the data layer, turned
+into cache payloads batch by batch (predictions are scored in one vectorized
+pass per batch), and each batch is written with a single pipelined bulk set.
+Batches are processed concurrently up to ``max_concurrency``.
 """
 
 import asyncio
-from typing import TYPE_CHECKING
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .manager import CacheManager
 
 from ..logging import get_logger
+from .models import WarmingReport
 
 logger = get_logger(__name__)
 
@@ -18,97 +28,99 @@ logger = get_logger(__name__)
 class CacheWarmer:
     """Handles cache warming strategies."""
 
-    def __init__(self, cache_manager: "CacheManager") -> None:
+    def __init__(
+        self,
+        cache_manager: "CacheManager",
+        batch_size: int = 200,
+        max_concurrency: int = 4,
+        data_service: Any | None = None,
+        prediction_service: Any | None = None,
+    ) -> None:
         self.cache_manager = cache_manager
         self.logger = get_logger(__name__)
-
-    async def warm_predictions(self, match_ids: list[str]) -> None:
-        """Pre-warm prediction cache for upcoming matches."""
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self._data_service = data_service
+        self._prediction_service = prediction_service
+
+    @property
+    def data_service(self) -> Any:
+        """Data service used to read entities to warm."""
+        if self._data_service is None:
+            # Import here to avoid circular imports
+            from football_predict_system.domain.services import DataService
+
+            self._data_service = DataService()
+        return self._data_service
+
+    @property
+    def prediction_service(self) -> Any:
+        """Prediction service used to score matches."""
+        if self._prediction_service is None:
+            # Import here to avoid circular imports
+            from football_predict_system.domain.services import (
+                get_prediction_service,
+            )
+
+            self._prediction_service = get_prediction_service()
+        return self._prediction_service
+
+    async def warm_upcoming(
+        self, lookahead_hours: int = 24, limit: int = 500
+    ) -> list[WarmingReport]:
+        """Warm predictions, teams and league data for upcoming fixtures."""
+        matches = await self._load_upcoming_matches(lookahead_hours, limit)
         self.logger.info(
-            "Starting prediction cache warming", match_count=len(match_ids)
+            "Starting upcoming fixtures cache warming",
+            match_count=len(matches),
+            lookahead_hours=lookahead_hours,
         )
 
-        # This would integrate with your prediction service
-        # For now, it's a placeholder for the concept
-        for match_id in match_ids:
-            try:
-                # Simulate prediction generation and caching
-                cache_key = f"prediction:{match_id}"
-
-                # Check if already cached
-                if not await self.cache_manager.exists(cache_key, "predictions"):
-                    # Generate prediction (placeholder)
-                    prediction_data = {
-                        "match_id": match_id,
-                        "prediction": "placeholder",
-                    }
-                    await self.cache_manager.set(
-                        cache_key, prediction_data, 7200, "predictions"
-                    )
-
-                    # Add small delay to avoid overwhelming the system
-                    await asyncio.sleep(0.1)
-
-            except Exception as e:
-                self.logger.error(
-                    "Prediction warming error", match_id=match_id, error=str(e)
-                )
+        team_ids = sorted(
+            {str(m.home_team_id) for m in matches}
+            | {str(m.away_team_id) for m in matches}
+        )
 
-    async def warm_team_stats(self, team_ids: list[str]) -> None:
-        """Pre-warm team statistics cache."""
+        return [
+            await self._warm_prediction_batches(matches),
+            await self.warm_team_stats(team_ids),
+            await self._warm_league_batches(matches),
+        ]
+
+    async def warm_predictions(
+        self, match_ids: list[str] | None = None, model_version: str | None = None
+    ) -> WarmingReport:
+        """Pre-warm prediction cache for the given or upcoming matches."""
+        if match_ids is None:
+            matches = await self._load_upcoming_matches()
+        else:
+            matches = await self.data_service.load_matches(match_ids)
+
+        self.logger.info("Starting prediction cache warming", match_count=len(matches))
+        return await self._warm_prediction_batches(matches, model_version)
+
+    async def warm_team_stats(self, team_ids: list[str]) -> WarmingReport:
+        """Pre-warm team cache entries read by the data service."""
         self.logger.info("Starting team stats cache warming", team_count=len(team_ids))
 
-        for team_id in team_ids:
-            try:
-                cache_key = f"team_stats:{team_id}"
-
-                if not await self.cache_manager.exists(cache_key, "team_data"):
-                    # Generate team stats (placeholder)
-                    team_stats = {
-                        "team_id": team_id,
-                        "matches_played": 0,
-                        "wins": 0,
-                        "draws": 0,
-                        "losses": 0,
-                    }
-                    await self.cache_manager.set(
-                        cache_key, team_stats, 3600, "team_data"
-                    )
-
-                    await asyncio.sleep(0.05)  # Small delay
-
-            except Exception as e:
-                self.logger.error(
-                    "Team stats warming error", team_id=team_id, error=str(e)
-                )
-
-    async def warm_league_data(self, league_ids: list[str]) -> None:
-        """Pre-warm league data cache."""
-        self.logger.info(
-            "Starting league data cache warming", league_count=len(league_ids)
-        )
+        teams = await self.data_service.load_teams(team_ids)
 
-        for league_id in league_ids:
-            try:
-                cache_key = f"league_data:{league_id}"
+        def build(batch: Sequence[Any]) -> dict[str, Any]:
+            return {f"team:{team.id}": team.model_dump(mode="json") for team in batch}
 
-                if not await self.cache_manager.exists(cache_key, "league_data"):
-                    # Generate league data (placeholder)
-                    league_data = {
-                        "league_id": league_id,
-                        "teams": [],
-                        "current_season": "2024-25",
-                    }
-                    await self.cache_manager.set(
-                        cache_key, league_data, 7200, "league_data"
-                    )
+        return await self._warm_in_batches("teams", teams, build, ttl=3600)
 
-                    await asyncio.sleep(0.05)
+    async def warm_league_data(
+        self, league_ids: list[str] | None = None
+    ) -> WarmingReport:
+        """Pre-warm league fixture lists built from upcoming matches."""
+        matches = await self._load_upcoming_matches()
+        if league_ids is not None:
+            wanted = set(league_ids)
+            matches = [m for m in matches if m.competition in wanted]
 
-            except Exception as e:
-                self.logger.error(
-                    "League data warming error", league_id=league_id, error=str(e)
-                )
+        self.logger.info("Starting league data cache warming")
+        return await self._warm_league_batches(matches)
 
     async def warm_model_metadata(self) -> None:
         """Pre-warm model metadata cache."""
@@ -128,3 +140,116 @@ class CacheWarmer:
 
         except Exception as e:
             self.logger.error("Model metadata warming error", error=str(e))
+
+    async def _load_upcoming_matches(
+        self, lookahead_hours: int | None = None, limit: int = 500
+    ) -> list[Any]:
+        """Read upcoming matches, optionally limited to a kickoff window."""
+        matches = await self.data_service.get_upcoming_matches(limit)
+        if lookahead_hours is None:
+            return list(matches)
+
+        horizon = datetime.utcnow() + timedelta(hours=lookahead_hours)
+        return [m for m in matches if (m.kickoff_time or m.scheduled_date) <= horizon]
+
+    async def _warm_prediction_batches(
+        self, matches: list[Any], model_version: str | None = None
+    ) -> WarmingReport:
+        """Score matches batch by batch and bulk-write the predictions."""
+        from football_predict_system.domain.services import get_model_service
+
+        model = await get_model_service().get_model(model_version or "default")
+        if model is None:
+            self.logger.warning(
+                "Prediction warming skipped - model not available",
+                model_version=model_version,
+            )
+            return WarmingReport(namespace="predictions")
+
+        service = self.prediction_service
+
+        def build(batch: Sequence[Any]) -> dict[str, Any]:
+            predictions = service.score_matches(list(batch), model)
+            return {
+                service.cache_key(p.match_id, model_version): service.cache_payload(p)
+                for p in predictions
+            }
+
+        return await self._warm_in_batches(
+            "predictions", matches, build, ttl=service.CACHE_TTL
+        )
+
+    async def _warm_league_batches(self, matches: list[Any]) -> WarmingReport:
+        """Group fixtures by league and bulk-write one entry per league."""
+        fixtures: dict[str, list[Any]] = defaultdict(list)
+        for match in matches:
+            fixtures[match.competition].append(match)
+
+        def build(batch: Sequence[Any]) -> dict[str, Any]:
+            return {
+                f"league_data:{league_id}": {
+                    "league_id": league_id,
+                    "fixtures": [m.model_dump(mode="json") for m in league_matches],
+                    "team_ids": sorted(
+                        {str(m.home_team_id) for m in league_matches}
+                        | {str(m.away_team_id) for m in league_matches}
+                    ),
+                }
+                for league_id, league_matches in batch
+            }
+
+        return await self._warm_in_batches(
+            "league_data", list(fixtures.items()), build, ttl=7200
+        )
+
+    async def _warm_in_batches(
+        self,
+        namespace: str,
+        entities: Sequence[Any],
+        build: Callable[[Sequence[Any]], dict[str, Any]],
+        ttl: int,
+    ) -> WarmingReport:
+        """Build and bulk-write cache entries with bounded concurrency."""
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [
+            entities[i : i + self.batch_size]
+            for i in range(0, len(entities), self.batch_size)
+        ]
+
+        async def warm_batch(batch: Sequence[Any]) -> tuple[int, int]:
+            async with semaphore:
+                items = build(batch)
+                written = await self.cache_manager.set_many(items, ttl, namespace)
+                return len(items), written
+
+        results = await asyncio.gather(
+            *(warm_batch(batch) for batch in batches), return_exceptions=True
+        )
+
+        report = WarmingReport(namespace=namespace, batches=len(batches))
+        for batch, result in zip(batches, results, strict=True):
+            if isinstance(result, BaseException):
+                report.keys_failed += len(batch)
+                self.logger.error(
+                    "Cache warming batch failed",
+                    namespace=namespace,
+                    batch_size=len(batch),
+                    error=str(result),
+                )
+            else:
+                attempted, written = result
+                report.keys_warmed += written
+                report.keys_failed += attempted - written
+
+        report.duration_seconds = time.perf_counter() - start_time
+        self.logger.info(
+            "Cache warming completed",
+            namespace=namespace,
+            keys_warmed=report.keys_warmed,
+            keys_failed=report.keys_failed,
+            batches=report.batches,
+            duration_seconds=round(report.duration_seconds, 4),
+            keys_per_second=round(report.keys_per_second, 1),
+        )
+        return report
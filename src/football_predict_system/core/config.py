@@ -25,6 +25,35 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
+class SQLiteConfig(BaseModel):
+    """Tuning for file-backed SQLite databases on single-node installs."""
+
+    # WAL journal with a pool of read-only connections and one writer
+    # connection that takes the write lock when its transaction begins
+    enabled: bool = True
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    # Page cache per connection (KiB) and memory-mapped I/O size (bytes)
+    cache_size_kib: int = 65536
+    mmap_size: int = 268435456
+    reader_pool_size: int = 4
+
+    @field_validator("synchronous")
+    def validate_synchronous(cls, v: str) -> str:
+        """Validate the synchronous pragma level."""
+        v = v.upper()
+        if v not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError("SQLite synchronous must be OFF, NORMAL, FULL or EXTRA")
+        return v
+
+    @field_validator("reader_pool_size")
+    def validate_reader_pool_size(cls, v: int) -> int:
+        """Validate the reader pool size."""
+        if v <= 0:
+            raise ValueError("SQLite reader pool size must be positive")
+        return v
+
+
 class DatabaseConfig(BaseModel):
     """Database configuration settings."""
 
@@ -35,6 +64,18 @@ class DatabaseConfig(BaseModel):
     pool_recycle: int = 3600
     echo: bool = False
 
+    # Per-statement query statistics, bounded to this many fingerprints
+    query_stats_enabled: bool = True
+    query_stats_max_statements: int = 500
+
+    # Read replicas for read-only sessions; replicas lagging more than
+    # replica_max_lag_seconds are skipped. Checked every replica_check_interval
+    replica_urls: list[str] = []
+    replica_max_lag_seconds: float = 30.0
+    replica_check_interval: float = 10.0
+
+    sqlite: SQLiteConfig = SQLiteConfig()
+
     @field_validator("url")
     def validate_database_url(cls, v: str) -> str:
         """Validate database URL format."""
@@ -44,6 +85,16 @@ class DatabaseConfig(BaseModel):
             )
         return v
 
+    @field_validator("replica_urls")
+    def validate_replica_urls(cls, v: list[str]) -> list[str]:
+        """Validate replica URLs like the primary URL."""
+        for url in v:
+            if not url.startswith(("postgresql://", "sqlite://", "mysql://")):
+                raise ValueError(
+                    "Replica URLs must start with postgresql://, sqlite://, or mysql://"
+                )
+        return v
+
 
 class RedisConfig(BaseModel):
     """Redis configuration settings."""
@@ -61,6 +112,55 @@ class RedisConfig(BaseModel):
         return v
 
 
+class CacheConfig(BaseModel):
+    """Cache tier configuration settings."""
+
+    # Shared tier: "redis" or the in-process "memory" backend
+    backend: str = "redis"
+
+    # Local disk tier (L3), persisted across restarts
+    disk_enabled: bool = False
+    disk_path: str = "data/cache/cache.sqlite3"
+    disk_max_bytes: int = 512 * 1024 * 1024
+    # Entries are read before Redis, so they may miss changes made by other
+    # nodes; keep that window as short as the memory tier's
+    disk_max_ttl: int = 300
+
+    # Not-found lookups are remembered briefly to shield the database
+    negative_ttl: int = 60
+
+    # How often each worker re-reads namespace generations from Redis
+    generation_sync_interval: float = 5.0
+
+    @field_validator("backend")
+    def validate_backend(cls, v: str) -> str:
+        """Validate cache backend name."""
+        if v not in ("redis", "memory"):
+            raise ValueError("Cache backend must be 'redis' or 'memory'")
+        return v
+
+    @field_validator("disk_max_bytes")
+    def validate_disk_max_bytes(cls, v: int) -> int:
+        """Validate disk cache size bound."""
+        if v <= 0:
+            raise ValueError("Disk cache size must be positive")
+        return v
+
+    @field_validator("disk_max_ttl")
+    def validate_disk_max_ttl(cls, v: int) -> int:
+        """Validate disk cache TTL bound."""
+        if v <= 0:
+            raise ValueError("Disk cache TTL bound must be positive")
+        return v
+
+    @field_validator("negative_ttl")
+    def validate_negative_ttl(cls, v: int) -> int:
+        """Validate negative cache TTL."""
+        if v <= 0:
+            raise ValueError("Negative cache TTL must be positive")
+        return v
+
+
 class APIConfig(BaseModel):
     """API server configuration settings."""
 
@@ -80,6 +180,13 @@ class APIConfig(BaseModel):
     )
     access_token_expire_minutes: int = 30
 
+    # bcrypt runs on its own threads; logins beyond the queue are rejected
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 32
+
+    # API keys are reloaded on change notifications, and at least this often
+    api_key_refresh_interval: float = 300.0
+
     # CORS
     cors_origins: list[str] = ["*"]
     cors_credentials: bool = True
@@ -101,6 +208,50 @@ class APIConfig(BaseModel):
         return v
 
 
+class RateLimitConfig(BaseModel):
+    """API rate limiting configuration settings."""
+
+    enabled: bool = True
+    key_prefix: str = "ratelimit"
+
+    # Default budget per client and window, shared by all workers via Redis
+    requests: int = 100
+    window_seconds: int = 60
+
+    # Path prefix -> requests per window, overriding the default budget
+    route_limits: dict[str, int] = {}
+    # Role -> multiplier applied to the route budget
+    role_multipliers: dict[str, float] = {
+        "guest": 1.0,
+        "user": 2.0,
+        "api_client": 5.0,
+        "admin": 10.0,
+    }
+    exempt_paths: list[str] = ["/health", "/metrics", "/docs", "/redoc", "/openapi"]
+
+    # Share of the remaining budget a worker may serve without asking Redis,
+    # and for how long such a local lease is trusted
+    local_fraction: float = 0.1
+    local_ttl: float = 1.0
+
+    # After a Redis failure, use the in-process limiter for this long
+    redis_retry_seconds: float = 5.0
+
+    @field_validator("requests", "window_seconds")
+    def validate_positive(cls, v: int) -> int:
+        """Validate budgets and windows."""
+        if v <= 0:
+            raise ValueError("Rate limit requests and window must be positive")
+        return v
+
+    @field_validator("local_fraction")
+    def validate_local_fraction(cls, v: float) -> float:
+        """Validate the local lease share."""
+        if not 0.0 <= v < 1.0:
+            raise ValueError("Local fraction must be between 0 and 1")
+        return v
+
+
 class LoggingConfig(BaseModel):
     """Logging configuration settings."""
 
@@ -110,6 +261,22 @@ class LoggingConfig(BaseModel):
     max_file_size: str = "10MB"
     backup_count: int = 5
 
+    # Records are rendered and written by a background thread
+    async_enabled: bool = True
+    queue_size: int = 10_000
+    queue_full_policy: str = "drop"  # drop | block
+    batch_size: int = 256
+
+    # Request logging: fraction of requests logged per path prefix. Errors
+    # and slow requests are always logged.
+    request_sample_rate: float = 1.0
+    request_sample_routes: dict[str, float] = {
+        "/health": 0.01,
+        "/livez": 0.01,
+        "/metrics": 0.01,
+    }
+    slow_request_seconds: float = 1.0
+
     # 服务信息
     service_name: str = "football-predict-system"
     service_version: str = "3.0.0"
@@ -122,6 +289,13 @@ class LoggingConfig(BaseModel):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v.upper()
 
+    @field_validator("queue_full_policy")
+    def validate_queue_full_policy(cls, v: str) -> str:
+        """Validate the policy for a full log queue."""
+        if v.lower() not in ("drop", "block"):
+            raise ValueError("Queue full policy must be 'drop' or 'block'")
+        return v.lower()
+
 
 class MonitoringConfig(BaseModel):
     """Monitoring and observability configuration."""
@@ -129,8 +303,17 @@ class MonitoringConfig(BaseModel):
     enable_metrics: bool = True
     metrics_port: int = 9090
 
-    # Health checks
+    # Health checks: probes run on this schedule (seconds), each bounded by
+    # the timeout; snapshots older than health_stale_after are marked stale
     health_check_interval: int = 30
+    health_check_timeout: float = 5.0
+    health_stale_after: float = 90.0
+
+    # System resources are sampled in the background at this interval (seconds)
+    resource_sample_interval: float = 5.0
+
+    # Operation latency summaries are logged at this interval (seconds)
+    operation_metrics_flush_interval: float = 60.0
 
     # Tracing
     enable_tracing: bool = False
@@ -177,7 +360,9 @@ class Settings(BaseSettings):
     # Direct environment variable support
     database_url: str = Field(default="sqlite:///./test.db")
     redis: RedisConfig = Field(default_factory=RedisConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     api: APIConfig = Field(default_factory=APIConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
     ml: MLConfig = Field(default_factory=MLConfig)
@@ -193,6 +378,11 @@ class Settings(BaseSettings):
         default=30, description="JWT expiration time in minutes"
     )
 
+    # Football-Data.org; several comma separated keys are pooled
+    football_data_api_key: str = Field(
+        default="", description="Football-Data.org API key(s)"
+    )
+
     # Redis URL (for backward compatibility)
     redis_url: str = Field(default="", description="Redis connection URL")
     redis_password: str = Field(default="", description="Redis password")
@@ -5,32 +5,104 @@ This module provides:
 - Connection pooling with automatic retry
 - Health checks and monitoring
 - Transaction management
-- Query performance tracking
+- Query performance tracking (per-statement statistics, see ``query_stats``)
+- Read-replica routing for read-only sessions
+- Tuned SQLite profile for single-node deployments
 - Database migration support
+
+Read-only sessions (``get_async_session(read_only=True)``) go to the
+configured replicas in turn. A background check, started with the first
+replica read in whichever process uses them (API, flows, workers), tracks
+each replica's health and replication lag; replicas that are down or lag
+behind ``replica_max_lag_seconds`` are skipped until a later check passes,
+and reads fall back to the primary when none is usable. Reads that must see
+the caller's own recent writes should keep using the primary.
+
+File-backed SQLite databases get a profile (``DATABASE__SQLITE__*``) for
+single-node installs where collector scripts and the API share one file:
+WAL journal, ``synchronous=NORMAL``, larger page cache and mmap, and a busy
+timeout. Ordinary sessions share a pool of connections with deferred
+transactions, so reads run side by side under WAL. Write sessions
+(``get_async_session(write=True)``) go through a single connection that
+begins with ``BEGIN IMMEDIATE``, so writers queue for the lock instead of
+failing when a transaction that has read upgrades to a write; read-only
+sessions use a separate pool of ``query_only`` connections.
 """
 
 import asyncio
+import contextlib
 import time
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import create_engine, event, make_url, text
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from .config import get_settings
+from .config import SQLiteConfig, get_settings
 from .exceptions import handle_database_exception
 from .logging import get_logger
+from .query_stats import get_query_stats
 
 # SQLAlchemy declarative base
 Base = declarative_base()
 
 logger = get_logger(__name__)
 
+# Seconds the replica is behind the primary; zero while it has replayed
+# everything it received, so an idle primary does not look like lag
+REPLICA_LAG_QUERIES = {
+    "postgresql": text(
+        "SELECT CASE WHEN NOT pg_is_in_recovery() "
+        "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+    ),
+}
+
+
+class Replica:
+    """A read-only replica and its last known health.
+
+    Replicas are assumed usable until the first check says otherwise.
+    """
+
+    def __init__(
+        self, url: str, engine: AsyncEngine, session_factory: sessionmaker
+    ) -> None:
+        self.url = url
+        self.engine = engine
+        self.session_factory = session_factory
+        self.healthy = True
+        self.lag_seconds: float | None = None
+        self.checked_at: datetime | None = None
+        self.error: str | None = None
+
+    def usable(self, max_lag_seconds: float) -> bool:
+        """Whether reads may be routed here."""
+        return self.healthy and (
+            self.lag_seconds is None or self.lag_seconds <= max_lag_seconds
+        )
+
+    def mark_unhealthy(self, error: str) -> None:
+        """Stop routing reads here until the next successful check."""
+        self.healthy = False
+        self.error = error
+
+    def status(self) -> dict[str, Any]:
+        """Health details with the password masked."""
+        return {
+            "url": make_url(self.url).render_as_string(hide_password=True),
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "error": self.error,
+        }
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
@@ -42,8 +114,15 @@ class DatabaseManager:
         self._async_engine: AsyncEngine | None = None
         self._session_factory: sessionmaker | None = None
         self._async_session_factory: sessionmaker | None = None
+        self._async_read_engine: AsyncEngine | None = None
+        self._async_read_session_factory: sessionmaker | None = None
+        self._async_write_engine: AsyncEngine | None = None
+        self._async_write_session_factory: sessionmaker | None = None
         self._connection_pool = None
         self._health_check_query = text("SELECT 1")
+        self._replicas: list[Replica] | None = None
+        self._next_replica = 0
+        self._replica_task: asyncio.Task[None] | None = None
 
     def get_engine(self) -> Engine:
         """Get or create synchronous database engine."""
@@ -66,7 +145,16 @@ class DatabaseManager:
 
         # Configure engine based on database type
         if "sqlite" in database_url:
-            # SQLite doesn't support connection pooling
+            profile = self._sqlite_profile(database_url)
+            pool_args = (
+                {
+                    "poolclass": QueuePool,
+                    "pool_size": profile.reader_pool_size,
+                    "max_overflow": 0,
+                }
+                if profile
+                else {}
+            )
             engine = create_engine(
                 database_url,
                 echo=db_config.echo,
@@ -74,7 +162,10 @@ class DatabaseManager:
                 connect_args={
                     "check_same_thread": False,
                 },
+                **pool_args,
             )
+            if profile:
+                self._setup_sqlite_profile(engine, profile)
         else:
             # PostgreSQL and other databases support connection pooling
             engine = create_engine(
@@ -99,22 +190,44 @@ class DatabaseManager:
         )
         return engine
 
-    def _create_async_engine(self) -> AsyncEngine:
-        """Create asynchronous database engine."""
+    def _create_async_engine(
+        self,
+        database_url: str | None = None,
+        read_only: bool = False,
+        write: bool = False,
+    ) -> AsyncEngine:
+        """Create asynchronous database engine (the primary unless a URL is given)."""
         db_config = self.settings.database
 
         # Get the correct database URL
-        database_url = self.settings.get_database_url()
+        database_url = database_url or self.settings.get_database_url()
 
         # Configure async engine based on database type
         if "sqlite" in database_url:
-            # SQLite async configuration
+            # SQLite async configuration; tuned file databases pool their
+            # connections (aiosqlite opens one per session otherwise)
             async_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
+            profile = self._sqlite_profile(database_url)
+            pool_args = (
+                {
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": 1 if write else profile.reader_pool_size,
+                    "max_overflow": 0,
+                    "pool_timeout": db_config.pool_timeout,
+                }
+                if profile
+                else {}
+            )
             engine = create_async_engine(
                 async_url,
                 echo=db_config.echo,
                 future=True,
+                **pool_args,
             )
+            if profile:
+                self._setup_sqlite_profile(
+                    engine.sync_engine, profile, read_only=read_only, write=write
+                )
         else:
             # PostgreSQL async configuration
             async_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
@@ -128,23 +241,70 @@ class DatabaseManager:
                 future=True,
             )
 
+        # Async engines run on a sync engine underneath; listen there
+        self._setup_engine_events(engine.sync_engine)
+
         logger.info("Async database engine created", url=async_url)
         return engine
 
+    def _sqlite_profile(self, database_url: str) -> SQLiteConfig | None:
+        """SQLite tuning for a file database, or None when it does not apply."""
+        profile = self.settings.database.sqlite
+        database = make_url(database_url).database
+        if not profile.enabled or database in (None, "", ":memory:"):
+            return None
+        return profile
+
+    def _setup_sqlite_profile(
+        self,
+        engine: Engine,
+        profile: SQLiteConfig,
+        read_only: bool = False,
+        write: bool = False,
+    ) -> None:
+        """Apply pragmas to new connections and take over transaction begin."""
+
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection, _connection_record):
+            # Stop the driver's implicit BEGIN; "begin" below issues it
+            dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            # Set first so the other pragmas wait for a busy database too
+            cursor.execute(f"PRAGMA busy_timeout={profile.busy_timeout_ms}")
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA synchronous={profile.synchronous}")
+            cursor.execute(f"PRAGMA cache_size=-{profile.cache_size_kib}")
+            cursor.execute(f"PRAGMA mmap_size={profile.mmap_size}")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")
+            cursor.close()
+
+        @event.listens_for(engine, "begin")
+        def begin(conn):
+            # Writers take the lock up front: a deferred transaction that
+            # reads and then writes fails with SQLITE_BUSY instead of waiting
+            conn.exec_driver_sql("BEGIN IMMEDIATE" if write else "BEGIN")
+
     def _setup_engine_events(self, engine: Engine) -> None:
         """Setup database engine event listeners for monitoring."""
+        query_stats = (
+            get_query_stats() if self.settings.database.query_stats_enabled else None
+        )
 
         @event.listens_for(engine, "before_cursor_execute")
         def before_cursor_execute(
             _conn, _cursor, statement, parameters, context, _executemany
         ):
-            context._query_start_time = time.time()
+            context._query_start_ns = time.perf_counter_ns()
 
         @event.listens_for(engine, "after_cursor_execute")
         def after_cursor_execute(
-            _conn, _cursor, statement, parameters, context, _executemany
+            _conn, cursor, statement, parameters, context, _executemany
         ):
-            total = time.time() - context._query_start_time
+            duration_ns = time.perf_counter_ns() - context._query_start_ns
+            if query_stats is not None:
+                query_stats.record(statement, duration_ns, cursor.rowcount)
+            total = duration_ns / 1e9
 
             # Log slow queries
             if total > 1.0:  # Log queries taking more than 1 second
@@ -168,6 +328,15 @@ class DatabaseManager:
 
         @event.listens_for(engine, "handle_error")
         def handle_error(exception_context):
+            start_ns = getattr(
+                exception_context.execution_context, "_query_start_ns", None
+            )
+            if query_stats is not None and start_ns is not None:
+                query_stats.record(
+                    exception_context.statement,
+                    time.perf_counter_ns() - start_ns,
+                    error=True,
+                )
             logger.error(
                 "Database error occurred",
                 error=str(exception_context.original_exception),
@@ -193,6 +362,144 @@ class DatabaseManager:
             )
         return self._async_session_factory
 
+    def get_replicas(self) -> list[Replica]:
+        """Get or create the configured read replicas."""
+        if self._replicas is None:
+            self._replicas = []
+            for url in self.settings.database.replica_urls:
+                engine = self._create_async_engine(url, read_only=True)
+                self._replicas.append(
+                    Replica(
+                        url,
+                        engine,
+                        sessionmaker(
+                            bind=engine, class_=AsyncSession, expire_on_commit=False
+                        ),
+                    )
+                )
+        return self._replicas
+
+    def _choose_replica(self) -> Replica | None:
+        """Next usable replica in turn, or None to read from the primary."""
+        replicas = self.get_replicas()
+        if not replicas:
+            return None
+
+        # Without checks a replica marked unhealthy would never come back
+        self.start_replica_checks()
+        max_lag = self.settings.database.replica_max_lag_seconds
+        for offset in range(len(replicas)):
+            replica = replicas[(self._next_replica + offset) % len(replicas)]
+            if replica.usable(max_lag):
+                self._next_replica = (self._next_replica + offset + 1) % len(replicas)
+                return replica
+        return None
+
+    async def _replica_lag(self, session: AsyncSession) -> float:
+        """Replication lag in seconds; zero for dialects without a lag query."""
+        query = REPLICA_LAG_QUERIES.get(session.bind.dialect.name)
+        if query is None:
+            await session.execute(self._health_check_query)
+            return 0.0
+        return float((await session.execute(query)).scalar() or 0.0)
+
+    async def check_replicas(self) -> list[dict[str, Any]]:
+        """Check every replica's health and lag."""
+        for replica in self.get_replicas():
+            try:
+                async with replica.session_factory() as session:
+                    replica.lag_seconds = await self._replica_lag(session)
+                replica.healthy = True
+                replica.error = None
+            except Exception as e:
+                replica.mark_unhealthy(str(e))
+            replica.checked_at = datetime.utcnow()
+
+            if not replica.usable(self.settings.database.replica_max_lag_seconds):
+                logger.warning("Read replica not usable", **replica.status())
+        return self.replica_status()
+
+    def replica_status(self) -> list[dict[str, Any]]:
+        """Last known health of every replica."""
+        return [replica.status() for replica in self._replicas or []]
+
+    def start_replica_checks(self) -> None:
+        """
+        Check replicas periodically in the background.
+
+        Does nothing outside an event loop or while checks already run in
+        the current one; a task left behind by an earlier loop is replaced.
+        """
+        if not self.get_replicas():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if (
+            self._replica_task is not None
+            and not self._replica_task.done()
+            and self._replica_task.get_loop() is loop
+        ):
+            return
+
+        async def check_periodically() -> None:
+            while True:
+                await self.check_replicas()
+                await asyncio.sleep(self.settings.database.replica_check_interval)
+
+        self._replica_task = asyncio.create_task(check_periodically())
+
+    async def stop_replica_checks(self) -> None:
+        """Stop the background replica checks."""
+        task, self._replica_task = self._replica_task, None
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            return
+
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def get_async_read_session_factory(self) -> sessionmaker:
+        """
+        Get the factory for read-only sessions on the primary database.
+
+        Tuned SQLite databases get a separate pool of read-only connections,
+        so reads do not queue behind the single writer; other databases use
+        the primary session factory.
+        """
+        if self._async_read_session_factory is None:
+            database_url = self.settings.get_database_url()
+            if "sqlite" not in database_url or not self._sqlite_profile(database_url):
+                return self.get_async_session_factory()
+            self._async_read_engine = self._create_async_engine(read_only=True)
+            self._async_read_session_factory = sessionmaker(
+                bind=self._async_read_engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+        return self._async_read_session_factory
+
+    def get_async_write_session_factory(self) -> sessionmaker:
+        """
+        Get the factory for write sessions on the primary database.
+
+        Tuned SQLite databases serialize writes through one connection that
+        takes the write lock when its transaction begins; other databases
+        use the primary session factory.
+        """
+        if self._async_write_session_factory is None:
+            database_url = self.settings.get_database_url()
+            if "sqlite" not in database_url or not self._sqlite_profile(database_url):
+                return self.get_async_session_factory()
+            self._async_write_engine = self._create_async_engine(write=True)
+            self._async_write_session_factory = sessionmaker(
+                bind=self._async_write_engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+        return self._async_write_session_factory
+
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Get database session with automatic cleanup."""
@@ -210,9 +517,26 @@ class DatabaseManager:
             session.close()
 
     @asynccontextmanager
-    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Get async database session with automatic cleanup."""
-        session_factory = self.get_async_session_factory()
+    async def get_async_session(
+        self, read_only: bool = False, write: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get async database session with automatic cleanup.
+
+        With ``read_only=True`` the session reads from a usable replica, or
+        from the primary when there is none. Use ``write=True`` for
+        transactions that read and then write, so they hold the write lock
+        from the start on SQLite.
+        """
+        replica = self._choose_replica() if read_only else None
+        if replica is not None:
+            session_factory = replica.session_factory
+        elif read_only:
+            session_factory = self.get_async_read_session_factory()
+        elif write:
+            session_factory = self.get_async_write_session_factory()
+        else:
+            session_factory = self.get_async_session_factory()
         session = session_factory()
 
         try:
@@ -220,6 +544,12 @@ class DatabaseManager:
             await session.commit()
         except Exception as e:
             await session.rollback()
+            if (
+                replica is not None
+                and isinstance(e, DBAPIError)
+                and e.connection_invalidated
+            ):
+                replica.mark_unhealthy(str(e))
             logger.error("Async database session error", error=str(e))
             raise handle_database_exception(e)
         finally:
@@ -248,6 +578,7 @@ class DatabaseManager:
                 "async_connection": async_result == 1,
                 "response_time": duration,
                 "pool_info": self._get_pool_info(),
+                "replicas": self.replica_status(),
             }
 
             logger.debug("Database health check passed", **health_status)
@@ -294,6 +625,21 @@ class DatabaseManager:
             self._async_engine = None
             logger.info("Asynchronous database engine disposed")
 
+        if self._async_read_engine:
+            await self._async_read_engine.dispose()
+            self._async_read_engine = None
+            self._async_read_session_factory = None
+
+        if self._async_write_engine:
+            await self._async_write_engine.dispose()
+            self._async_write_engine = None
+            self._async_write_session_factory = None
+
+        await self.stop_replica_checks()
+        for replica in self._replicas or []:
+            await replica.engine.dispose()
+        self._replicas = None
+
         # Clear session factories
         self._session_factory = None
         self._async_session_factory = None
@@ -374,9 +720,11 @@ def get_session() -> Generator[Session, None, None]:
     return get_database_manager().get_session()
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_async_session(
+    read_only: bool = False, write: bool = False
+) -> AsyncGenerator[AsyncSession, None]:
     """Get async database session (convenience function)."""
-    async with get_database_manager().get_async_session() as session:
+    async with get_database_manager().get_async_session(read_only, write) as session:
         yield session
 
 
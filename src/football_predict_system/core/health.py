@@ -9,7 +9,10 @@ This module provides:
 """
 
 import asyncio
+import contextlib
+import math
 import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -24,6 +27,9 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Windows (seconds) of the rolling resource usage averages
+AVERAGE_WINDOWS = {"1m": 60.0, "5m": 300.0, "15m": 900.0}
+
 
 class HealthStatus(str, Enum):
     """Health check status levels."""
@@ -54,6 +60,161 @@ class SystemHealth(BaseModel):
     timestamp: datetime
     uptime: float
     version: str
+    age_seconds: float = 0.0
+    stale: bool = False
+
+
+class HealthSnapshot(BaseModel):
+    """Result of one round of component probes, published as a whole."""
+
+    model_config = {"frozen": True}
+
+    status: HealthStatus
+    components: tuple[ComponentHealth, ...]
+    checked_at: datetime
+    checked_monotonic: float
+    duration: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the probes completed."""
+        return time.monotonic() - self.checked_monotonic
+
+    def component(self, name: str) -> ComponentHealth | None:
+        """Health of one component, if it was probed."""
+        return next((c for c in self.components if c.name == name), None)
+
+
+class ResourceSnapshot(BaseModel):
+    """System resource usage at one sample, with rolling averages."""
+
+    model_config = {"frozen": True}
+
+    cpu_percent: float
+    memory: dict[str, float]
+    disk: dict[str, float]
+    network: dict[str, float]
+    averages: dict[str, dict[str, float]]
+    sampled_at: datetime
+    sampled_monotonic: float
+
+
+class ResourceSampler:
+    """
+    Samples CPU, memory, disk and network usage in the background.
+
+    Health checks read the latest snapshot instead of measuring on the
+    request path (``psutil.cpu_percent(interval=1)`` blocked the event loop
+    for a second). CPU usage is measured between consecutive samples, and
+    CPU and memory carry exponentially damped 1, 5 and 15 minute averages,
+    computed like Unix load averages.
+    """
+
+    def __init__(self, interval: float = 5.0) -> None:
+        self.interval = interval
+        self.logger = get_logger(__name__)
+        self.latest: ResourceSnapshot | None = None
+        self._averages: dict[str, dict[str, float]] = {}
+        self._network: tuple[float, Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+        # Prime the counter so the first sample measures a real interval
+        psutil.cpu_percent(interval=None)
+
+    def _update_averages(self, now: float, values: dict[str, float]) -> None:
+        """Fold a sample into the damped averages."""
+        elapsed = (
+            now - self.latest.sampled_monotonic if self.latest is not None else None
+        )
+        for metric, value in values.items():
+            averages = self._averages.get(metric)
+            if averages is None or elapsed is None:
+                self._averages[metric] = dict.fromkeys(AVERAGE_WINDOWS, value)
+                continue
+            for window, seconds in AVERAGE_WINDOWS.items():
+                decay = math.exp(-elapsed / seconds)
+                averages[window] = averages[window] * decay + value * (1 - decay)
+
+    def sample(self) -> ResourceSnapshot:
+        """Take a sample now; never blocks waiting for CPU measurement."""
+        now = time.monotonic()
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage("/")
+
+        network: dict[str, float] = {}
+        try:
+            counters = psutil.net_io_counters()
+            network = {
+                "bytes_sent": counters.bytes_sent,
+                "bytes_recv": counters.bytes_recv,
+                "packets_sent": counters.packets_sent,
+                "packets_recv": counters.packets_recv,
+            }
+            if self._network is not None:
+                previous_time, previous = self._network
+                elapsed = max(now - previous_time, 1e-9)
+                network["sent_bytes_per_second"] = (
+                    counters.bytes_sent - previous.bytes_sent
+                ) / elapsed
+                network["recv_bytes_per_second"] = (
+                    counters.bytes_recv - previous.bytes_recv
+                ) / elapsed
+            self._network = (now, counters)
+        except Exception:
+            network = {}
+
+        self._update_averages(
+            now, {"cpu_percent": cpu_percent, "memory_percent": memory.percent}
+        )
+        self.latest = ResourceSnapshot(
+            cpu_percent=cpu_percent,
+            memory={
+                "total": memory.total,
+                "available": memory.available,
+                "percent": memory.percent,
+                "used": memory.used,
+            },
+            disk={
+                "total": disk.total,
+                "free": disk.free,
+                "percent": disk.percent,
+                "used": disk.used,
+            },
+            network=network,
+            averages={
+                metric: {window: round(value, 2) for window, value in averages.items()}
+                for metric, averages in self._averages.items()
+            },
+            sampled_at=datetime.utcnow(),
+            sampled_monotonic=now,
+        )
+        return self.latest
+
+    def start(self) -> None:
+        """Start sampling in the background."""
+        if self._task is not None and not self._task.done():
+            return
+
+        async def sample_periodically() -> None:
+            while True:
+                try:
+                    # disk_usage can stall on a slow filesystem; keep it off the loop
+                    await asyncio.to_thread(self.sample)
+                except Exception as e:
+                    self.logger.warning("Resource sampling failed", error=str(e))
+                await asyncio.sleep(self.interval)
+
+        self._task = asyncio.create_task(sample_periodically())
+
+    async def stop(self) -> None:
+        """Stop background sampling."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
 
 
 class HealthChecker:
@@ -63,8 +224,12 @@ class HealthChecker:
         self.settings = get_settings()
         self.logger = get_logger(__name__)
         self.start_time = time.time()
-        self._health_cache: dict[str, ComponentHealth] = {}
-        self._cache_ttl = 30  # Cache health results for 30 seconds
+        self.resource_sampler = ResourceSampler(
+            self.settings.monitoring.resource_sample_interval
+        )
+        self.snapshot: HealthSnapshot | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._probe_task: asyncio.Task[None] | None = None
 
     async def check_database_health(self) -> ComponentHealth:
         """Check database connectivity and performance."""
@@ -107,32 +272,20 @@ class HealthChecker:
             )
 
     async def check_redis_health(self) -> ComponentHealth:
-        """Check Redis connectivity and performance."""
+        """Check Redis connectivity using the cache manager's client."""
         start_time = time.time()
 
         try:
-            import redis.asyncio as redis
-
-            redis_client = redis.from_url(self.settings.redis.url)
+            cache_manager = await get_cache_manager()
+            redis_client = await cache_manager.get_redis_client()
 
-            # Test basic operations
             await redis_client.ping()
-            await redis_client.set("health_check", "ok", ex=60)
-            result = await redis_client.get("health_check")
-            await redis_client.delete("health_check")
-
             response_time = time.time() - start_time
-
-            status = HealthStatus.HEALTHY if result == b"ok" else HealthStatus.DEGRADED
-
-            # Get Redis info
             info = await redis_client.info()
 
-            await redis_client.close()
-
             return ComponentHealth(
                 name="redis",
-                status=status,
+                status=HealthStatus.HEALTHY,
                 response_time=response_time,
                 details={
                     "version": info.get("redis_version"),
@@ -143,16 +296,7 @@ class HealthChecker:
                 last_check=datetime.utcnow(),
             )
 
-        except ImportError:
-            # Redis not available
-            return ComponentHealth(
-                name="redis",
-                status=HealthStatus.UNKNOWN,
-                response_time=0,
-                details={"message": "Redis client not installed"},
-                last_check=datetime.utcnow(),
-            )
-        except ConnectionError as e:
+        except Exception as e:
             response_time = time.time() - start_time
             self.logger.error("Redis health check failed", error=str(e))
 
@@ -208,37 +352,26 @@ class HealthChecker:
             )
 
     def check_system_resources(self) -> ComponentHealth:
-        """Check system resource usage."""
+        """
+        Check system resource usage.
+
+        Reads the background sampler's latest snapshot, sampling on demand
+        only if the sampler has not run yet. Status is judged on the 1 minute
+        CPU average so a momentary spike does not flip the check.
+        """
         start_time = time.time()
 
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-
-            # Memory usage
-            memory = psutil.virtual_memory()
-
-            # Disk usage
-            disk = psutil.disk_usage("/")
-
-            # Network stats (if available)
-            try:
-                network = psutil.net_io_counters()
-                network_stats = {
-                    "bytes_sent": network.bytes_sent,
-                    "bytes_recv": network.bytes_recv,
-                    "packets_sent": network.packets_sent,
-                    "packets_recv": network.packets_recv,
-                }
-            except Exception:
-                network_stats = {}
+            snapshot = self.resource_sampler.latest or self.resource_sampler.sample()
 
-            response_time = time.time() - start_time
+            cpu_percent = snapshot.averages["cpu_percent"]["1m"]
+            memory_percent = snapshot.memory["percent"]
+            disk_percent = snapshot.disk["percent"]
 
             # Determine health status based on resource usage
-            if cpu_percent > 90 or memory.percent > 90 or disk.percent > 90:
+            if cpu_percent > 90 or memory_percent > 90 or disk_percent > 90:
                 status = HealthStatus.UNHEALTHY
-            elif cpu_percent > 70 or memory.percent > 70 or disk.percent > 80:
+            elif cpu_percent > 70 or memory_percent > 70 or disk_percent > 80:
                 status = HealthStatus.DEGRADED
             else:
                 status = HealthStatus.HEALTHY
@@ -246,24 +379,19 @@ class HealthChecker:
             return ComponentHealth(
                 name="system_resources",
                 status=status,
-                response_time=response_time,
+                response_time=time.time() - start_time,
                 details={
-                    "cpu_percent": cpu_percent,
-                    "memory": {
-                        "total": memory.total,
-                        "available": memory.available,
-                        "percent": memory.percent,
-                        "used": memory.used,
-                    },
-                    "disk": {
-                        "total": disk.total,
-                        "free": disk.free,
-                        "percent": disk.percent,
-                        "used": disk.used,
-                    },
-                    "network": network_stats,
+                    "cpu_percent": snapshot.cpu_percent,
+                    "memory": snapshot.memory,
+                    "disk": snapshot.disk,
+                    "network": snapshot.network,
+                    "averages": snapshot.averages,
+                    "sampled_at": snapshot.sampled_at.isoformat(),
+                    "age_seconds": round(
+                        time.monotonic() - snapshot.sampled_monotonic, 3
+                    ),
                 },
-                last_check=datetime.utcnow(),
+                last_check=snapshot.sampled_at,
             )
 
         except Exception as e:
@@ -419,67 +547,100 @@ class HealthChecker:
             )
 
     async def get_system_health(self, use_cache: bool = True) -> SystemHealth:
-        """Get comprehensive system health status."""
-        if use_cache:
-            # Check if we have recent cached results
-            now = datetime.utcnow()
-            cached_results = []
-
-            for _component_name, health in self._health_cache.items():
-                if (now - health.last_check).total_seconds() < self._cache_ttl:
-                    cached_results.append(health)
-
-            if len(cached_results) >= 4:  # We have most components cached
-                components = cached_results
-            else:
-                components = await self._check_all_components()
-        else:
-            components = await self._check_all_components()
+        """
+        Get comprehensive system health status.
 
-        # Update cache
-        for component in components:
-            self._health_cache[component.name] = component
-
-        # Determine overall system status
-        component_statuses = [comp.status for comp in components]
-
-        if all(status == HealthStatus.HEALTHY for status in component_statuses):
-            overall_status = HealthStatus.HEALTHY
-        elif any(status == HealthStatus.UNHEALTHY for status in component_statuses):
-            overall_status = HealthStatus.UNHEALTHY
-        elif any(status == HealthStatus.DEGRADED for status in component_statuses):
-            overall_status = HealthStatus.DEGRADED
-        else:
-            overall_status = HealthStatus.UNKNOWN
-
-        uptime = time.time() - self.start_time
+        Served from the latest snapshot unless ``use_cache`` is False, in
+        which case the components are probed now.
+        """
+        snapshot = await self.get_snapshot() if use_cache else await self.refresh()
+        age = snapshot.age
 
         return SystemHealth(
-            status=overall_status,
-            components=components,
-            timestamp=datetime.utcnow(),
-            uptime=uptime,
+            status=snapshot.status,
+            components=list(snapshot.components),
+            timestamp=snapshot.checked_at,
+            uptime=time.time() - self.start_time,
             version=self.settings.app_version,
+            age_seconds=round(age, 3),
+            stale=age > self.settings.monitoring.health_stale_after,
         )
 
-    async def _check_all_components(self) -> list[ComponentHealth]:
-        """Check all system components."""
-        tasks = [
-            self.check_database_health(),
-            self.check_redis_health(),
-            self.check_model_registry(),
-            self.check_external_apis(),
-        ]
+    async def get_snapshot(self) -> HealthSnapshot:
+        """
+        Get the latest health snapshot.
+
+        While probes run on a schedule this never waits on a backend. Without
+        the schedule (scripts, tests) a snapshot older than the check
+        interval is refreshed on demand, once for all concurrent callers.
+        """
+        snapshot = self.snapshot
+        if snapshot is not None and (
+            self.probing
+            or snapshot.age < self.settings.monitoring.health_check_interval
+        ):
+            return snapshot
+
+        async with self._refresh_lock:
+            if self.snapshot is not None and self.snapshot is not snapshot:
+                return self.snapshot  # Refreshed while we waited
+            return await self.refresh()
+
+    async def refresh(self) -> HealthSnapshot:
+        """Probe all components and publish a new snapshot."""
+        started = time.monotonic()
+        components = await self._check_all_components()
+        finished = time.monotonic()
+
+        self.snapshot = HealthSnapshot(
+            status=self.get_overall_status(components),
+            components=tuple(components),
+            checked_at=datetime.utcnow(),
+            checked_monotonic=finished,
+            duration=finished - started,
+        )
+        return self.snapshot
 
-        # Add system resources check (synchronous)
-        system_resources = self.check_system_resources()
+    async def _probe(
+        self, name: str, check: Callable[[], Awaitable[ComponentHealth]]
+    ) -> ComponentHealth:
+        """Run one probe, reporting it unhealthy if it exceeds the timeout."""
+        timeout = self.settings.monitoring.health_check_timeout
+        try:
+            return await asyncio.wait_for(check(), timeout=timeout)
+        except TimeoutError:
+            self.logger.warning("Health check timed out", component=name)
+            return ComponentHealth(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                response_time=timeout,
+                details={},
+                last_check=datetime.utcnow(),
+                error=f"Timed out after {timeout}s",
+            )
 
-        # Run async checks concurrently
-        async_results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _check_all_components(self) -> list[ComponentHealth]:
+        """Probe all system components concurrently, each with a timeout."""
+
+        async def check_system_resources() -> ComponentHealth:
+            return self.check_system_resources()
+
+        probes = {
+            "system_resources": check_system_resources,
+            "database": self.check_database_health,
+            "redis": self.check_redis_health,
+            "model_registry": self.check_model_registry,
+            "external_apis": self.check_external_apis,
+        }
+
+        results = await asyncio.gather(
+            *(self._probe(name, check) for name, check in probes.items()),
+            return_exceptions=True,
+        )
 
-        components = [system_resources]
+        components = []
 
-        for result in async_results:
+        for result in results:
             if isinstance(result, ComponentHealth):
                 components.append(result)
             elif isinstance(result, Exception):
@@ -487,6 +648,36 @@ class HealthChecker:
 
         return components
 
+    @property
+    def probing(self) -> bool:
+        """Whether probes are running on a schedule."""
+        return self._probe_task is not None and not self._probe_task.done()
+
+    def start_probing(self) -> None:
+        """Probe all components every ``health_check_interval`` seconds."""
+        if self.probing:
+            return
+
+        async def probe_periodically() -> None:
+            while True:
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    self.logger.error("Health probes failed", error=str(e))
+                await asyncio.sleep(self.settings.monitoring.health_check_interval)
+
+        self._probe_task = asyncio.create_task(probe_periodically())
+
+    async def stop_probing(self) -> None:
+        """Stop scheduled probes."""
+        if self._probe_task is None:
+            return
+
+        self._probe_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._probe_task
+        self._probe_task = None
+
     def get_overall_status(self, components: list[ComponentHealth]) -> HealthStatus:
         """Determine overall system status from component health."""
         component_statuses = [comp.status for comp in components]
@@ -7,16 +7,21 @@ This module provides:
 - Correlation ID tracking
 - Performance monitoring
 - Error tracking integration
+- Asynchronous output through a bounded queue and a writer thread
 """
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import functools
 import json
 import logging
 import logging.handlers
+import queue
 import re
 import sys
+import threading
 import time
 import traceback
 from collections.abc import Callable
@@ -28,7 +33,13 @@ from uuid import uuid4
 import structlog
 from structlog.types import FilteringBoundLogger
 
-from .config import get_settings
+from .config import LoggingConfig, get_settings
+from .metrics import get_operation_metrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
 
 # Context variables for request tracking
 correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
@@ -69,8 +80,9 @@ class PerformanceProcessor:
         method_name: str,
         event_dict: dict[str, Any],
     ) -> dict[str, Any]:
-        # Add timestamp
-        event_dict["timestamp"] = time.time()
+        # Stamp once, at the call site; the renderer may run much later
+        if "timestamp" not in event_dict:
+            event_dict["timestamp"] = time.time()
 
         # Add performance data if available
         if "duration" in event_dict:
@@ -82,8 +94,89 @@ class PerformanceProcessor:
         return event_dict
 
 
+class LazyTrace:
+    """
+    Stack or exception traceback formatted only when rendered.
+
+    Holds an unformatted ``StackSummary`` or the exception itself, so the
+    cost of reading source lines and building strings is paid by the
+    renderer (on the log writer thread) rather than at the logging call.
+    """
+
+    __slots__ = ("_lines", "_source")
+
+    def __init__(self, source: traceback.StackSummary | BaseException) -> None:
+        self._source = source
+        self._lines: list[str] | None = None
+
+    def format(self) -> list[str]:
+        """Formatted trace lines, as ``traceback.format_*`` returns them."""
+        if self._lines is None:
+            source = self._source
+            if isinstance(source, BaseException):
+                self._lines = traceback.format_exception(
+                    type(source), source, source.__traceback__
+                )
+            else:
+                self._lines = source.format()
+        return self._lines
+
+    def __str__(self) -> str:
+        return "".join(self.format())
+
+    def __repr__(self) -> str:
+        return repr(self.format())
+
+
 class ErrorProcessor:
-    """Enhanced error processing with stack traces."""
+    """
+    Enhanced error processing with stack traces.
+
+    Traces are sampled per call site: the first error from a site within
+    ``interval`` seconds (up to ``max_per_interval``) carries its stack,
+    later ones only a ``stack_id`` pointing back to it and, on the next
+    sampled error, the number of traces suppressed in between. Stacks are
+    captured without source lines and formatted at render time.
+    """
+
+    ERROR_METHODS = frozenset(("error", "exception", "critical"))
+    MAX_SITES = 10_000
+
+    def __init__(self, interval: float = 60.0, max_per_interval: int = 1) -> None:
+        self.interval = interval
+        self.max_per_interval = max_per_interval
+        # site -> [window start, traces in window, suppressed since last trace]
+        self._sites: dict[str, list[float]] = {}
+
+    def _sample(self, site: str) -> tuple[bool, int]:
+        """Whether to capture a trace for a site, and how many were skipped."""
+        now = time.monotonic()
+        state = self._sites.get(site)
+        if state is None:
+            if len(self._sites) >= self.MAX_SITES:
+                self._sites.clear()
+            self._sites[site] = [now, 1, 0]
+            return True, 0
+
+        if now - state[0] >= self.interval:
+            state[0], state[1] = now, 0
+        if state[1] < self.max_per_interval:
+            state[1] += 1
+            suppressed, state[2] = int(state[2]), 0
+            return True, suppressed
+
+        state[2] += 1
+        return False, 0
+
+    @staticmethod
+    def _call_site() -> Any:
+        """First frame outside structlog and this processor."""
+        frame = sys._getframe(2)
+        while frame.f_back is not None and frame.f_globals.get(
+            "__name__", ""
+        ).startswith("structlog"):
+            frame = frame.f_back
+        return frame
 
     def __call__(
         self,
@@ -91,36 +184,109 @@ class ErrorProcessor:
         method_name: str,
         event_dict: dict[str, Any],
     ) -> dict[str, Any]:
-        if method_name in ("error", "exception", "critical"):
-            # Add error details
-            if "error" in event_dict:
-                error = event_dict["error"]
-                if isinstance(error, Exception):
-                    event_dict["error_details"] = {
-                        "type": error.__class__.__name__,
-                        "message": str(error),
-                        "traceback": traceback.format_exception(
-                            type(error), error, error.__traceback__
-                        ),
-                    }
-                    event_dict["error"] = str(error)
-
-            # Add stack trace for exceptions
-            if "exc_info" not in event_dict:
-                event_dict["stack_trace"] = traceback.format_stack()
+        if method_name not in self.ERROR_METHODS:
+            return event_dict
+
+        # Add error details
+        error = event_dict.get("error")
+        if isinstance(error, Exception):
+            tb = error.__traceback__
+            while tb is not None and tb.tb_next is not None:
+                tb = tb.tb_next
+            site = (
+                f"{type(error).__name__}@{tb.tb_frame.f_code.co_filename}:"
+                f"{tb.tb_lineno}"
+                if tb is not None
+                else None
+            )
+            details: dict[str, Any] = {
+                "type": error.__class__.__name__,
+                "message": str(error),
+            }
+            if site is not None:
+                capture, suppressed = self._sample(site)
+                details["traceback_id"] = site
+                if capture:
+                    details["traceback"] = LazyTrace(error)
+                if suppressed:
+                    details["traceback_suppressed"] = suppressed
+            else:
+                details["traceback"] = LazyTrace(error)
+            event_dict["error_details"] = details
+            event_dict["error"] = str(error)
+
+        # Add stack trace for errors logged without exception info
+        if "exc_info" not in event_dict:
+            frame = self._call_site()
+            site = f"{frame.f_globals.get('__name__')}:{frame.f_lineno}"
+            event_dict["stack_id"] = site
+            capture, suppressed = self._sample(site)
+            if capture:
+                stack = traceback.StackSummary.extract(
+                    traceback.walk_stack(frame), lookup_lines=False
+                )
+                stack.reverse()
+                event_dict["stack_trace"] = LazyTrace(stack)
+            if suppressed:
+                event_dict["stack_trace_suppressed"] = suppressed
 
         return event_dict
 
 
+def capture_exc_info(
+    logger: FilteringBoundLogger,
+    method_name: str,
+    event_dict: dict[str, Any],
+) -> dict[str, Any]:
+    """Resolve ``exc_info`` now so the traceback can be formatted later."""
+    exc_info = event_dict.get("exc_info")
+    if exc_info is True:
+        event_dict["exc_info"] = sys.exc_info()
+    elif isinstance(exc_info, BaseException):
+        event_dict["exc_info"] = (type(exc_info), exc_info, exc_info.__traceback__)
+    return event_dict
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the JSON encoder does not know."""
+    if isinstance(value, LazyTrace):
+        return value.format()
+    return str(value)
+
+
 class CustomJSONRenderer:
-    """Custom JSON renderer with enhanced formatting."""
+    """
+    Custom JSON renderer with enhanced formatting.
+
+    The service block is built and encoded once. With orjson installed lines
+    are rendered to UTF-8 bytes, otherwise to ``str`` with the standard
+    library encoder.
+    """
+
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else 0
+    )
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.service = {
+            "name": settings.logging.service_name,
+            "version": settings.logging.service_version,
+            "environment": settings.environment.value,
+        }
+        self.produces_bytes = orjson is not None
+        self._service_fragment = (
+            orjson.Fragment(orjson.dumps(self.service, default=_json_default))
+            if orjson is not None and hasattr(orjson, "Fragment")
+            else self.service
+        )
 
     def __call__(
         self,
         logger: FilteringBoundLogger,
         method_name: str,
         event_dict: dict[str, Any],
-    ) -> str:
+    ) -> str | bytes:
         # Ensure required fields
         if "timestamp" not in event_dict:
             event_dict["timestamp"] = time.time()
@@ -128,15 +294,23 @@ class CustomJSONRenderer:
         if "level" not in event_dict:
             event_dict["level"] = method_name.upper()
 
+        exc_info = event_dict.pop("exc_info", None)
+        if isinstance(exc_info, tuple) and exc_info[0] is not None:
+            event_dict["exception"] = "".join(traceback.format_exception(*exc_info))
+
         # Add service information
-        settings = get_settings()
-        event_dict["service"] = {
-            "name": settings.logging.service_name,
-            "version": settings.logging.service_version,
-            "environment": settings.environment.value,
-        }
+        if orjson is not None:
+            event_dict["service"] = self._service_fragment
+            try:
+                return orjson.dumps(
+                    event_dict, default=_json_default, option=self.ORJSON_OPTIONS
+                )
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; use the slow path below
 
-        return json.dumps(event_dict, default=str, ensure_ascii=False)
+        event_dict["service"] = self.service
+        line = json.dumps(event_dict, default=_json_default, ensure_ascii=False)
+        return line.encode("utf-8") if self.produces_bytes else line
 
 
 def _parse_file_size(size_str: str | int) -> int:
@@ -178,12 +352,265 @@ def _parse_file_size(size_str: str | int) -> int:
     return int(size_value * multiplier)
 
 
+_STOP = object()
+
+
+class LogPipeline:
+    """
+    Bounded queue of log records written by a background thread.
+
+    Callers only enqueue; rendering and I/O happen on the writer thread, which
+    drains up to ``batch_size`` records at a time and writes them with a
+    single flush. When the queue is full records are dropped and counted, or
+    with ``block=True`` the caller waits for space. Once closed, records are
+    written synchronously so late messages are not lost.
+    """
+
+    def __init__(
+        self,
+        stream: Any = None,
+        handler: logging.Handler | None = None,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        block: bool = False,
+    ) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self.handler = handler
+        self.batch_size = max(1, batch_size)
+        self.block = block
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._dropped = 0
+        self._reported = 0
+        self._drop_lock = threading.Lock()
+        self._renderer: Callable[..., Any] | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because the queue was full."""
+        return self._dropped
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="log-pipeline", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, item: Any) -> None:
+        """Enqueue a record according to the queue full policy."""
+        if self._closed or self._thread is None:
+            self._write_batch([item])
+            return
+        try:
+            if self.block:
+                self._queue.put(item)
+            else:
+                self._queue.put_nowait(item)
+        except queue.Full:
+            with self._drop_lock:
+                self._dropped += 1
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until everything enqueued so far has been written."""
+        if self._closed or self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Write the remaining records and stop the writer thread."""
+        if self._closed:
+            return
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        self._closed = True
+        atexit.unregister(self.close)
+        if self.handler is not None:
+            with contextlib.suppress(OSError, ValueError):
+                self.handler.flush()
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches."""
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            if not self._write_batch(batch):
+                return
+
+    def _write_batch(self, batch: list[Any]) -> bool:
+        """Render and write a batch; returns False once asked to stop."""
+        lines: list[bytes] = []
+        running = True
+        for item in batch:
+            if item is _STOP:
+                running = False
+            elif isinstance(item, threading.Event):
+                self._write_lines(lines)
+                item.set()
+            elif isinstance(item, logging.LogRecord):
+                # Keep stdlib records in order with structlog lines
+                self._write_lines(lines)
+                if self.handler is not None:
+                    self.handler.handle(item)
+            else:
+                renderer, method_name, event_dict = item
+                self._renderer = renderer
+                lines.append(self._render(renderer, method_name, event_dict))
+
+        if self._dropped != self._reported and self._renderer is not None:
+            dropped, self._reported = self._dropped - self._reported, self._dropped
+            lines.append(
+                self._render(
+                    self._renderer,
+                    "warning",
+                    {
+                        "event": "Log records dropped",
+                        "level": "warning",
+                        "dropped": dropped,
+                        "timestamp": time.time(),
+                    },
+                )
+            )
+        self._write_lines(lines)
+        return running
+
+    @staticmethod
+    def _render(
+        renderer: Callable[..., Any], method_name: str, event_dict: dict[str, Any]
+    ) -> bytes:
+        line: str | bytes
+        try:
+            line = renderer(None, method_name, event_dict)
+        except Exception as e:
+            line = f"{event_dict.get('event')!r} (log rendering failed: {e!r})"
+        if isinstance(line, str):
+            line = line.encode("utf-8", "backslashreplace")
+        return line + b"\n"
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """Write pending lines with one flush and clear the list."""
+        if not lines:
+            return
+        data = b"".join(lines)
+        lines.clear()
+        try:
+            buffer = getattr(self.stream, "buffer", None)
+            if buffer is not None:
+                self.stream.flush()
+                buffer.write(data)
+                buffer.flush()
+            else:
+                self.stream.write(data.decode("utf-8", "replace"))
+                self.stream.flush()
+        except (OSError, ValueError):
+            pass  # Stream closed or broken; nothing sensible left to do
+
+
+class QueueLogger:
+    """structlog logger that hands event dicts to a LogPipeline for rendering."""
+
+    def __init__(self, pipeline: LogPipeline, renderer: Callable[..., Any]) -> None:
+        self._pipeline = pipeline
+        self._renderer = renderer
+
+    def _log(self, method_name: str, event_dict: dict[str, Any]) -> None:
+        self._pipeline.put((self._renderer, method_name, event_dict))
+
+    def msg(self, **event_dict: Any) -> None:
+        self._log("info", event_dict)
+
+    def debug(self, **event_dict: Any) -> None:
+        self._log("debug", event_dict)
+
+    def info(self, **event_dict: Any) -> None:
+        self._log("info", event_dict)
+
+    def warning(self, **event_dict: Any) -> None:
+        self._log("warning", event_dict)
+
+    def error(self, **event_dict: Any) -> None:
+        self._log("error", event_dict)
+
+    def critical(self, **event_dict: Any) -> None:
+        self._log("critical", event_dict)
+
+    def exception(self, **event_dict: Any) -> None:
+        self._log("exception", event_dict)
+
+    log = msg
+    warn = warning
+    err = error
+    fatal = critical
+    failure = error
+
+
+class QueueLoggerFactory:
+    """Create QueueLoggers bound to one pipeline and renderer."""
+
+    def __init__(self, pipeline: LogPipeline, renderer: Callable[..., Any]) -> None:
+        self.pipeline = pipeline
+        self.renderer = renderer
+
+    def __call__(self, *args: Any) -> QueueLogger:
+        return QueueLogger(self.pipeline, self.renderer)
+
+
+class QueueHandler(logging.Handler):
+    """Standard library handler that enqueues records on a LogPipeline."""
+
+    def __init__(self, pipeline: LogPipeline) -> None:
+        super().__init__()
+        self.pipeline = pipeline
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Merge arguments now; they may change before the writer gets to them
+        record.msg = record.getMessage()
+        record.args = None
+        self.pipeline.put(record)
+
+
+_log_pipeline: LogPipeline | None = None
+
+
+def get_log_pipeline() -> LogPipeline | None:
+    """Get the active log pipeline, if asynchronous logging is enabled."""
+    return _log_pipeline
+
+
+def flush_logging(timeout: float | None = 5.0) -> bool:
+    """Wait until queued log records have been written."""
+    if _log_pipeline is None:
+        return True
+    return _log_pipeline.flush(timeout)
+
+
+def shutdown_logging(timeout: float | None = 5.0) -> None:
+    """Write queued log records and stop the writer thread."""
+    if _log_pipeline is not None:
+        _log_pipeline.close(timeout)
+
+
 def setup_logging() -> None:
     """Configure structured logging for the application."""
+    global _log_pipeline
+
     settings = get_settings()
 
-    # Clear existing handlers
+    # Clear existing handlers and write out anything still queued
     logging.root.handlers.clear()
+    shutdown_logging()
+    _log_pipeline = None
 
     # Configure structlog
     processors: list[Any] = [
@@ -193,27 +620,14 @@ def setup_logging() -> None:
         ErrorProcessor(),
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
+        capture_exc_info,
     ]
 
+    renderer: Any
     if settings.logging.format == "json":
-        processors.append(CustomJSONRenderer())
-        CustomJSONRenderer()
+        renderer = CustomJSONRenderer()
     else:
-        processors.extend(
-            [
-                structlog.dev.ConsoleRenderer(colors=True),
-            ]
-        )
-        structlog.dev.ConsoleRenderer(colors=True)
-
-    structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, settings.logging.level)
-        ),
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
 
     # Configure standard library logging
     handler: logging.Handler
@@ -244,6 +658,37 @@ def setup_logging() -> None:
     handler.setFormatter(formatter)
     handler.setLevel(getattr(logging, settings.logging.level))
 
+    # Queue records and render them on the writer thread, or inline
+    logger_factory: Any
+    if settings.logging.async_enabled:
+        _log_pipeline = LogPipeline(
+            stream=sys.stdout,
+            handler=handler,
+            max_queue=settings.logging.queue_size,
+            batch_size=settings.logging.batch_size,
+            block=settings.logging.queue_full_policy == "block",
+        )
+        _log_pipeline.start()
+        logger_factory = QueueLoggerFactory(_log_pipeline, renderer)
+        handler = QueueHandler(_log_pipeline)
+        handler.setLevel(getattr(logging, settings.logging.level))
+    else:
+        processors.append(renderer)
+        logger_factory = (
+            structlog.BytesLoggerFactory()
+            if getattr(renderer, "produces_bytes", False)
+            else structlog.PrintLoggerFactory()
+        )
+
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, settings.logging.level)
+        ),
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.logging.level))
@@ -291,11 +736,59 @@ def clear_context() -> None:
 
 
 class LoggingMiddleware:
-    """Middleware for automatic request logging."""
+    """
+    Middleware for automatic request logging.
 
-    def __init__(self, app: Callable[..., Any]) -> None:
+    Each request is logged as a single line when it completes. Routes can
+    be sampled by path prefix: with a rate of 0.01 one request in a hundred
+    is logged and its line carries ``sampled_requests=100``. Failed requests,
+    5xx responses and requests slower than ``slow_request_seconds`` are
+    always logged.
+    """
+
+    def __init__(
+        self, app: Callable[..., Any], config: LoggingConfig | None = None
+    ) -> None:
         self.app = app
         self.logger = get_logger(__name__)
+        if config is None:
+            config = get_settings().logging
+        self.slow_seconds = config.slow_request_seconds
+        self.default_every = self._every(config.request_sample_rate)
+        # Longest prefix first, so the most specific route wins
+        self._routes = sorted(
+            (
+                (prefix, self._every(rate))
+                for prefix, rate in config.request_sample_routes.items()
+            ),
+            key=lambda r: -len(r[0]),
+        )
+        self._counters: dict[str, int] = {}
+
+    @staticmethod
+    def _every(rate: float) -> int:
+        """Log one request in this many; 0 disables sampled logging."""
+        return round(1 / rate) if rate > 0 else 0
+
+    def sample_every(self, path: str) -> tuple[str, int]:
+        """Sampling bucket and interval for a path."""
+        for prefix, every in self._routes:
+            if path.startswith(prefix):
+                return prefix, every
+        return "*", self.default_every
+
+    def _sampled(self, bucket: str, every: int) -> bool:
+        """Count a request and tell whether it is the one to log."""
+        if every == 1:
+            return True
+        if every == 0:
+            return False
+        count = self._counters.get(bucket, 0) + 1
+        if count >= every:
+            self._counters[bucket] = 0
+            return True
+        self._counters[bucket] = count
+        return False
 
     async def __call__(
         self,
@@ -308,104 +801,132 @@ class LoggingMiddleware:
             return
 
         # Set request context
-        request_id = set_request_id()
-        correlation_id = set_correlation_id()
-
-        start_time = time.time()
-
-        # Log request start
-        self.logger.info(
+        set_request_id()
+        set_correlation_id()
+        path = scope["path"]
+        status_code = 500
+
+        async def send_with_status(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Cheap when debug is filtered out; useful for spotting hung requests
+        self.logger.debug(
             "Request started",
             method=scope["method"],
-            path=scope["path"],
-            query_string=scope.get("query_string", b"").decode(),
-            request_id=request_id,
-            correlation_id=correlation_id,
+            path=path,
         )
+        start_time = time.perf_counter()
 
         try:
-            await self.app(scope, receive, send)
-
-            # Log successful request
-            duration = time.time() - start_time
-            self.logger.info("Request completed", duration=duration, status="success")
-
+            await self.app(scope, receive, send_with_status)
         except Exception as e:
             # Log failed request
-            duration = time.time() - start_time
             self.logger.error(
                 "Request failed",
+                method=scope["method"],
+                path=path,
                 error=str(e),
-                duration=duration,
+                duration=time.perf_counter() - start_time,
                 status="error",
             )
             raise
+        else:
+            duration = time.perf_counter() - start_time
+            bucket, every = self.sample_every(path)
+            fields = {
+                "method": scope["method"],
+                "path": path,
+                "status_code": status_code,
+                "duration": duration,
+            }
+            if status_code >= 500:
+                self.logger.error("Request completed", status="error", **fields)
+            elif duration >= self.slow_seconds:
+                self.logger.warning(
+                    "Request completed", status="slow", slow=True, **fields
+                )
+            elif self._sampled(bucket, every):
+                if every > 1:
+                    fields["sampled_requests"] = every
+                self.logger.info("Request completed", status="success", **fields)
         finally:
             clear_context()
 
 
 def log_performance(operation: str) -> Callable[..., Any]:
-    """Decorator for logging operation performance."""
+    """
+    Decorator recording operation latency.
+
+    Every call is recorded in the operation's latency histogram (see
+    ``core.metrics``); failures are also logged. Successful calls are only
+    logged at debug level, as summaries are flushed periodically.
+    """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        logger = get_logger(func.__module__)
+        histogram = get_operation_metrics().histogram(operation)
+
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger = get_logger(func.__module__)
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-
-                logger.info(
-                    f"{operation} completed",
-                    operation=operation,
-                    duration=duration,
-                    function=func.__name__,
-                )
-
-                return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration_ns = time.perf_counter_ns() - start_ns
+                histogram.record(duration_ns, error=True)
 
                 logger.error(
                     f"{operation} failed",
                     operation=operation,
-                    duration=duration,
+                    duration=duration_ns / 1e9,
                     function=func.__name__,
                     error=str(e),
                 )
                 raise
 
+            duration_ns = time.perf_counter_ns() - start_ns
+            histogram.record(duration_ns)
+            logger.debug(
+                f"{operation} completed",
+                operation=operation,
+                duration=duration_ns / 1e9,
+                function=func.__name__,
+            )
+            return result
+
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger = get_logger(func.__module__)
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
-
-                logger.info(
-                    f"{operation} completed",
-                    operation=operation,
-                    duration=duration,
-                    function=func.__name__,
-                )
-
-                return result
             except Exception as e:
-                duration = time.time() - start_time
+                duration_ns = time.perf_counter_ns() - start_ns
+                histogram.record(duration_ns, error=True)
 
                 logger.error(
                     f"{operation} failed",
                     operation=operation,
-                    duration=duration,
+                    duration=duration_ns / 1e9,
                     function=func.__name__,
                     error=str(e),
                 )
                 raise
 
+            duration_ns = time.perf_counter_ns() - start_ns
+            histogram.record(duration_ns)
+            logger.debug(
+                f"{operation} completed",
+                operation=operation,
+                duration=duration_ns / 1e9,
+                function=func.__name__,
+            )
+            return result
+
         import asyncio
 
         if asyncio.iscoroutinefunction(func):
@@ -421,8 +942,8 @@ def monitor_performance(
     """
     简单的性能监控装饰器
 
-    用于监控关键数据处理操作的执行时间,
-    记录性能日志用于后续优化.
+    记录关键数据处理操作的执行时间到操作延迟直方图 (见 ``core.metrics``),
+    定期汇总输出 p50/p95/p99, 失败时记录警告日志.
 
     Args:
         operation_name: 操作名称, 用于日志标识
@@ -437,60 +958,52 @@ def monitor_performance(
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        logger = get_logger(__name__)
+        operation = operation_name or func.__name__
+        histogram = get_operation_metrics().histogram(operation)
+
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger = get_logger(__name__)
-            start_time = time.time()
-            operation = operation_name or func.__name__
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = await func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                logger.info(
-                    "性能监控",
-                    operation=operation,
-                    execution_time_ms=round(execution_time * 1000, 2),
-                    status="success",
-                )
-                return result
             except Exception as e:
-                execution_time = time.time() - start_time
+                execution_ns = time.perf_counter_ns() - start_ns
+                histogram.record(execution_ns, error=True)
                 logger.warning(
                     "性能监控 - 操作失败",
                     operation=operation,
-                    execution_time_ms=round(execution_time * 1000, 2),
+                    execution_time_ms=round(execution_ns / 1e6, 2),
                     status="failed",
                     error=str(e),
                 )
                 raise
 
+            histogram.record(time.perf_counter_ns() - start_ns)
+            return result
+
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger = get_logger(__name__)
-            start_time = time.time()
-            operation = operation_name or func.__name__
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                logger.info(
-                    "性能监控",
-                    operation=operation,
-                    execution_time_ms=round(execution_time * 1000, 2),
-                    status="success",
-                )
-                return result
             except Exception as e:
-                execution_time = time.time() - start_time
+                execution_ns = time.perf_counter_ns() - start_ns
+                histogram.record(execution_ns, error=True)
                 logger.warning(
                     "性能监控 - 操作失败",
                     operation=operation,
-                    execution_time_ms=round(execution_time * 1000, 2),
+                    execution_time_ms=round(execution_ns / 1e6, 2),
                     status="failed",
                     error=str(e),
                 )
                 raise
 
+            histogram.record(time.perf_counter_ns() - start_ns)
+            return result
+
         # 根据函数类型返回对应的包装器
         if (
             hasattr(func, "__code__") and func.__code__.co_flags & 0x80
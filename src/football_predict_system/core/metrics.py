@@ -0,0 +1,293 @@
+"""
+In-process operation latency histograms.
+
+``log_performance`` and ``monitor_performance`` record every call here
+instead of writing a log line per call. Latencies go into HDR-style
+log-linear buckets (16 sub-buckets per power of two of nanoseconds, about
+6% relative error), so percentiles stay accurate from microseconds to
+minutes in a fixed amount of memory per operation.
+
+Each thread records into its own shard, so recording takes no lock; readers
+merge the shards. Histograms are exported to Prometheus, summarised in a
+periodic log line and served by the monitoring API.
+"""
+
+import asyncio
+import contextlib
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+EXACT_LIMIT = SUB_BUCKETS * 2
+MAX_TRACKABLE_NS = 3600 * 1_000_000_000
+BUCKET_COUNT = (
+    (MAX_TRACKABLE_NS.bit_length() - SUB_BUCKET_BITS - 1) << SUB_BUCKET_BITS
+) + EXACT_LIMIT
+
+# Upper bounds (seconds) of the buckets exported to Prometheus
+PROMETHEUS_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def bucket_index(value_ns: int) -> int:
+    """Index of the bucket holding a latency in nanoseconds."""
+    if value_ns < EXACT_LIMIT:
+        return max(value_ns, 0)
+    value_ns = min(value_ns, MAX_TRACKABLE_NS)
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift << SUB_BUCKET_BITS) + (value_ns >> shift)
+
+
+def bucket_upper_ns(index: int) -> int:
+    """Largest latency in nanoseconds that falls into a bucket."""
+    if index < EXACT_LIMIT:
+        return index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << SUB_BUCKET_BITS)
+    return ((mantissa + 1) << shift) - 1
+
+
+class _Shard:
+    """Counts recorded by one thread."""
+
+    __slots__ = ("counts", "errors", "max_ns", "sum_ns")
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKET_COUNT
+        self.sum_ns = 0
+        self.max_ns = 0
+        self.errors = 0
+
+
+class HistogramSnapshot:
+    """Merged, immutable view of a histogram at one point in time."""
+
+    __slots__ = ("count", "counts", "errors", "max_ns", "sum_ns")
+
+    def __init__(
+        self, counts: list[int], sum_ns: int, max_ns: int, errors: int
+    ) -> None:
+        self.counts = counts
+        self.count = sum(counts)
+        self.sum_ns = sum_ns
+        self.max_ns = max_ns
+        self.errors = errors
+
+    def percentile(self, q: float) -> float:
+        """Latency in seconds below which ``q`` percent of calls fall."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, round(self.count * q / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bucket_upper_ns(index), self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    def since(self, earlier: "HistogramSnapshot") -> "HistogramSnapshot":
+        """Calls recorded after an earlier snapshot; max is since start."""
+        return HistogramSnapshot(
+            [a - b for a, b in zip(self.counts, earlier.counts, strict=True)],
+            self.sum_ns - earlier.sum_ns,
+            self.max_ns,
+            self.errors - earlier.errors,
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Count, errors and latency percentiles in milliseconds."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.sum_ns / self.count / 1e6, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max_ns / 1e6, 3),
+        }
+
+
+def prometheus_buckets(snapshot: HistogramSnapshot) -> list[tuple[str, float]]:
+    """Cumulative counts at the exported Prometheus bucket bounds."""
+    buckets: list[tuple[str, float]] = []
+    cumulative = 0
+    index = 0
+    for bound in PROMETHEUS_BUCKETS:
+        bound_ns = bound * 1e9
+        while index < BUCKET_COUNT and bucket_upper_ns(index) <= bound_ns:
+            cumulative += snapshot.counts[index]
+            index += 1
+        buckets.append((str(bound), cumulative))
+    buckets.append(("+Inf", snapshot.count))
+    return buckets
+
+
+class LatencyHistogram:
+    """Latency histogram for one operation, sharded per thread."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._shards: dict[int, _Shard] = {}
+
+    def _shard(self) -> _Shard:
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            shard = self._shards[ident] = _Shard()
+        return shard
+
+    def record(self, duration_ns: int, error: bool = False) -> None:
+        """Record one call."""
+        shard = self._shard()
+        shard.counts[bucket_index(duration_ns)] += 1
+        shard.sum_ns += duration_ns
+        if duration_ns > shard.max_ns:
+            shard.max_ns = duration_ns
+        if error:
+            shard.errors += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Merge all shards."""
+        counts = [0] * BUCKET_COUNT
+        sum_ns = max_ns = errors = 0
+        for shard in list(self._shards.values()):
+            for index, bucket_count in enumerate(shard.counts):
+                if bucket_count:
+                    counts[index] += bucket_count
+            sum_ns += shard.sum_ns
+            max_ns = max(max_ns, shard.max_ns)
+            errors += shard.errors
+        return HistogramSnapshot(counts, sum_ns, max_ns, errors)
+
+
+class OperationMetrics:
+    """Registry of latency histograms by operation name."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._flushed: dict[str, HistogramSnapshot] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def histogram(self, operation: str) -> LatencyHistogram:
+        """Get or create the histogram for an operation."""
+        histogram = self._histograms.get(operation)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    operation, LatencyHistogram(operation)
+                )
+        return histogram
+
+    def record(self, operation: str, duration_ns: int, error: bool = False) -> None:
+        """Record one call of an operation."""
+        self.histogram(operation).record(duration_ns, error)
+
+    def snapshots(self) -> dict[str, HistogramSnapshot]:
+        """Current snapshot of every operation."""
+        return {
+            name: histogram.snapshot()
+            for name, histogram in list(self._histograms.items())
+        }
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Percentile summary of every operation since startup."""
+        return {
+            name: snapshot.summary()
+            for name, snapshot in sorted(self.snapshots().items())
+        }
+
+    def flush(self) -> dict[str, dict[str, Any]]:
+        """Log one summary line per operation called since the last flush."""
+        from .logging import get_logger
+
+        logger = get_logger(__name__)
+        flushed: dict[str, dict[str, Any]] = {}
+        for name, snapshot in sorted(self.snapshots().items()):
+            previous = self._flushed.get(name)
+            interval = snapshot.since(previous) if previous else snapshot
+            self._flushed[name] = snapshot
+            if interval.count == 0:
+                continue
+            flushed[name] = interval.summary()
+            logger.info("Operation latency", operation=name, **flushed[name])
+        return flushed
+
+    def start_flushing(self, interval_seconds: float = 60.0) -> None:
+        """Flush summaries periodically in the background."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+
+        async def flush_periodically() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                self.flush()
+
+        self._flush_task = asyncio.create_task(flush_periodically())
+
+    async def stop_flushing(self) -> None:
+        """Stop periodic flushing and write a final summary."""
+        if self._flush_task is None:
+            return
+
+        self._flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._flush_task
+        self._flush_task = None
+        self.flush()
+
+    def collect(self) -> Iterator[Any]:
+        """Prometheus collector interface."""
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+        latency = HistogramMetricFamily(
+            "operation_duration_seconds",
+            "Latency of instrumented operations",
+            labels=["operation"],
+        )
+        errors = CounterMetricFamily(
+            "operation_errors",
+            "Failed calls of instrumented operations",
+            labels=["operation"],
+        )
+        for name, snapshot in sorted(self.snapshots().items()):
+            latency.add_metric(
+                [name], prometheus_buckets(snapshot), snapshot.sum_ns / 1e9
+            )
+            errors.add_metric([name], snapshot.errors)
+        yield latency
+        yield errors
+
+
+_operation_metrics: OperationMetrics | None = None
+
+
+def get_operation_metrics() -> OperationMetrics:
+    """Get the process-wide operation metrics, registered with Prometheus."""
+    global _operation_metrics
+    if _operation_metrics is None:
+        _operation_metrics = OperationMetrics()
+        try:
+            from prometheus_client import REGISTRY
+
+            REGISTRY.register(_operation_metrics)
+        except ImportError:
+            pass  # Export is optional; summaries and the API still work
+    return _operation_metrics
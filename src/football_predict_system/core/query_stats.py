@@ -0,0 +1,199 @@
+"""
+Per-statement database query statistics.
+
+The engine's cursor events record every executed statement here, keyed by a
+normalized fingerprint: literals and bind parameters become ``?`` and
+parameter lists collapse to ``(...)``, so the same query with different
+values, IN-list lengths or multi-row VALUES batches shares one entry. Each
+entry keeps the call count, latency histogram (see ``core.metrics``), rows
+reported by the driver and errors.
+
+The table is bounded: when it is full, the entry with the fewest calls is
+evicted to make room, like ``pg_stat_statements``. Statistics are exported
+to Prometheus and served by the monitoring API.
+"""
+
+import hashlib
+import re
+import threading
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+
+from .metrics import BUCKET_COUNT, HistogramSnapshot, bucket_index, prometheus_buckets
+
+# Longest fingerprint exported as a Prometheus label
+LABEL_LENGTH = 200
+
+_NORMALIZERS = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"(?<![:\w])(?::[A-Za-z_]\w*|%\(\w+\)s|\$\d+|%s)"), "?"),
+    (re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+"), "(...)"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so executions with different values match."""
+    for pattern, replacement in _NORMALIZERS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+class StatementStats:
+    """Counters for one statement fingerprint.
+
+    Unlike operation histograms these are not sharded per thread: a single
+    locked histogram keeps memory per statement fixed however many threads
+    run queries.
+    """
+
+    def __init__(self, statement: str) -> None:
+        self.statement = statement
+        self.id = hashlib.sha1(statement.encode()).hexdigest()[:16]
+        self.counts = [0] * BUCKET_COUNT
+        self.calls = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+        self.errors = 0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def record(self, duration_ns: int, rows: int, error: bool) -> None:
+        """Record one execution."""
+        index = bucket_index(duration_ns)
+        with self._lock:
+            self.counts[index] += 1
+            self.calls += 1
+            self.sum_ns += duration_ns
+            if duration_ns > self.max_ns:
+                self.max_ns = duration_ns
+            if rows > 0:
+                self.rows += rows
+            if error:
+                self.errors += 1
+
+    def snapshot(self) -> tuple[HistogramSnapshot, int]:
+        """Latency histogram and rows at this point in time."""
+        with self._lock:
+            return (
+                HistogramSnapshot(
+                    list(self.counts), self.sum_ns, self.max_ns, self.errors
+                ),
+                self.rows,
+            )
+
+    def summary(self) -> dict[str, Any]:
+        """Calls, latency percentiles in milliseconds, rows and errors."""
+        histogram, rows = self.snapshot()
+        return {
+            "id": self.id,
+            "statement": self.statement,
+            **histogram.summary(),
+            "total_ms": round(histogram.sum_ns / 1e6, 3),
+            "rows": rows,
+        }
+
+
+class QueryStats:
+    """Bounded registry of statement statistics by fingerprint."""
+
+    def __init__(self, max_statements: int = 500) -> None:
+        self.max_statements = max_statements
+        self.evictions = 0
+        self._statements: dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, statement: str, duration_ns: int, rows: int = -1, error: bool = False
+    ) -> None:
+        """Record one execution of a statement.
+
+        ``rows`` is the driver's rowcount: affected rows for writes, and
+        returned rows where the driver reports them (PostgreSQL, not
+        SQLite). Negative values mean unknown and are not counted.
+        """
+        key = fingerprint(statement)
+        stats = self._statements.get(key)
+        if stats is None:
+            stats = self._add(key)
+        stats.record(duration_ns, rows, error)
+
+    def _add(self, key: str) -> StatementStats:
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None:
+                if len(self._statements) >= self.max_statements:
+                    least_used = min(self._statements.values(), key=lambda s: s.calls)
+                    del self._statements[least_used.statement]
+                    self.evictions += 1
+                stats = self._statements[key] = StatementStats(key)
+        return stats
+
+    def summary(
+        self, limit: int | None = None, order_by: str = "total_ms"
+    ) -> list[dict[str, Any]]:
+        """Statement summaries, highest ``order_by`` first."""
+        summaries = [stats.summary() for stats in list(self._statements.values())]
+        summaries.sort(key=lambda s: s[order_by], reverse=True)
+        return summaries[:limit]
+
+    def reset(self) -> None:
+        """Discard all statistics."""
+        with self._lock:
+            self._statements = {}
+            self.evictions = 0
+
+    def collect(self) -> Iterator[Any]:
+        """Prometheus collector interface."""
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+        labels = ["statement_id", "statement"]
+        latency = HistogramMetricFamily(
+            "db_statement_duration_seconds",
+            "Latency of database statements by fingerprint",
+            labels=labels,
+        )
+        rows = CounterMetricFamily(
+            "db_statement_rows",
+            "Rows reported by the driver for database statements",
+            labels=labels,
+        )
+        errors = CounterMetricFamily(
+            "db_statement_errors",
+            "Failed executions of database statements",
+            labels=labels,
+        )
+        for stats in list(self._statements.values()):
+            histogram, row_count = stats.snapshot()
+            label_values = [stats.id, stats.statement[:LABEL_LENGTH]]
+            latency.add_metric(
+                label_values, prometheus_buckets(histogram), histogram.sum_ns / 1e9
+            )
+            rows.add_metric(label_values, row_count)
+            errors.add_metric(label_values, histogram.errors)
+        yield latency
+        yield rows
+        yield errors
+
+
+_query_stats: QueryStats | None = None
+
+
+def get_query_stats() -> QueryStats:
+    """Get the process-wide query statistics, registered with Prometheus."""
+    global _query_stats
+    if _query_stats is None:
+        from .config import get_settings
+
+        _query_stats = QueryStats(get_settings().database.query_stats_max_statements)
+        try:
+            from prometheus_client import REGISTRY
+
+            REGISTRY.register(_query_stats)
+        except ImportError:
+            pass  # Export is optional; the API still works
+    return _query_stats
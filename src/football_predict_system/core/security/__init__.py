@@ -12,9 +12,21 @@ Provides production-grade security features including:
 from collections.abc import Callable
 from typing import Any
 
-from .auth import AuthenticationService, JWTManager
-from .headers import SecurityHeaders
-from .models import Permission, SecurityConfig, User, UserRole
+from .api_keys import APIKeyStore, get_api_key_store, hash_api_key, require_api_key
+from .auth import (
+    AuthenticationService,
+    JWTManager,
+    PasswordHashPool,
+    get_auth_service,
+    get_password_hash_pool,
+)
+from .distributed_rate_limit import (
+    DistributedRateLimiter,
+    RateLimitMiddleware,
+    get_distributed_rate_limiter,
+)
+from .headers import SecurityHeaders, SecurityHeadersMiddleware
+from .models import APIKey, Permission, SecurityConfig, User, UserRole
 from .rate_limiter import RateLimiter
 
 
@@ -35,13 +47,25 @@ def require_permission(
 
 
 __all__ = [
+    "APIKey",
+    "APIKeyStore",
     "AuthenticationService",
+    "DistributedRateLimiter",
     "JWTManager",
+    "PasswordHashPool",
     "Permission",
+    "RateLimitMiddleware",
     "RateLimiter",
     "SecurityConfig",
     "SecurityHeaders",
+    "SecurityHeadersMiddleware",
     "User",
     "UserRole",
+    "get_api_key_store",
+    "get_auth_service",
+    "get_distributed_rate_limiter",
+    "get_password_hash_pool",
+    "hash_api_key",
+    "require_api_key",
     "require_permission",
 ]
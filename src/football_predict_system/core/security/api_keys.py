@@ -0,0 +1,275 @@
+"""
+API key store for programmatic clients.
+
+Only SHA-256 hashes of keys are persisted, together with the owner, role
+and an optional per-key quota. Every worker keeps all active keys in a
+hash map loaded at startup, so authenticating a request is one hash and one
+dict lookup with no I/O. Changes are announced on a pub/sub channel of the
+cache backend and each worker reloads the map from the primary when
+notified. The map is also reloaded periodically, from a read replica when
+one is configured, to cover missed or unavailable notifications.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import secrets
+from datetime import datetime
+from typing import Any, cast
+
+from fastapi import Header, HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.engine import CursorResult
+
+from ..logging import get_logger
+from .models import APIKey, UserRole
+
+logger = get_logger(__name__)
+
+
+def hash_api_key(api_key: str) -> str:
+    """Hash an API key for storage and lookup."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+class APIKeyStore:
+    """Persisted API keys with an in-memory lookup table per worker."""
+
+    def __init__(self, refresh_interval: float | None = None) -> None:
+        from ..config import get_settings
+
+        self.settings = get_settings()
+        self.logger = get_logger(__name__)
+        self.refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else self.settings.api.api_key_refresh_interval
+        )
+        self.channel = f"{self.settings.app_name}:api_keys"
+        self._keys: dict[str, APIKey] = {}
+        self._revoked: set[str] = set()
+        self._listener: asyncio.Task[None] | None = None
+        self._refresher: asyncio.Task[None] | None = None
+        self._memory_queue: asyncio.Queue[bytes] | None = None
+
+    def __len__(self) -> int:
+        """Number of active keys held in memory."""
+        return len(self._keys)
+
+    def authenticate(self, api_key: str) -> APIKey | None:
+        """Resolve a presented key; O(1) and without I/O."""
+        record = self._keys.get(hash_api_key(api_key))
+        if record is None or record.is_expired(datetime.utcnow()):
+            return None
+        return record
+
+    async def load(self, read_only: bool = False) -> int:
+        """
+        Replace the in-memory table with the active keys in the database.
+
+        With ``read_only=True`` the keys may come from a lagging replica, so
+        keys this worker has already seen revoked are left out.
+        """
+        from ..database import get_database_manager
+
+        try:
+            async with get_database_manager().get_async_session(
+                read_only=read_only
+            ) as session:
+                result = await session.execute(
+                    text("""
+                    SELECT key_hash, name, user_id, role,
+                           requests_per_minute, expires_at
+                    FROM api_keys
+                    WHERE revoked_at IS NULL
+                    """)
+                )
+                rows = result.mappings().all()
+        except Exception as e:
+            self.logger.warning("Failed to load API keys", error=str(e))
+            return len(self._keys)
+
+        keys = {row["key_hash"]: APIKey(**row) for row in rows}
+        if read_only:
+            keys = {h: key for h, key in keys.items() if h not in self._revoked}
+        else:
+            # Keys are never reinstated, so whatever the primary dropped is revoked
+            self._revoked.update(self._keys.keys() - keys.keys())
+
+        # Swap in a complete table so lookups never see a partial load
+        self._keys = keys
+        self.logger.info("API keys loaded", count=len(self._keys))
+        return len(self._keys)
+
+    async def create_key(
+        self,
+        user_id: str,
+        name: str,
+        role: UserRole = UserRole.API_CLIENT,
+        requests_per_minute: int | None = None,
+        expires_at: datetime | None = None,
+    ) -> str:
+        """
+        Create and persist a new API key.
+
+        Returns:
+            The key itself; it is not stored and cannot be recovered later
+        """
+        from ..database import get_database_manager
+
+        api_key = secrets.token_urlsafe(32)
+        record = APIKey(
+            key_hash=hash_api_key(api_key),
+            name=name,
+            user_id=user_id,
+            role=role,
+            requests_per_minute=requests_per_minute,
+            expires_at=expires_at,
+        )
+
+        async with get_database_manager().get_async_session() as session:
+            await session.execute(
+                text("""
+                INSERT INTO api_keys
+                    (key_hash, name, user_id, role, requests_per_minute, expires_at)
+                VALUES
+                    (:key_hash, :name, :user_id, :role,
+                     :requests_per_minute, :expires_at)
+                """),
+                {**record.model_dump(), "role": role.value},
+            )
+
+        self._keys[record.key_hash] = record
+        await self._notify(record.key_hash)
+        self.logger.info("API key created", user_id=user_id, key_name=name)
+        return api_key
+
+    async def revoke_key(self, key_hash: str) -> bool:
+        """Revoke a key by its hash on every worker."""
+        from ..database import get_database_manager
+
+        async with get_database_manager().get_async_session() as session:
+            result = cast(
+                CursorResult[Any],
+                await session.execute(
+                    text("""
+                    UPDATE api_keys SET revoked_at = CURRENT_TIMESTAMP
+                    WHERE key_hash = :key_hash AND revoked_at IS NULL
+                    """),
+                    {"key_hash": key_hash},
+                ),
+            )
+            revoked = bool(result.rowcount)
+
+        self._keys.pop(key_hash, None)
+        self._revoked.add(key_hash)
+        await self._notify(key_hash)
+        self.logger.info("API key revoked", revoked=revoked)
+        return revoked
+
+    async def _notify(self, key_hash: str) -> None:
+        """Tell other workers that a key changed."""
+        from ..cache import get_cache_manager
+
+        try:
+            client = await (await get_cache_manager()).get_redis_client()
+            await client.publish(self.channel, key_hash)
+        except Exception as e:
+            self.logger.warning(
+                "Failed to publish API key change; workers will pick it up "
+                "on their next refresh",
+                error=str(e),
+            )
+
+    async def _follow_notifications(self, catch_up: bool = False) -> None:
+        """
+        Reload the table whenever a change is announced.
+
+        With ``catch_up`` the table is reloaded from the primary once
+        subscribed, for changes announced while not subscribed.
+        """
+        from ..cache import get_cache_manager
+
+        client: Any = await (await get_cache_manager()).get_redis_client()
+
+        if hasattr(client, "pubsub"):
+            pubsub = client.pubsub()
+            await pubsub.subscribe(self.channel)
+            if catch_up:
+                await self.load()
+            try:
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        await self.load()
+            finally:
+                await pubsub.aclose()
+        else:
+            # In-memory cache backend; subscribed once as it cannot unsubscribe
+            if self._memory_queue is None:
+                self._memory_queue = client.subscribe(self.channel)
+            while True:
+                await self._memory_queue.get()
+                await self.load()
+
+    def start_listening(self) -> None:
+        """Follow change notifications and reload the table periodically."""
+        if self._listener is not None and not self._listener.done():
+            return
+
+        async def listen() -> None:
+            # One long-lived subscription, re-established after failures
+            catch_up = False
+            while True:
+                try:
+                    await self._follow_notifications(catch_up)
+                except Exception as e:
+                    self.logger.warning(
+                        "API key notifications unavailable", error=str(e)
+                    )
+                await asyncio.sleep(self.refresh_interval)
+                catch_up = True
+
+        async def refresh() -> None:
+            # Covers missed or unavailable notifications
+            while True:
+                await asyncio.sleep(self.refresh_interval)
+                await self.load(read_only=True)
+
+        self._listener = asyncio.create_task(listen())
+        self._refresher = asyncio.create_task(refresh())
+
+    async def stop_listening(self) -> None:
+        """Stop following change notifications."""
+        for task in (self._listener, self._refresher):
+            if task is None:
+                continue
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._listener = None
+        self._refresher = None
+
+
+_api_key_store: APIKeyStore | None = None
+
+
+def get_api_key_store() -> APIKeyStore:
+    """Get the process-wide API key store."""
+    global _api_key_store
+    if _api_key_store is None:
+        _api_key_store = APIKeyStore()
+    return _api_key_store
+
+
+async def require_api_key(
+    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
+) -> APIKey:
+    """FastAPI dependency authenticating a request by its ``X-API-Key``."""
+    record = get_api_key_store().authenticate(x_api_key) if x_api_key else None
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing API key",
+            headers={"WWW-Authenticate": "APIKey"},
+        )
+    return record
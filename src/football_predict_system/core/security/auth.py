@@ -4,29 +4,54 @@ Authentication and authorization services.
 Handles JWT-based authentication and role-based authorization.
 """
 
+import asyncio
 import hashlib
-import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import bcrypt
 import jwt
 
 from football_predict_system.core.config import get_settings
-from football_predict_system.core.exceptions import UnauthorizedError
+from football_predict_system.core.exceptions import RateLimitError, UnauthorizedError
 from football_predict_system.core.logging import get_logger
 
+from .api_keys import get_api_key_store
 from .models import SecurityConfig, TokenPayload, UserRole
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+def _token_digest(token: str) -> bytes:
+    """Short digest identifying a token without keeping the token itself."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
 
 class JWTManager:
-    """Manages JWT token operations."""
+    """
+    Manages JWT token operations.
+
+    Successfully verified tokens are cached by digest until their ``exp``, so
+    a token presented again skips signature verification and payload
+    parsing. Revoked tokens and users are rejected on both paths.
+    """
 
     def __init__(self, config: SecurityConfig):
         self.config = config
         self.logger = get_logger(__name__)
+        # Verified payloads by token digest, least recently used first
+        self._verified: OrderedDict[bytes, TokenPayload] = OrderedDict()
+        # Revoked token digests -> exp; users -> latest revoked iat
+        self._revoked_tokens: dict[bytes, int] = {}
+        self._revoked_users: dict[str, int] = {}
+        self._lock = threading.Lock()
 
     def create_access_token(self, user_id: str, role: UserRole) -> str:
         """Create JWT access token."""
@@ -48,6 +73,74 @@ class JWTManager:
 
     def verify_token(self, token: str) -> TokenPayload:
         """Verify and decode JWT token."""
+        digest = _token_digest(token)
+
+        with self._lock:
+            cached = self._verified.get(digest)
+            if cached is not None:
+                if cached.exp > time.time():
+                    self._verified.move_to_end(digest)
+                    return cached
+                del self._verified[digest]
+
+        payload = self._decode_token(token)
+
+        with self._lock:
+            if digest in self._revoked_tokens or payload.iat <= (
+                self._revoked_users.get(payload.user_id, -1)
+            ):
+                self.logger.warning("Revoked token presented", user_id=payload.user_id)
+                raise UnauthorizedError("Token revoked")
+
+            if self.config.token_cache_size > 0:
+                self._verified[digest] = payload
+                if len(self._verified) > self.config.token_cache_size:
+                    self._verified.popitem(last=False)
+
+        return payload
+
+    def revoke_token(self, token: str) -> None:
+        """Reject a token from now on, even though it has not expired."""
+        try:
+            payload = self._decode_token(token)
+        except UnauthorizedError:
+            return  # Already unusable
+
+        digest = _token_digest(token)
+        now = time.time()
+        with self._lock:
+            self._verified.pop(digest, None)
+            self._revoked_tokens = {
+                d: exp for d, exp in self._revoked_tokens.items() if exp > now
+            }
+            self._revoked_tokens[digest] = payload.exp
+
+        self.logger.info("Token revoked", user_id=payload.user_id)
+
+    def revoke_user(self, user_id: str) -> None:
+        """Reject every token issued to a user up to now."""
+        now = int(time.time())
+        # Tokens issued before this are expired and need no record
+        horizon = now - self.config.jwt_expire_minutes * 60
+        with self._lock:
+            self._revoked_users = {
+                uid: iat for uid, iat in self._revoked_users.items() if iat > horizon
+            }
+            self._revoked_users[user_id] = now
+            for digest in [
+                d for d, p in self._verified.items() if p.user_id == user_id
+            ]:
+                del self._verified[digest]
+
+        self.logger.info("User tokens revoked", user_id=user_id)
+
+    def clear_token_cache(self) -> None:
+        """Forget all verified tokens, e.g. after rotating the signing key."""
+        with self._lock:
+            self._verified.clear()
+
+    def _decode_token(self, token: str) -> TokenPayload:
+        """Verify the signature and claims of a token."""
         try:
             payload = jwt.decode(
                 token,
@@ -73,6 +166,80 @@ class JWTManager:
             raise UnauthorizedError("Token verification failed")
 
 
+class PasswordHashPool:
+    """
+    Dedicated threads for bcrypt work.
+
+    bcrypt costs hundreds of milliseconds of CPU per call and releases the
+    GIL while hashing, so running it here keeps the event loop serving other
+    requests. At most ``max_workers`` hashes run at once and ``max_queue``
+    wait; further calls are rejected instead of building an unbounded
+    backlog during a login burst.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 32) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.logger = get_logger(__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt"
+        )
+        self._pending = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Calls running or queued."""
+        return self._pending
+
+    @property
+    def rejected(self) -> int:
+        """Calls rejected because the queue was full."""
+        return self._rejected
+
+    def _release(self, _: Future[Any]) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a call on the pool, or reject it if the backlog is full."""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                self.logger.warning(
+                    "Password hashing backlog full, rejecting",
+                    pending=self._pending,
+                    rejected=self._rejected,
+                )
+                raise RateLimitError("Too many concurrent logins", retry_after=1)
+            self._pending += 1
+
+        # Counted until the thread finishes, even if the caller goes away
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_password_hash_pool: PasswordHashPool | None = None
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """Get the process-wide password hashing pool."""
+    global _password_hash_pool
+    if _password_hash_pool is None:
+        api = get_settings().api
+        _password_hash_pool = PasswordHashPool(
+            max_workers=api.password_hash_workers,
+            max_queue=api.password_hash_max_queue,
+        )
+    return _password_hash_pool
+
+
 class AuthenticationService:
     """Handles user authentication and authorization."""
 
@@ -87,14 +254,11 @@ class AuthenticationService:
             )
         )
 
-    def create_api_key(self, user_id: str, name: str) -> str:
-        """Create API key for programmatic access."""
-        # Create a unique API key
-        key_data = f"{user_id}:{name}:{secrets.token_urlsafe(32)}"
-        api_key = hashlib.sha256(key_data.encode()).hexdigest()
-
-        self.logger.info("API key created", user_id=user_id, key_name=name)
-        return api_key
+    async def create_api_key(
+        self, user_id: str, name: str, role: UserRole = UserRole.API_CLIENT
+    ) -> str:
+        """Create API key for programmatic access in the hashed key store."""
+        return await get_api_key_store().create_key(user_id, name, role)
 
     def hash_password(self, password: str) -> str:
         """Hash password using bcrypt."""
@@ -105,27 +269,68 @@ class AuthenticationService:
         """Verify password against hash."""
         return bool(bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8")))
 
+    async def hash_password_async(self, password: str) -> str:
+        """Hash password off the event loop."""
+        return await get_password_hash_pool().run(self.hash_password, password)
+
+    async def verify_password_async(self, password: str, hashed: str) -> bool:
+        """Verify password against hash off the event loop."""
+        return await get_password_hash_pool().run(
+            self.verify_password, password, hashed
+        )
+
     def authenticate_user(self, username: str, password: str) -> dict[str, Any] | None:
         """Authenticate user credentials."""
+        admin_username, password_hash = self._admin_credentials()
+        if username != admin_username:
+            return None
+
+        if password_hash:
+            if self.verify_password(password, password_hash):
+                return self._admin_user(admin_username)
+            return None
+        return self._demo_login(admin_username, password)
+
+    async def authenticate_user_async(
+        self, username: str, password: str
+    ) -> dict[str, Any] | None:
+        """Authenticate user credentials, checking hashes off the event loop."""
+        admin_username, password_hash = self._admin_credentials()
+        if username != admin_username:
+            return None
+
+        if password_hash:
+            if await self.verify_password_async(password, password_hash):
+                return self._admin_user(admin_username)
+            return None
+        return self._demo_login(admin_username, password)
+
+    def _admin_credentials(self) -> tuple[str, str | None]:
+        """Admin username and bcrypt password hash, if one is configured."""
         # Get admin credentials from environment variables only
         # Settings class doesn't have security attribute
         import os
 
-        admin_username = os.getenv("ADMIN_USERNAME", "admin")
-        demo_password = os.getenv("ADMIN_PASSWORD", "admin")
+        return os.getenv("ADMIN_USERNAME", "admin"), os.getenv("ADMIN_PASSWORD_HASH")
 
-        if username == admin_username:
-            # Fallback for demo/testing - should be removed in production
-            if password == demo_password:
-                self.logger.warning("Using demo credentials - not for production use")
-                return {
-                    "user_id": "admin_user",
-                    "username": admin_username,
-                    "role": UserRole.ADMIN,
-                }
+    def _demo_login(self, admin_username: str, password: str) -> dict[str, Any] | None:
+        """Check the plain-text demo password."""
+        import os
 
+        # Fallback for demo/testing - should be removed in production
+        if password == os.getenv("ADMIN_PASSWORD", "admin"):
+            self.logger.warning("Using demo credentials - not for production use")
+            return self._admin_user(admin_username)
         return None
 
+    @staticmethod
+    def _admin_user(admin_username: str) -> dict[str, Any]:
+        return {
+            "user_id": "admin_user",
+            "username": admin_username,
+            "role": UserRole.ADMIN,
+        }
+
     def authorize_role(self, user_role: UserRole, required_role: UserRole) -> bool:
         """Check if user role has required permissions."""
         role_hierarchy = {
@@ -139,3 +344,14 @@ class AuthenticationService:
         required_level = role_hierarchy.get(required_role, 0)
 
         return user_level >= required_level
+
+
+_auth_service: AuthenticationService | None = None
+
+
+def get_auth_service() -> AuthenticationService:
+    """Get the process-wide authentication service."""
+    global _auth_service
+    if _auth_service is None:
+        _auth_service = AuthenticationService()
+    return _auth_service
@@ -0,0 +1,401 @@
+"""
+Distributed rate limiting shared by every worker and node.
+
+Budgets live in Redis and are enforced by a single Lua script implementing
+GCRA (generic cell rate algorithm): each bucket stores one timestamp, the
+theoretical arrival time, and a request is admitted while that timestamp is
+at most one window ahead of the Redis clock. The script returns everything
+needed for the ``X-RateLimit-*`` headers, so no extra round-trip is made.
+
+To keep Redis off the hot path, each worker takes a small local lease after
+an admitted request: it may serve a share of the reported remaining budget
+on its own for a short time, and the requests it served are charged to the
+bucket on the next script call. When Redis is unavailable the in-process
+``RateLimiter`` takes over until Redis can be retried.
+"""
+
+import json
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from redis.exceptions import RedisError
+
+from ..exceptions import RateLimitError, UnauthorizedError
+from ..logging import get_logger
+from .api_keys import get_api_key_store
+from .auth import get_auth_service
+from .models import SecurityConfig, UserRole
+from .rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from ..config import RateLimitConfig
+
+logger = get_logger(__name__)
+
+# Upper bound on local leases kept per worker
+MAX_LOCAL_LEASES = 10_000
+
+# KEYS[1] bucket; ARGV[1] emission interval (ms), ARGV[2] window (ms),
+# ARGV[3] requests already served from a local lease.
+# Returns {allowed, remaining, reset_after_ms, retry_after_ms}.
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local served = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = clock[1] * 1000 + clock[2] / 1000
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+  tat = now
+end
+-- Requests served from a local lease are always charged
+tat = tat + served * interval
+
+local allowed = 0
+local retry_after = 0
+local new_tat = tat + interval
+if new_tat - now <= window then
+  allowed = 1
+  tat = new_tat
+else
+  retry_after = new_tat - now - window
+end
+
+if tat > now then
+  redis.call('SET', KEYS[1], string.format('%.3f', tat), 'PX', math.ceil(tat - now))
+end
+
+local remaining = math.floor((window - (tat - now)) / interval)
+if remaining < 0 then
+  remaining = 0
+end
+return {allowed, remaining, math.ceil(tat - now), math.ceil(retry_after)}
+"""
+
+
+class RateLimitDecision:
+    """Outcome of a rate limit check."""
+
+    __slots__ = ("allowed", "limit", "remaining", "reset_after", "retry_after")
+
+    def __init__(
+        self,
+        allowed: bool,
+        limit: int,
+        remaining: int,
+        reset_after: float,
+        retry_after: float = 0.0,
+    ) -> None:
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        # Seconds until the bucket is completely refilled
+        self.reset_after = reset_after
+        # Seconds until the next request would be admitted (denials only)
+        self.retry_after = retry_after
+
+    def headers(self) -> list[tuple[bytes, bytes]]:
+        """Encoded ``X-RateLimit-*`` response headers."""
+        headers = [
+            (b"x-ratelimit-limit", str(self.limit).encode()),
+            (b"x-ratelimit-remaining", str(self.remaining).encode()),
+            (b"x-ratelimit-reset", str(math.ceil(self.reset_after)).encode()),
+        ]
+        if not self.allowed:
+            retry_after = max(1, math.ceil(self.retry_after))
+            headers.append((b"retry-after", str(retry_after).encode()))
+        return headers
+
+
+class _LocalLease:
+    """Share of a bucket a worker may serve without asking Redis."""
+
+    __slots__ = ("allowance", "expires_at", "limit", "pending", "remaining", "reset_at")
+
+    def __init__(
+        self, decision: RateLimitDecision, allowance: int, now: float, ttl: float
+    ) -> None:
+        self.limit = decision.limit
+        self.remaining = decision.remaining
+        self.reset_at = now + decision.reset_after
+        self.allowance = allowance
+        self.expires_at = now + ttl
+        # Requests served locally, not yet charged in Redis
+        self.pending = 0
+
+
+class DistributedRateLimiter:
+    """GCRA rate limiter backed by Redis with local leases and a fallback."""
+
+    def __init__(
+        self,
+        config: "RateLimitConfig",
+        client: Any | None = None,
+        fallback: RateLimiter | None = None,
+    ) -> None:
+        self.config = config
+        self.logger = get_logger(__name__)
+        self._client = client
+        self._script: Any | None = None
+        self._leases: OrderedDict[str, _LocalLease] = OrderedDict()
+        self._redis_down_until = 0.0
+        self.fallback = fallback or RateLimiter(
+            SecurityConfig(jwt_secret_key="rate-limit-fallback")
+        )
+
+    async def _get_script(self) -> Any | None:
+        """Register the GCRA script on the shared client, if it supports it."""
+        if self._script is not None:
+            return self._script
+
+        if self._client is None:
+            from ..cache import get_cache_manager
+
+            cache_manager = await get_cache_manager()
+            self._client = await cache_manager.get_redis_client()
+
+        # The in-memory cache backend has no scripting; that deployment is a
+        # single process, where the in-process limiter is already exact
+        if hasattr(self._client, "register_script"):
+            self._script = self._client.register_script(GCRA_SCRIPT)
+        return self._script
+
+    def _take_lease(self, key: str, now: float) -> RateLimitDecision | None:
+        """Serve a request from a local lease if one clearly allows it."""
+        lease = self._leases.get(key)
+        if lease is None or now >= lease.expires_at or lease.pending >= lease.allowance:
+            return None
+
+        lease.pending += 1
+        return RateLimitDecision(
+            allowed=True,
+            limit=lease.limit,
+            remaining=max(0, lease.remaining - lease.pending),
+            reset_after=max(0.0, lease.reset_at - now),
+        )
+
+    def _grant_lease(self, key: str, decision: RateLimitDecision, now: float) -> None:
+        """Remember a share of the remaining budget for local use."""
+        allowance = int(decision.remaining * self.config.local_fraction)
+        if not decision.allowed or allowance <= 0:
+            self._leases.pop(key, None)
+            return
+
+        self._leases[key] = _LocalLease(decision, allowance, now, self.config.local_ttl)
+        self._leases.move_to_end(key)
+        while len(self._leases) > MAX_LOCAL_LEASES:
+            self._leases.popitem(last=False)
+
+    def _check_fallback(
+        self, key: str, limit: int, window_seconds: int
+    ) -> RateLimitDecision:
+        """Check against the in-process limiter."""
+        allowed = self.fallback.is_allowed(key, window_seconds, limit)
+        remaining = self.fallback.get_remaining_requests(key, window_seconds, limit)
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=limit,
+            remaining=remaining,
+            reset_after=window_seconds,
+            retry_after=0.0 if allowed else window_seconds / limit,
+        )
+
+    async def check(
+        self, key: str, limit: int, window_seconds: int
+    ) -> RateLimitDecision:
+        """
+        Admit or deny one request against a bucket.
+
+        Args:
+            key: Bucket identifier (route and client)
+            limit: Requests allowed per window
+            window_seconds: Window length in seconds
+
+        Returns:
+            The decision, including values for the response headers
+        """
+        now = time.monotonic()
+        decision = self._take_lease(key, now)
+        if decision is not None:
+            return decision
+
+        if now < self._redis_down_until:
+            return self._check_fallback(key, limit, window_seconds)
+
+        lease = self._leases.pop(key, None)
+        served = lease.pending if lease is not None else 0
+        window_ms = window_seconds * 1000
+
+        try:
+            script = await self._get_script()
+            if script is None:
+                return self._check_fallback(key, limit, window_seconds)
+            allowed, remaining, reset_ms, retry_ms = await script(
+                keys=[f"{self.config.key_prefix}:{key}"],
+                args=[window_ms / limit, window_ms, served],
+            )
+        except (RedisError, OSError) as e:
+            self._redis_down_until = now + self.config.redis_retry_seconds
+            self.logger.warning(
+                "Redis rate limiting unavailable, using in-process limiter",
+                error=str(e),
+                retry_in=self.config.redis_retry_seconds,
+            )
+            return self._check_fallback(key, limit, window_seconds)
+
+        decision = RateLimitDecision(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=int(remaining),
+            reset_after=int(reset_ms) / 1000,
+            retry_after=int(retry_ms) / 1000,
+        )
+        self._grant_lease(key, decision, now)
+        return decision
+
+
+class RateLimitMiddleware:
+    """ASGI middleware enforcing per-route and per-role rate limits."""
+
+    def __init__(
+        self,
+        app: Callable[..., Any],
+        config: "RateLimitConfig | None" = None,
+        limiter: DistributedRateLimiter | None = None,
+        identify: Callable[[dict[str, Any]], tuple[str, str, int | None]] | None = None,
+    ) -> None:
+        self.app = app
+        self.logger = get_logger(__name__)
+        if config is None:
+            from ..config import get_settings
+
+            config = get_settings().rate_limit
+        self.config = config
+        self.limiter = limiter or DistributedRateLimiter(config)
+        self.identify = identify or identify_client
+        # Longest prefix first, so the most specific route limit wins
+        self._routes = sorted(config.route_limits.items(), key=lambda r: -len(r[0]))
+        self._exempt = tuple(config.exempt_paths)
+
+    def resolve_limit(
+        self, path: str, role: str, quota: int | None = None
+    ) -> tuple[str, int]:
+        """
+        Bucket name and budget for a path and role.
+
+        A caller's own quota (requests per minute, e.g. from its API key)
+        replaces the role-scaled budget.
+        """
+        route, base = "*", self.config.requests
+        for prefix, limit in self._routes:
+            if path.startswith(prefix):
+                route, base = prefix, limit
+                break
+
+        if quota is not None:
+            return route, max(1, round(quota * self.config.window_seconds / 60))
+
+        multiplier = self.config.role_multipliers.get(role, 1.0)
+        return route, max(1, int(base * multiplier))
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[..., Any],
+        send: Callable[..., Any],
+    ) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.config.enabled
+            or scope["path"].startswith(self._exempt)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        identity, role, quota = self.identify(scope)
+        route, limit = self.resolve_limit(scope["path"], role, quota)
+        decision = await self.limiter.check(
+            f"{route}:{identity}", limit, self.config.window_seconds
+        )
+        headers = decision.headers()
+
+        if not decision.allowed:
+            await self._reject(send, decision, headers)
+            return
+
+        async def send_with_headers(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    async def _reject(
+        self,
+        send: Callable[..., Any],
+        decision: RateLimitDecision,
+        headers: list[tuple[bytes, bytes]],
+    ) -> None:
+        """Send a 429 response."""
+        error = RateLimitError(retry_after=max(1, math.ceil(decision.retry_after)))
+        body = json.dumps(error.to_dict()).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    *headers,
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def identify_client(scope: dict[str, Any]) -> tuple[str, str, int | None]:
+    """
+    Identify the caller of a request.
+
+    API clients are limited per key with the key's role and quota, token
+    holders per user and role, and everyone else per client address as a
+    guest.
+
+    Returns:
+        Identity, role and the caller's own quota (requests per minute)
+    """
+    for name, value in scope.get("headers", []):
+        if name == b"x-api-key":
+            record = get_api_key_store().authenticate(value.decode("latin-1"))
+            if record is not None:
+                identity = f"key:{record.key_hash[:16]}"
+                return identity, record.role.value, record.requests_per_minute
+        elif name == b"authorization" and value[:7].lower() == b"bearer ":
+            try:
+                payload = get_auth_service().jwt_manager.verify_token(
+                    value[7:].decode("latin-1")
+                )
+            except UnauthorizedError:
+                continue
+            return f"user:{payload.user_id}", payload.role.value, None
+
+    client = scope.get("client")
+    host = client[0] if client else "unknown"
+    return f"ip:{host}", UserRole.GUEST.value, None
+
+
+_distributed_rate_limiter: DistributedRateLimiter | None = None
+
+
+def get_distributed_rate_limiter() -> DistributedRateLimiter:
+    """Get the process-wide distributed rate limiter."""
+    global _distributed_rate_limiter
+    if _distributed_rate_limiter is None:
+        from ..config import get_settings
+
+        _distributed_rate_limiter = DistributedRateLimiter(get_settings().rate_limit)
+    return _distributed_rate_limiter
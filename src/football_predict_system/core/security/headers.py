@@ -1,9 +1,13 @@
 """
 Security headers management for HTTP responses.
 
-Provides secure header configuration for API responses.
+Provides secure header configuration for API responses and an ASGI
+middleware that adds it to every response.
 """
 
+from collections.abc import Callable
+from typing import Any
+
 
 class SecurityHeaders:
     """Security headers configuration for HTTP responses."""
@@ -26,3 +30,55 @@ class SecurityHeaders:
         security_headers = SecurityHeaders.get_security_headers()
         response_headers.update(security_headers)
         return response_headers
+
+    @staticmethod
+    def get_raw_headers(
+        headers: dict[str, str] | None = None,
+    ) -> list[tuple[bytes, bytes]]:
+        """Get security headers encoded as ASGI raw header pairs."""
+        if headers is None:
+            headers = SecurityHeaders.get_security_headers()
+        return [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        ]
+
+
+class SecurityHeadersMiddleware:
+    """
+    ASGI middleware adding security headers to every HTTP response.
+
+    The headers are encoded once at startup and appended to the
+    ``http.response.start`` message, so the response body is passed through
+    untouched. Headers of the same name set by the application are replaced.
+    """
+
+    def __init__(
+        self, app: Callable[..., Any], headers: dict[str, str] | None = None
+    ) -> None:
+        self.app = app
+        self.raw_headers = SecurityHeaders.get_raw_headers(headers)
+        self._names = frozenset(name for name, _ in self.raw_headers)
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[..., Any],
+        send: Callable[..., Any],
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", ())
+                names = self._names
+                # Copy rather than extend: the list may belong to a Response
+                message["headers"] = [
+                    *(h for h in headers if h[0].lower() not in names),
+                    *self.raw_headers,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
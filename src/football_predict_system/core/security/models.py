@@ -77,6 +77,9 @@ class SecurityConfig(BaseModel):
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 30
 
+    # Verified tokens remembered until they expire (0 disables the cache)
+    token_cache_size: int = 10_000
+
     # Rate limiting
     requests_per_minute: int = 60
     burst_size: int = 10
@@ -92,6 +95,22 @@ class SecurityConfig(BaseModel):
         return str(v)
 
 
+class APIKey(BaseModel):
+    """Stored API key; the key itself is only known to its holder."""
+
+    key_hash: str
+    name: str
+    user_id: str
+    role: UserRole = UserRole.API_CLIENT
+    # Per-key quota overriding the rate limit budget
+    requests_per_minute: int | None = None
+    expires_at: datetime | None = None
+
+    def is_expired(self, now: datetime) -> bool:
+        """Check if the key has expired."""
+        return self.expires_at is not None and self.expires_at <= now
+
+
 class TokenPayload(BaseModel):
     """JWT token payload structure."""
 
@@ -2,21 +2,81 @@
 Rate limiting functionality for API security.
 
 Provides configurable rate limiting to prevent abuse and ensure fair usage.
+
+Limits use a sliding-window counter: each identifier keeps the request count
+of the current and previous fixed window, and the previous count is weighted
+by how much of it still overlaps the sliding window. State is constant size
+per identifier and every check is O(1). Identifiers are kept in least
+recently seen order, so idle ones are evicted from the front without
+scanning the whole table.
 """
 
+import asyncio
+import contextlib
 import time
-from collections import defaultdict
+from collections import OrderedDict
 
+from ..logging import get_logger
 from .models import SecurityConfig
 
+logger = get_logger(__name__)
+
+# Identifiers evicted per step before background eviction yields to the loop
+EVICTION_CHUNK_SIZE = 10_000
+
+
+class _WindowCounter:
+    """Sliding-window counter state for one identifier."""
+
+    __slots__ = ("current", "last_seen", "previous", "window", "window_index")
+
+    def __init__(self, window: int, window_index: int, now: float) -> None:
+        self.window = window
+        self.window_index = window_index
+        self.current = 0
+        self.previous = 0
+        self.last_seen = now
+
 
 class RateLimiter:
-    """Simple in-memory rate limiter for API endpoints."""
+    """In-memory sliding-window rate limiter for API endpoints."""
 
-    def __init__(self, config: SecurityConfig) -> None:
+    def __init__(self, config: SecurityConfig, idle_seconds: float = 120.0) -> None:
         """Initialize rate limiter with configuration."""
         self.config = config
-        self.requests: dict[str, list[float]] = defaultdict(list)
+        self.logger = get_logger(__name__)
+        # Identifiers are forgotten after this long without requests; raised
+        # to two windows so that forgetting never loses live state
+        self.idle_seconds = idle_seconds
+        self._counters: OrderedDict[str, _WindowCounter] = OrderedDict()
+        self._eviction_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        """Number of tracked identifiers."""
+        return len(self._counters)
+
+    def _counter(
+        self, identifier: str, window_seconds: int, now: float
+    ) -> tuple[_WindowCounter, float]:
+        """Get the counter for identifier and its current estimated count."""
+        window_index = int(now // window_seconds)
+        counter = self._counters.get(identifier)
+
+        if counter is None or counter.window != window_seconds:
+            counter = _WindowCounter(window_seconds, window_index, now)
+            self._counters[identifier] = counter
+            if 2 * window_seconds > self.idle_seconds:
+                self.idle_seconds = 2 * window_seconds
+        elif window_index != counter.window_index:
+            # Roll forward; anything older than one window no longer counts
+            adjacent = window_index == counter.window_index + 1
+            counter.previous = counter.current if adjacent else 0
+            counter.current = 0
+            counter.window_index = window_index
+
+        elapsed = now - window_index * window_seconds
+        weight = 1.0 - elapsed / window_seconds
+        return counter, counter.previous * weight + counter.current
 
     def is_allowed(
         self, identifier: str, window_seconds: int = 60, max_requests: int = 100
@@ -33,38 +93,72 @@ class RateLimiter:
             True if request is allowed, False otherwise
         """
         current_time = time.time()
+        counter, estimated = self._counter(identifier, window_seconds, current_time)
 
-        # Clean old requests outside the window
-        self.requests[identifier] = [
-            req_time
-            for req_time in self.requests[identifier]
-            if current_time - req_time < window_seconds
-        ]
+        counter.last_seen = current_time
+        self._counters.move_to_end(identifier)
 
         # Check if limit exceeded
-        if len(self.requests[identifier]) >= max_requests:
+        if estimated >= max_requests:
             return False
 
-        # Add current request
-        self.requests[identifier].append(current_time)
+        counter.current += 1
         return True
 
     def get_remaining_requests(
         self, identifier: str, window_seconds: int = 60, max_requests: int = 100
     ) -> int:
         """Get number of remaining requests for identifier."""
-        current_time = time.time()
-
-        # Clean old requests
-        self.requests[identifier] = [
-            req_time
-            for req_time in self.requests[identifier]
-            if current_time - req_time < window_seconds
-        ]
+        if identifier not in self._counters:
+            return max(0, max_requests)
 
-        return max(0, max_requests - len(self.requests[identifier]))
+        _, estimated = self._counter(identifier, window_seconds, time.time())
+        return max(0, int(max_requests - estimated))
 
     def reset_limit(self, identifier: str) -> None:
         """Reset rate limit for identifier."""
-        if identifier in self.requests:
-            del self.requests[identifier]
+        self._counters.pop(identifier, None)
+
+    def evict_idle(self, now: float | None = None, limit: int | None = None) -> int:
+        """Forget up to ``limit`` identifiers idle for ``idle_seconds``."""
+        cutoff = (time.time() if now is None else now) - self.idle_seconds
+        evicted = 0
+
+        while self._counters and (limit is None or evicted < limit):
+            identifier, counter = next(iter(self._counters.items()))
+            if counter.last_seen > cutoff:
+                break
+            del self._counters[identifier]
+            evicted += 1
+
+        if evicted:
+            self.logger.debug(
+                "Rate limiter evicted idle identifiers",
+                evicted=evicted,
+                tracked=len(self._counters),
+            )
+        return evicted
+
+    def start_eviction(self, interval_seconds: float = 30.0) -> None:
+        """Start evicting idle identifiers in the background."""
+        if self._eviction_task is not None and not self._eviction_task.done():
+            return
+
+        async def evict_periodically() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                # Evict in chunks so large idle populations never stall the loop
+                while self.evict_idle(limit=EVICTION_CHUNK_SIZE) == EVICTION_CHUNK_SIZE:
+                    await asyncio.sleep(0)
+
+        self._eviction_task = asyncio.create_task(evict_periodically())
+
+    async def stop_eviction(self) -> None:
+        """Stop background eviction."""
+        if self._eviction_task is None:
+            return
+
+        self._eviction_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._eviction_task
+        self._eviction_task = None
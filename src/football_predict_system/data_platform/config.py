@@ -52,6 +52,10 @@ class CollectionSchedule(BaseModel):
         }
     )
 
+    # Cache warming ahead of kickoff windows
+    cache_warming_cron: str = "30 * * * *"  # Every hour, half past
+    cache_warming_lookahead_hours: int = 6
+
     # Historical backfill
     backfill_batch_days: int = 30
     backfill_delay_seconds: int = 6  # Rate limiting
@@ -1,12 +1,14 @@
 """Data collection flows package."""
 
 from .data_collection import (
+    cache_warming_flow,
     daily_data_collection_flow,
     data_quality_check_flow,
     historical_backfill_flow,
 )
 
 __all__ = [
+    "cache_warming_flow",
     "daily_data_collection_flow",
     "data_quality_check_flow",
     "historical_backfill_flow",
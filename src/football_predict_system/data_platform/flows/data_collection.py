@@ -99,6 +99,28 @@ async def store_matches_task(match_data: dict[str, Any]) -> dict[str, int]:
     return result
 
 
+@task(name="bulk-store-matches", retries=2)
+async def bulk_store_matches_task(match_data: dict[str, Any]) -> dict[str, int]:
+    """Task to bulk load a large set of matches (COPY on PostgreSQL)."""
+
+    if not match_data["data"]:
+        return {"inserted": 0, "updated": 0, "failed": 0}
+
+    df = pd.DataFrame(match_data["data"])
+    writer = DatabaseWriter()
+
+    result = await writer.bulk_load_matches(df)
+
+    logger.info(
+        "Match data bulk loaded",
+        competition_id=match_data["competition_id"],
+        inserted=result["inserted"],
+        updated=result["updated"]
+    )
+
+    return result
+
+
 @task(name="store-teams", retries=2)
 async def store_teams_task(team_data: dict[str, Any]) -> dict[str, int]:
     """Task to store team data to database."""
@@ -121,6 +143,37 @@ async def store_teams_task(team_data: dict[str, Any]) -> dict[str, int]:
     return result
 
 
+@task(name="warm-cache", retries=1)
+async def warm_cache_task(lookahead_hours: int = 24) -> dict[str, Any]:
+    """Task to pre-warm caches for upcoming fixtures."""
+
+    from ...core.cache import CacheWarmer, get_cache_manager
+
+    warmer = CacheWarmer(await get_cache_manager())
+    reports = await warmer.warm_upcoming(lookahead_hours=lookahead_hours)
+
+    return {
+        report.namespace: {
+            **report.model_dump(exclude={"namespace"}),
+            "keys_per_second": report.keys_per_second,
+        }
+        for report in reports
+    }
+
+
+@task(name="bump-cache-generations")
+async def bump_cache_generations_task(namespaces: list[str]) -> dict[str, int]:
+    """Task to invalidate cache namespaces after bulk data changes."""
+
+    from ...core.cache import get_cache_manager
+
+    cache_manager = await get_cache_manager()
+    return {
+        namespace: await cache_manager.bump_namespace(namespace)
+        for namespace in namespaces
+    }
+
+
 @flow(name="daily-data-collection", log_prints=True)
 async def daily_data_collection_flow() -> dict[str, Any]:
     """Daily data collection flow."""
@@ -204,10 +257,30 @@ async def daily_data_collection_flow() -> dict[str, Any]:
         "execution_time": (datetime.utcnow() - date_from).total_seconds()
     }
 
+    # Refresh caches now that fresh fixtures are stored; the data is already
+    # committed, so a warming failure must not fail the collection run
+    try:
+        summary["cache_warming"] = await warm_cache_task()
+    except Exception as e:
+        logger.error("Cache warming after collection failed", error=str(e))
+        summary["cache_warming"] = {"error": str(e)}
+
     logger.info("Daily data collection completed", summary=summary)
     return summary
 
 
+@flow(name="cache-warming", log_prints=True)
+async def cache_warming_flow(lookahead_hours: int = 6) -> dict[str, Any]:
+    """Pre-warm caches ahead of upcoming kickoff windows."""
+
+    logger.info("Starting scheduled cache warming", lookahead_hours=lookahead_hours)
+
+    summary = await warm_cache_task(lookahead_hours)
+
+    logger.info("Scheduled cache warming completed", summary=summary)
+    return summary
+
+
 @flow(name="historical-backfill", log_prints=True)
 async def historical_backfill_flow(
     competition_id: int,
@@ -223,8 +296,8 @@ async def historical_backfill_flow(
     logger.info(
         "Starting historical backfill",
         competition_id=competition_id,
-        season_start=start_date.date(),
-        season_end=end_date.date()
+        season_start=season_start.date(),
+        season_end=season_end.date()
     )
 
     # Collect teams first
@@ -238,36 +311,36 @@ async def historical_backfill_flow(
     try:
         batch_data_list = await history_collector.backfill_season_data(
             competition_id=competition_id,
-            season_start=start_date,
-            season_end=end_date
+            season_start=season_start,
+            season_end=season_end
         )
 
-        # Process and store each batch
-        total_inserted = 0
-        total_updated = 0
-
-        for i, df in enumerate(batch_data_list):
-            batch_result = await store_matches_task({
-                "data": df.to_dict(orient="records"),
-                "competition_id": competition_id
-            })
-
-            total_inserted += batch_result["inserted"]
-            total_updated += batch_result["updated"]
-
-            logger.info(f"Processed batch {i+1}/{len(batch_data_list)}")
+        # Load all batches at once; large loads use the COPY fast path
+        frames = [df for df in batch_data_list if not df.empty]
+        matches_result = await bulk_store_matches_task({
+            "data": (
+                pd.concat(frames, ignore_index=True).to_dict(orient="records")
+                if frames else []
+            ),
+            "competition_id": competition_id
+        })
 
         summary = {
             "competition_id": competition_id,
             "season": f"{season_start} to {season_end}",
             "batches_processed": len(batch_data_list),
             "matches": {
-                "inserted": total_inserted,
-                "updated": total_updated
+                "inserted": matches_result["inserted"],
+                "updated": matches_result["updated"]
             },
             "teams": team_result
         }
 
+        # Backfilled rows change history-derived data; flush it in O(1)
+        summary["cache_generations"] = await bump_cache_generations_task(
+            ["matches", "teams", "league_data"]
+        )
+
         logger.info("Historical backfill completed", summary=summary)
         return summary
 
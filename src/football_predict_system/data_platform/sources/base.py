@@ -3,8 +3,11 @@ Data source base classes and interfaces.
 """
 
 import asyncio
+import math
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any, ClassVar
 
@@ -184,25 +187,191 @@ class TeamDataSource(DataSource):
         return True
 
 
-class RateLimiter:
-    """Rate limiting for API calls."""
+class _KeyBucket:
+    """Scheduling state of one API key."""
 
-    def __init__(self, calls_per_minute: int = 60) -> None:
-        self.calls_per_minute = calls_per_minute
-        self.call_times: list[float] = []
+    __slots__ = (
+        "blocked_until",
+        "credit",
+        "credit_expires_at",
+        "in_flight",
+        "key",
+        "tat",
+    )
 
-    async def wait_if_needed(self) -> None:
-        """Wait if rate limit would be exceeded."""
-        now = time.time()
+    def __init__(self, key: str | None) -> None:
+        self.key = key
+        # Theoretical arrival time of the next request on the steady schedule
+        self.tat = 0.0
+        # Set from Retry-After or an exhausted server quota
+        self.blocked_until = 0.0
+        # Requests the server reported as still available in its window
+        self.credit = 0
+        self.credit_expires_at = 0.0
+        self.in_flight = 0
 
-        # Remove calls older than 1 minute
-        self.call_times = [t for t in self.call_times if now - t < 60]
 
-        # Check if we need to wait
-        if len(self.call_times) >= self.calls_per_minute:
-            wait_time = 61 - (now - self.call_times[0])
+class RateLimiter:
+    """
+    Token bucket for outgoing API calls, pooled over one or more API keys.
+
+    Every call reserves the earliest free slot on the key that is available
+    soonest, so concurrent callers are served in arrival order and never
+    pass the check together. Without server feedback a key is used at a
+    steady ``calls_per_minute`` (``burst`` requests may go back to back);
+    quota headers of each response (``X-Requests-Available-Minute`` with
+    ``X-RequestCounter-Reset``) let the remaining quota be used right away,
+    and ``Retry-After`` or an exhausted quota pauses the key until reset.
+
+    State is guarded by a thread lock and waiting happens outside it, so one
+    limiter can be shared by tasks running on different event loops.
+    """
+
+    def __init__(
+        self,
+        calls_per_minute: int = 60,
+        api_keys: list[str] | None = None,
+        burst: int = 1,
+    ) -> None:
+        self.calls_per_minute = calls_per_minute
+        self.interval = 60.0 / calls_per_minute
+        self.burst = burst
+        keys: list[str | None] = [*api_keys] if api_keys else [None]
+        self._buckets = {key: _KeyBucket(key) for key in keys}
+        self._lock = threading.Lock()
+
+    def _ready_at(self, bucket: _KeyBucket, now: float) -> float:
+        """Earliest time the key may send its next request."""
+        if bucket.blocked_until > now:
+            return bucket.blocked_until
+        if bucket.credit > 0 and now < bucket.credit_expires_at:
+            return now
+        return max(now, bucket.tat - (self.burst - 1) * self.interval)
+
+    def _reserve(self) -> tuple[_KeyBucket, float]:
+        """Reserve the earliest slot across all keys."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = min(self._buckets.values(), key=lambda b: self._ready_at(b, now))
+            ready_at = self._ready_at(bucket, now)
+
+            if ready_at == now and bucket.credit > 0:
+                bucket.credit -= 1
+            bucket.tat = max(bucket.tat, ready_at) + self.interval
+            bucket.in_flight += 1
+            return bucket, ready_at
+
+    async def acquire(self) -> str | None:
+        """
+        Wait for a request slot.
+
+        Returns:
+            The API key to send the request with (None when not pooled).
+            Pass it to ``release`` once the response has arrived.
+        """
+        while True:
+            bucket, ready_at = self._reserve()
+            wait_time = ready_at - time.monotonic()
             if wait_time > 0:
-                logger.info(f"Rate limiting: waiting {wait_time:.1f} seconds")
+                logger.info(
+                    "Rate limiting: waiting for request slot",
+                    wait_seconds=round(wait_time, 1),
+                )
                 await asyncio.sleep(wait_time)
 
-        self.call_times.append(now)
+            with self._lock:
+                if bucket.blocked_until <= time.monotonic():
+                    return bucket.key
+                # The key was paused while waiting; take a new slot
+                bucket.in_flight -= 1
+
+    def release(
+        self,
+        api_key: str | None,
+        status: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record the response of a request made with an acquired key."""
+        with self._lock:
+            bucket = self._buckets[api_key]
+            bucket.in_flight = max(0, bucket.in_flight - 1)
+            if status is None or headers is None:
+                return
+
+            now = time.monotonic()
+            values = {name.lower(): value for name, value in headers.items()}
+
+            if status == 429:
+                retry_after = _parse_seconds(values.get("retry-after"), 60.0)
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+                bucket.credit = 0
+                logger.warning(
+                    "API quota exceeded, pausing key", retry_after=retry_after
+                )
+                return
+
+            # Quota headers are advisory; malformed ones are ignored
+            available = _parse_count(
+                values.get("x-requests-available-minute")
+                or values.get("x-requests-available")
+            )
+            if available is None:
+                return
+
+            reset = _parse_seconds(values.get("x-requestcounter-reset"), 60.0)
+            # Requests still in flight were not yet counted by the server
+            remaining = available - bucket.in_flight
+            if remaining > 0:
+                bucket.credit = remaining
+                bucket.credit_expires_at = now + reset
+            else:
+                bucket.credit = 0
+                bucket.blocked_until = max(bucket.blocked_until, now + reset)
+
+    async def wait_if_needed(self) -> None:
+        """Wait if rate limit would be exceeded."""
+        self.release(await self.acquire())
+
+
+def _parse_seconds(value: str | None, default: float) -> float:
+    """Parse a header value holding a number of seconds."""
+    if value is None:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        return default
+    return max(0.0, seconds) if math.isfinite(seconds) else default
+
+
+def _parse_count(value: str | None) -> int | None:
+    """Parse a header value holding a request count; None if malformed."""
+    if value is None:
+        return None
+    try:
+        count = int(value)
+    except ValueError:
+        return None
+    return count if count >= 0 else None
+
+
+_shared_rate_limiters: dict[tuple[str, tuple[str, ...]], RateLimiter] = {}
+_shared_rate_limiters_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(
+    name: str, calls_per_minute: int, api_keys: list[str] | None = None
+) -> RateLimiter:
+    """
+    Get the process-wide rate limiter of a data source.
+
+    Collectors are created per task, but the quota belongs to the API keys,
+    so every collector of a source using the same keys shares one limiter.
+    """
+    registry_key = (name, tuple(api_keys or ()))
+    with _shared_rate_limiters_lock:
+        limiter = _shared_rate_limiters.get(registry_key)
+        if limiter is None:
+            limiter = RateLimiter(calls_per_minute, api_keys=api_keys)
+            _shared_rate_limiters[registry_key] = limiter
+        return limiter
@@ -7,7 +7,6 @@ Free tier limitations:
 - Limited to certain competitions
 """
 
-import asyncio
 import time
 from datetime import datetime, timedelta
 from typing import Any, cast
@@ -18,7 +17,13 @@ import pandas as pd
 from football_predict_system.core.config import get_settings
 from football_predict_system.core.logging import get_logger
 
-from .base import MatchDataSource, RateLimiter, TeamDataSource
+from ..config import get_data_platform_config
+from .base import (
+    DataSourceError,
+    MatchDataSource,
+    TeamDataSource,
+    get_shared_rate_limiter,
+)
 
 logger = get_logger(__name__)
 
@@ -28,11 +33,23 @@ class FootballDataAPICollector(MatchDataSource, TeamDataSource):
 
     BASE_URL = "https://api.football-data.org/v4"
 
+    # Attempts per request when the API still answers 429
+    MAX_RATE_LIMITED_ATTEMPTS = 5
+
     def __init__(self, api_key: str | None = None) -> None:
         super().__init__()
         self.settings = get_settings()
         self.api_key = api_key or getattr(self.settings, "football_data_api_key", None)
-        self.rate_limiter = RateLimiter(calls_per_minute=10)  # Free tier limit
+        # Several comma separated keys are pooled, each with its own quota
+        self.api_keys = [
+            k.strip() for k in (self.api_key or "").split(",") if k.strip()
+        ]
+        source_config = get_data_platform_config().football_data_org
+        self.rate_limiter = get_shared_rate_limiter(
+            source_config.name,
+            calls_per_minute=source_config.rate_limit_per_minute,
+            api_keys=self.api_keys or None,
+        )
         self.session: aiohttp.ClientSession | None = None
 
     async def fetch(self, **kwargs: Any) -> pd.DataFrame:
@@ -48,10 +65,7 @@ class FootballDataAPICollector(MatchDataSource, TeamDataSource):
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self.session is None:
-            headers: dict[str, str] = {
-                "X-Auth-Token": self.api_key or "",
-                "Accept": "application/json",
-            }
+            headers: dict[str, str] = {"Accept": "application/json"}
             timeout = aiohttp.ClientTimeout(total=30)
             self.session = aiohttp.ClientSession(headers=headers, timeout=timeout)
         return self.session
@@ -60,31 +74,46 @@ class FootballDataAPICollector(MatchDataSource, TeamDataSource):
         self, endpoint: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Make rate-limited API request."""
-        await self.rate_limiter.wait_if_needed()
-
         session = await self._get_session()
         url = f"{self.BASE_URL}/{endpoint}"
 
-        start_time = time.time()
-
-        try:
-            async with session.get(url, params=params) as response:
-                response_time = int((time.time() - start_time) * 1000)
-                self.stats.api_response_time_ms = response_time
+        for attempt in range(1, self.MAX_RATE_LIMITED_ATTEMPTS + 1):
+            api_key = await self.rate_limiter.acquire()
+            status: int | None = None
+            response_headers: Any = None
+            start_time = time.time()
 
-                if response.status == 429:  # Rate limited
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    logger.warning(f"Rate limited, waiting {retry_after}s")
-                    await asyncio.sleep(retry_after)
-                    return await self._make_request(endpoint, params)
-
-                response.raise_for_status()
-                response_data = await response.json()
-                return cast("dict[str, Any]", response_data)
-
-        except aiohttp.ClientError as e:
-            logger.error(f"API request failed: {e}")
-            raise
+            try:
+                async with session.get(
+                    url, params=params, headers={"X-Auth-Token": api_key or ""}
+                ) as response:
+                    status, response_headers = response.status, response.headers
+                    response_time = int((time.time() - start_time) * 1000)
+                    self.stats.api_response_time_ms = response_time
+
+                    if response.status == 429:  # Rate limited
+                        # The limiter pauses this key until Retry-After
+                        logger.warning(
+                            "Rate limited by API",
+                            endpoint=endpoint,
+                            retry_after=response.headers.get("Retry-After"),
+                            attempt=attempt,
+                        )
+                        continue
+
+                    response.raise_for_status()
+                    response_data = await response.json()
+                    return cast("dict[str, Any]", response_data)
+
+            except aiohttp.ClientError as e:
+                logger.error(f"API request failed: {e}")
+                raise
+            finally:
+                self.rate_limiter.release(api_key, status, response_headers)
+
+        raise DataSourceError(
+            f"Rate limited on {endpoint} after {self.MAX_RATE_LIMITED_ATTEMPTS} attempts"
+        )
 
     async def fetch_competitions(self) -> pd.DataFrame:
         """Fetch available competitions."""
@@ -289,9 +318,6 @@ class FootballDataHistoryCollector:
                     all_data.append(df)
                     self.logger.info(f"Collected {len(df)} matches")
 
-                # Add delay to respect rate limits
-                await asyncio.sleep(6)  # 10 requests per minute = 6s between
-
             except Exception as e:
                 self.logger.error(
                     "Batch collection failed",
@@ -1,20 +1,145 @@
 """
 Database writer for data platform.
+
+Teams and matches are upserted set-based: each batch of rows is sent as one
+``INSERT ... ON CONFLICT (external_api_id) DO UPDATE ... RETURNING``
+statement, which PostgreSQL and SQLite (3.35+) both support, instead of a
+SELECT plus an INSERT or UPDATE per row. The teams referenced by a batch of
+matches are resolved with one ``IN`` query into a map kept for the run.
+
+Historical backfills on PostgreSQL take a faster path: rows are streamed
+with binary COPY into an unlogged staging table and merged into ``matches``
+with a single statement.
 """
 
 import uuid
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import SQLAlchemyError
 
+from football_predict_system.core.cache import get_cache_manager
 from football_predict_system.core.database import get_database_manager
+from football_predict_system.core.exceptions import DatabaseConnectionError
 from football_predict_system.core.logging import get_logger
 from football_predict_system.domain.models import Team
+from football_predict_system.domain.services.data_service import DataService
 
 logger = get_logger(__name__)
 
+# Rows per upsert statement; stays well below the bound parameter limits
+# of SQLite (32766) and asyncpg (32767) for the widest row
+UPSERT_BATCH_SIZE = 1000
+
+TEAM_COLUMNS = ("external_api_id", "name", "short_name")
+MATCH_COLUMNS = (
+    "external_api_id",
+    "home_team_id",
+    "away_team_id",
+    "match_date",
+    "venue",
+    "matchday",
+    "status",
+    "home_score",
+    "away_score",
+    "home_score_ht",
+    "away_score_ht",
+    "result",
+)
+
+
+TEAM_ID_QUERY = text(
+    "SELECT external_api_id, id FROM teams WHERE external_api_id IN :external_ids"
+).bindparams(bindparam("external_ids", expanding=True))
+
+
+@lru_cache(maxsize=64)
+def _upsert_statement(
+    table: str,
+    columns: tuple[str, ...],
+    update_columns: tuple[str, ...],
+    row_count: int,
+    dialect: str,
+    timestamp_func: str,
+) -> Any:
+    """Build a multi-row upsert keyed on ``external_api_id``."""
+    columns = _insert_columns(columns, dialect)
+    values = ",\n".join(
+        "(" + ", ".join(f":{column}_{i}" for column in columns) + ")"
+        for i in range(row_count)
+    )
+    updates = ",\n".join(f"{column} = excluded.{column}" for column in update_columns)
+    # PostgreSQL reports inserts directly; elsewhere a row was inserted if it
+    # kept the id we generated for it
+    returning = "id, external_api_id" + (
+        ", (xmax = 0) AS inserted" if dialect == "postgresql" else ""
+    )
+    return text(f"""
+        INSERT INTO {table} ({", ".join(columns)})
+        VALUES {values}
+        ON CONFLICT (external_api_id) DO UPDATE SET
+            {updates},
+            updated_at = {timestamp_func}
+        RETURNING {returning}
+        """)  # nosec B608 - identifiers come from module constants
+
+
+def _insert_columns(columns: tuple[str, ...], dialect: str) -> tuple[str, ...]:
+    """Columns to insert; PostgreSQL tables generate their own ids."""
+    return columns if dialect == "postgresql" else ("id", *columns)
+
+
+# Staging table for COPY: input position (the last duplicate wins), then
+# the match columns with team ids still external
+MATCH_STAGING_COLUMNS = (
+    ("position", "bigint"),
+    ("external_api_id", "integer"),
+    ("home_team_id", "integer"),
+    ("away_team_id", "integer"),
+    ("match_date", "timestamp"),
+    ("venue", "text"),
+    ("matchday", "integer"),
+    ("status", "text"),
+    ("home_score", "integer"),
+    ("away_score", "integer"),
+    ("home_score_ht", "integer"),
+    ("away_score_ht", "integer"),
+    ("result", "text"),
+)
+
+
+def _match_copy_records(df: pd.DataFrame) -> Iterator[tuple[Any, ...]]:
+    """Stream matches as tuples typed for binary COPY into the staging table."""
+    frame = pd.DataFrame(
+        {
+            column: df[column] if column in df else None
+            for column, _ in MATCH_STAGING_COLUMNS[1:]
+        },
+        index=df.index,
+    )
+    for column, column_type in MATCH_STAGING_COLUMNS[1:]:
+        if column_type == "integer":
+            frame[column] = pd.to_numeric(frame[column]).astype("Int64")
+    frame["match_date"] = pd.to_datetime(frame["match_date"], utc=True).dt.tz_localize(
+        None
+    )
+    frame["status"] = frame["status"].fillna("scheduled").str.lower()
+
+    frame = frame.astype(object).where(frame.notna(), None)
+    for position, row in enumerate(frame.itertuples(index=False, name=None)):
+        yield (position, *row)
+
+
+def _records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """DataFrame rows as dicts of plain Python values, with NaN as None."""
+    records: list[dict[str, Any]] = (
+        df.astype(object).where(df.notna(), None).to_dict("records")
+    )
+    return records
+
 
 class UpsertResult:
     """Result of upsert operation."""
@@ -41,9 +166,13 @@ class UpsertResult:
 class DatabaseWriter:
     """Handle data storage operations."""
 
-    def __init__(self) -> None:
+    def __init__(self, batch_size: int = UPSERT_BATCH_SIZE) -> None:
         self.db_manager = get_database_manager()
         self.logger = get_logger(__name__)
+        self.batch_size = batch_size
+        # Team ids resolved during this writer's run, as the database returns
+        # them (INTEGER on PostgreSQL, TEXT on SQLite)
+        self._team_ids: dict[int, Any] = {}
 
     def _get_timestamp_func(self) -> str:
         """Get the appropriate timestamp function for the database type."""
@@ -112,208 +241,327 @@ class DatabaseWriter:
         if df.empty:
             return UpsertResult()
 
-        inserted = 0
-        updated = 0
+        rows = []
         failed = 0
-        timestamp_func = self._get_timestamp_func()
-
-        async with self.db_manager.get_async_session() as session:
-            for _, row in df.iterrows():
-                try:
-                    # Check if team exists
-                    result = await session.execute(
-                        text("""
-                        SELECT id FROM teams
-                        WHERE external_api_id = :external_api_id
-                        """),
-                        {"external_api_id": row["external_api_id"]},
-                    )
-                    existing = result.fetchone()
-
-                    if existing:
-                        # Update existing team
-                        await session.execute(
-                            text(f"""
-                            UPDATE teams SET
-                                name = :name,
-                                short_name = :short_name,
-                                updated_at = {timestamp_func}
-                            WHERE external_api_id = :external_api_id
-                            """),  # nosec B608 - timestamp_func is a safe database function
-                            {
-                                "external_api_id": row["external_api_id"],
-                                "name": row["name"],
-                                "short_name": row["short_name"],
-                            },
-                        )
-                        updated += 1
-                        self.logger.info(
-                            "Updated existing team",
-                            team_name=row["name"],
-                            external_api_id=row["external_api_id"],
-                        )
-                    else:
-                        # Insert new team
-                        team_id = str(uuid.uuid4())
-                        await session.execute(
-                            text(f"""
-                            INSERT INTO teams (
-                                id, external_api_id, name, short_name,
-                                created_at, updated_at
-                            ) VALUES (
-                                :id, :external_api_id, :name, :short_name,
-                                {timestamp_func}, {timestamp_func}
-                            )
-                            """),  # nosec B608 - timestamp_func is a safe database function
-                            {
-                                "id": team_id,
-                                "external_api_id": row["external_api_id"],
-                                "name": row["name"],
-                                "short_name": row["short_name"],
-                            },
-                        )
-                        inserted += 1
-                        self.logger.info(
-                            "Inserted new team",
-                            team_name=row["name"],
-                            external_api_id=row["external_api_id"],
-                        )
-
-                except (SQLAlchemyError, ValueError, KeyError) as e:
-                    failed += 1
-                    self.logger.error(
-                        "Failed to upsert team",
-                        error=str(e),
-                        team_name=row.get("name", "Unknown"),
-                    )
-
-            await session.commit()
+        for record in _records(df):
+            try:
+                rows.append(
+                    {
+                        "external_api_id": record["external_api_id"],
+                        "name": record["name"],
+                        "short_name": record.get("short_name"),
+                    }
+                )
+            except KeyError as e:
+                failed += 1
+                self.logger.error(
+                    "Failed to upsert team",
+                    error=f"missing column {e}",
+                    team_name=record.get("name", "Unknown"),
+                )
 
-        return UpsertResult(inserted=inserted, updated=updated, failed=failed)
+        inserted_rows, updated, batch_failed = await self._upsert(
+            "teams", TEAM_COLUMNS, ("name", "short_name"), rows
+        )
+        self._forget_team_ids(rows)
+        inserted_keys = [
+            DataService.team_cache_key(str(key))
+            for row in inserted_rows
+            for key in (row["id"], row["external_api_id"])
+        ]
+
+        await self._clear_negative_cache(inserted_keys, "teams")
+        result = UpsertResult(
+            inserted=len(inserted_rows), updated=updated, failed=failed + batch_failed
+        )
+        self.logger.info("Teams upserted", **result.to_dict())
+        return result
 
     async def upsert_matches(self, df: pd.DataFrame) -> dict[str, int]:
         """Insert or update match data."""
         if df.empty:
             return {"inserted": 0, "updated": 0, "failed": 0}
 
-        inserted = 0
-        updated = 0
+        records = _records(df)
+        rows = []
         failed = 0
 
-        async with self.db_manager.get_async_session() as session:
-            for _, row in df.iterrows():
-                try:
-                    # Check if match exists
-                    result = await session.execute(
-                        text("""
-                        SELECT id FROM matches
-                        WHERE external_api_id = :external_api_id
-                        """),
-                        {"external_api_id": row["external_api_id"]},
-                    )
-                    existing = result.fetchone()
+        team_ids = await self._resolve_team_ids(
+            {
+                int(record[column])
+                for record in records
+                for column in ("home_team_id", "away_team_id")
+                if record.get(column) is not None
+            }
+        )
 
-                    # Get team IDs
-                    home_team_id = await self._get_team_id_by_external_id(
-                        session, row.get("home_team_id")
-                    )
-                    away_team_id = await self._get_team_id_by_external_id(
-                        session, row.get("away_team_id")
+        for record in records:
+            try:
+                home_team_id = away_team_id = None
+                if record.get("home_team_id") is not None:
+                    home_team_id = team_ids.get(int(record["home_team_id"]))
+                if record.get("away_team_id") is not None:
+                    away_team_id = team_ids.get(int(record["away_team_id"]))
+
+                if not (home_team_id and away_team_id):
+                    self.logger.warning(
+                        "Skipping match - teams not found",
+                        external_api_id=record["external_api_id"],
                     )
+                    failed += 1
+                    continue
 
-                    if not (home_team_id and away_team_id):
-                        self.logger.warning(
-                            "Skipping match - teams not found",
-                            external_api_id=row["external_api_id"],
-                        )
-                        failed += 1
-                        continue
-
-                    match_data = {
+                rows.append(
+                    {
+                        **{column: record.get(column) for column in MATCH_COLUMNS},
                         "home_team_id": home_team_id,
                         "away_team_id": away_team_id,
-                        "match_date": row.get("match_date"),
-                        "venue": row.get("venue"),
-                        "matchday": row.get("matchday"),
-                        "status": row.get("status", "scheduled").lower(),
-                        "home_score": row.get("home_score"),
-                        "away_score": row.get("away_score"),
-                        "home_score_ht": row.get("home_score_ht"),
-                        "away_score_ht": row.get("away_score_ht"),
-                        "result": row.get("result"),
-                        "external_api_id": row["external_api_id"],
+                        "status": (record.get("status") or "scheduled").lower(),
+                        "external_api_id": record["external_api_id"],
                     }
+                )
 
-                    if existing:
-                        # Update existing match
-                        await session.execute(
-                            text("""
-                            UPDATE matches SET
-                                match_date = :match_date,
-                                venue = :venue,
-                                matchday = :matchday,
-                                status = :status,
-                                home_score = :home_score,
-                                away_score = :away_score,
-                                home_score_ht = :home_score_ht,
-                                away_score_ht = :away_score_ht,
-                                result = :result,
-                                updated_at = {self._get_timestamp_func()}
-                            WHERE external_api_id = :external_api_id
-                            """),
-                            match_data,
-                        )
-                        updated += 1
-                    else:
-                        # Insert new match
-                        match_data["id"] = str(uuid.uuid4())
-                        await session.execute(
-                            text("""
-                            INSERT INTO matches (
-                                id, home_team_id, away_team_id, match_date,
-                                venue, matchday, status, home_score, away_score,
-                                home_score_ht, away_score_ht, result,
-                                external_api_id
-                            ) VALUES (
-                                :id, :home_team_id, :away_team_id, :match_date,
-                                :venue, :matchday, :status, :home_score, :away_score,
-                                :home_score_ht, :away_score_ht, :result,
-                                :external_api_id
-                            )
-                            """),
-                            match_data,
-                        )
-                        inserted += 1
+            except (ValueError, KeyError) as e:
+                self.logger.error(
+                    "Failed to upsert match",
+                    external_api_id=record.get("external_api_id"),
+                    error=str(e),
+                )
+                failed += 1
+
+        # Team ids are fixed once a match exists; everything else is refreshed
+        inserted_rows, updated, batch_failed = await self._upsert(
+            "matches", MATCH_COLUMNS, MATCH_COLUMNS[3:], rows
+        )
+        inserted_keys = [
+            DataService.match_cache_key(str(key))
+            for row in inserted_rows
+            for key in (row["id"], row["external_api_id"])
+        ]
+
+        await self._clear_negative_cache(inserted_keys, "matches")
+        result = {
+            "inserted": len(inserted_rows),
+            "updated": updated,
+            "failed": failed + batch_failed,
+        }
+        self.logger.info("Matches upserted", **result)
+        return result
 
-                except (SQLAlchemyError, ValueError, KeyError) as e:
+    async def _upsert(
+        self,
+        table: str,
+        columns: tuple[str, ...],
+        update_columns: tuple[str, ...],
+        rows: list[dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], int, int]:
+        """
+        Upsert rows on ``external_api_id``, one statement per batch.
+
+        Each batch commits on its own, so a failing batch only loses its own
+        rows. Rows without an ``external_api_id`` cannot be matched and are
+        counted as failed; for repeated ids within a call the last row wins.
+
+        Returns:
+            Inserted rows (``id`` and ``external_api_id``), the updated count
+            and the failed count
+        """
+        keyed = {}
+        failed = 0
+        for row in rows:
+            if row["external_api_id"] is None:
+                failed += 1
+                continue
+            # Ids arrive as floats when the column had gaps
+            external_api_id = int(row["external_api_id"])
+            keyed[external_api_id] = {
+                **row,
+                "external_api_id": external_api_id,
+                "id": str(uuid.uuid4()),
+            }
+        if failed:
+            self.logger.warning(
+                "Skipping rows without external_api_id", table=table, count=failed
+            )
+
+        unique_rows = list(keyed.values())
+        inserted: list[dict[str, Any]] = []
+        updated = 0
+        timestamp_func = self._get_timestamp_func()
+
+        async with self.db_manager.get_async_session(write=True) as session:
+            dialect = session.bind.dialect.name
+            for start in range(0, len(unique_rows), self.batch_size):
+                batch = unique_rows[start : start + self.batch_size]
+                statement = _upsert_statement(
+                    table, columns, update_columns, len(batch), dialect, timestamp_func
+                )
+                params = {
+                    f"{column}_{i}": row[column]
+                    for i, row in enumerate(batch)
+                    for column in _insert_columns(columns, dialect)
+                }
+                try:
+                    result = await session.execute(statement, params)
+                    returned = result.mappings().all()
+                    await session.commit()
+                except SQLAlchemyError as e:
+                    await session.rollback()
+                    failed += len(batch)
                     self.logger.error(
-                        "Failed to upsert match",
-                        external_api_id=row.get("external_api_id"),
+                        "Failed to upsert batch",
+                        table=table,
+                        rows=len(batch),
                         error=str(e),
                     )
-                    failed += 1
+                    continue
 
-            await session.commit()
+                for row in returned:
+                    if dialect == "postgresql":
+                        is_insert = row["inserted"]
+                    else:
+                        generated = keyed[row["external_api_id"]]["id"]
+                        is_insert = str(row["id"]) == generated
+                    if is_insert:
+                        inserted.append(
+                            {
+                                "id": str(row["id"]),
+                                "external_api_id": row["external_api_id"],
+                            }
+                        )
+                    else:
+                        updated += 1
+
+        return inserted, updated, failed
+
+    async def _clear_negative_cache(self, keys: list[str], namespace: str) -> None:
+        """Drop negative cache entries for newly inserted entities."""
+        if not keys:
+            return
+
+        cache_manager = await get_cache_manager()
+        await cache_manager.delete_many(keys, namespace)
+        self.logger.debug(
+            "Cleared negative cache entries", namespace=namespace, count=len(keys)
+        )
+
+    async def bulk_load_matches(self, df: pd.DataFrame) -> dict[str, int]:
+        """
+        Load a large batch of matches, e.g. a historical backfill.
 
-        return {"inserted": inserted, "updated": updated, "failed": failed}
+        On PostgreSQL the rows are streamed with binary COPY into an unlogged
+        staging table, then merged into ``matches`` by one upsert that
+        resolves both teams with joins; the counts come from the merge. Other
+        databases fall back to the batched :meth:`upsert_matches`.
 
-    async def _get_team_id_by_external_id(
-        self, session: Any, external_id: int | None
-    ) -> str | None:
-        """Get internal team ID by external API ID."""
-        if not external_id:
-            return None
+        Per-key negative cache entries are not cleared on the COPY path;
+        callers bump the ``matches`` cache generation after a backfill.
+        """
+        if df.empty:
+            return {"inserted": 0, "updated": 0, "failed": 0}
 
-        result = await session.execute(
-            text("SELECT id FROM teams WHERE external_api_id = :external_id"),
-            {"external_id": external_id},
+        if self.db_manager.get_async_engine().dialect.name != "postgresql":
+            return await self.upsert_matches(df)
+
+        staging = f"matches_staging_{uuid.uuid4().hex[:12]}"
+        match_columns = [column for column, _ in MATCH_STAGING_COLUMNS[1:]]
+        updates = ",\n".join(
+            f"{column} = excluded.{column}" for column in MATCH_COLUMNS[3:]
+        )
+        selected = ", ".join(
+            {"home_team_id": "h.id", "away_team_id": "a.id"}.get(column, f"s.{column}")
+            for column in match_columns
         )
-        row = result.fetchone()
-        return str(row[0]) if row else None
+
+        # One transaction: if anything fails the staging table is rolled
+        # back together with the merge
+        async with self.db_manager.get_async_session() as session:
+            await session.execute(
+                text(
+                    f"CREATE UNLOGGED TABLE {staging} ("
+                    + ", ".join(f"{c} {t}" for c, t in MATCH_STAGING_COLUMNS)
+                    + ")"
+                )
+            )
+            connection = await session.connection()
+            raw = await connection.get_raw_connection()
+            if raw.driver_connection is None:
+                raise DatabaseConnectionError("No driver connection for COPY")
+            await raw.driver_connection.copy_records_to_table(
+                staging,
+                records=_match_copy_records(df),
+                columns=[column for column, _ in MATCH_STAGING_COLUMNS],
+            )
+
+            result = await session.execute(
+                text(f"""
+                WITH merged AS (
+                    INSERT INTO matches ({", ".join(match_columns)})
+                    SELECT DISTINCT ON (s.external_api_id) {selected}
+                    FROM {staging} s
+                    JOIN teams h ON h.external_api_id = s.home_team_id
+                    JOIN teams a ON a.external_api_id = s.away_team_id
+                    WHERE s.external_api_id IS NOT NULL
+                    ORDER BY s.external_api_id, s.position DESC
+                    ON CONFLICT (external_api_id) DO UPDATE SET
+                        {updates},
+                        updated_at = CURRENT_TIMESTAMP
+                    RETURNING (xmax = 0) AS inserted
+                )
+                SELECT
+                    COUNT(*) FILTER (WHERE inserted) AS inserted,
+                    COUNT(*) FILTER (WHERE NOT inserted) AS updated,
+                    (
+                        SELECT COUNT(DISTINCT external_api_id)
+                            + COUNT(*) FILTER (WHERE external_api_id IS NULL)
+                        FROM {staging}
+                    ) AS staged
+                FROM merged
+                """)  # nosec B608 - staging name is generated above
+            )
+            merged = result.mappings().one()
+            await session.execute(text(f"DROP TABLE {staging}"))
+
+        # Duplicate ids collapse into one row; rows without an id or whose
+        # teams do not exist fail
+        counts = {
+            "inserted": merged["inserted"],
+            "updated": merged["updated"],
+            "failed": merged["staged"] - merged["inserted"] - merged["updated"],
+        }
+        self.logger.info("Matches bulk loaded", rows=len(df), **counts)
+        return counts
+
+    def _forget_team_ids(self, rows: list[dict[str, Any]]) -> None:
+        """Drop upserted teams from the team id map."""
+        for row in rows:
+            if row["external_api_id"] is not None:
+                self._team_ids.pop(int(row["external_api_id"]), None)
+
+    async def _resolve_team_ids(self, external_ids: set[int]) -> dict[int, Any]:
+        """
+        Map external team ids to internal ids.
+
+        Ids not yet in the writer's map are looked up with one ``IN`` query
+        per batch; teams that do not exist are simply absent from the result.
+        """
+        missing = [i for i in external_ids if i not in self._team_ids]
+        if missing:
+            async with self.db_manager.get_async_session() as session:
+                for start in range(0, len(missing), self.batch_size):
+                    result = await session.execute(
+                        TEAM_ID_QUERY,
+                        {"external_ids": missing[start : start + self.batch_size]},
+                    )
+                    self._team_ids.update(
+                        (int(external_id), team_id)
+                        for external_id, team_id in result.all()
+                    )
+        return self._team_ids
 
     async def get_data_quality_stats(self) -> dict[str, Any]:
         """Get data quality statistics."""
-        async with self.db_manager.get_async_session() as session:
+        async with self.db_manager.get_async_session(read_only=True) as session:
             # Count finished matches without scores
             try:
                 result = await session.execute(
@@ -418,7 +666,7 @@ class DatabaseWriter:
             )
             ```
         """
-        async with self.db_manager.get_async_session() as session:
+        async with self.db_manager.get_async_session(write=True) as session:
             # Get or create data source
             result = await session.execute(
                 text("SELECT id FROM data_sources WHERE name = :name"),
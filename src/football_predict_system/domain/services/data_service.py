@@ -3,12 +3,15 @@ Data service for managing football data.
 
 This service handles:
 - Match data retrieval and caching
+- Negative caching of not-found lookups
 - Team data management
 - Data validation and consistency
 - Historical data access
 """
 
-from football_predict_system.core.cache import get_cache_manager
+import asyncio
+
+from football_predict_system.core.cache import NEGATIVE_CACHE_MARKER, get_cache_manager
 from football_predict_system.core.logging import get_logger, log_performance
 from football_predict_system.domain.models import Match, Team
 
@@ -21,15 +24,27 @@ class DataService:
     def __init__(self) -> None:
         self.logger = get_logger(__name__)
 
+    @staticmethod
+    def match_cache_key(match_id: str) -> str:
+        """Cache key for a single match in the ``matches`` namespace."""
+        return f"match:{match_id}"
+
+    @staticmethod
+    def team_cache_key(team_id: str) -> str:
+        """Cache key for a single team in the ``teams`` namespace."""
+        return f"team:{team_id}"
+
     @log_performance("get_match_by_id")
     async def get_match_by_id(self, match_id: str) -> Match | None:
         """Get match data by ID."""
         cache_manager = await get_cache_manager()
 
         # Check cache first
-        cache_key = f"match:{match_id}"
+        cache_key = self.match_cache_key(match_id)
         cached_match = await cache_manager.get(cache_key, "matches")
 
+        if cached_match == NEGATIVE_CACHE_MARKER:
+            return None
         if cached_match:
             return Match(**cached_match)
 
@@ -40,6 +55,8 @@ class DataService:
             await cache_manager.set(
                 cache_key, match.dict(), 1800, "matches"
             )  # 30 minutes
+        else:
+            await cache_manager.set_missing(cache_key, "matches")
 
         return match
 
@@ -48,9 +65,11 @@ class DataService:
         """Get team data by ID."""
         cache_manager = await get_cache_manager()
 
-        cache_key = f"team:{team_id}"
+        cache_key = self.team_cache_key(team_id)
         cached_team = await cache_manager.get(cache_key, "teams")
 
+        if cached_team == NEGATIVE_CACHE_MARKER:
+            return None
         if cached_team:
             return Team(**cached_team)
 
@@ -58,6 +77,8 @@ class DataService:
         team = await self._load_team_from_db(team_id)
         if team:
             await cache_manager.set(cache_key, team.dict(), 3600, "teams")  # 1 hour
+        else:
+            await cache_manager.set_missing(cache_key, "teams")
 
         return team
 
@@ -81,6 +102,20 @@ class DataService:
 
         return matches
 
+    async def load_matches(self, match_ids: list[str]) -> list[Match]:
+        """Load several matches from the database, bypassing the cache."""
+        matches = await asyncio.gather(
+            *(self._load_match_from_db(match_id) for match_id in match_ids)
+        )
+        return [match for match in matches if match]
+
+    async def load_teams(self, team_ids: list[str]) -> list[Team]:
+        """Load several teams from the database, bypassing the cache."""
+        teams = await asyncio.gather(
+            *(self._load_team_from_db(team_id) for team_id in team_ids)
+        )
+        return [team for team in teams if team]
+
     async def _load_match_from_db(self, match_id: str) -> Match | None:
         """Load match from database."""
         # Placeholder implementation
@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from football_predict_system.core.cache import get_cache_manager
+from football_predict_system.core.cache import CacheManager, get_cache_manager
 from football_predict_system.core.logging import get_logger, log_performance
 from football_predict_system.domain.models import Model
 
@@ -56,6 +56,22 @@ class ModelService:
 
         return next((m for m in models if m.version == model_version), None)
 
+    async def on_model_promoted(
+        self, model_version: str, cache_manager: CacheManager | None = None
+    ) -> None:
+        """
+        Invalidate model-dependent caches after a model version is promoted.
+
+        Called by the model registry; callers outside the service's event
+        loop pass a cache manager of their own.
+        """
+        cache_manager = cache_manager or await get_cache_manager()
+
+        for namespace in ("models", "predictions"):
+            await cache_manager.bump_namespace(namespace)
+
+        self.logger.info("Model caches invalidated", model_version=model_version)
+
     async def get_model_metadata(self, model_id: UUID | None = None) -> dict[str, Any]:
         """Get model metadata."""
         # Placeholder implementation
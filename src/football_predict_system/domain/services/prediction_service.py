@@ -9,9 +9,13 @@ This service handles:
 """
 
 import asyncio
+import uuid
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 from football_predict_system.core.cache import get_cache_manager
 from football_predict_system.core.exceptions import (
     InsufficientDataError,
@@ -31,10 +35,24 @@ from football_predict_system.domain.models import (
 
 logger = get_logger(__name__)
 
+# Long-run home/draw/away outcome frequencies, used when a match has no odds
+OUTCOME_PRIOR = np.array([0.46, 0.26, 0.28])
+
+# Lower bounds of the confidence score for each confidence level
+CONFIDENCE_THRESHOLDS = (
+    (0.75, PredictionConfidence.VERY_HIGH),
+    (0.6, PredictionConfidence.HIGH),
+    (0.45, PredictionConfidence.MEDIUM),
+)
+
 
 class PredictionService:
     """Service for generating match predictions."""
 
+    # Seconds a cached prediction lives, whether generated on demand or by
+    # the cache warmer; outlives the hourly warming run
+    CACHE_TTL = 7200
+
     def __init__(self) -> None:
         self.logger = get_logger(__name__)
         # Import here to avoid circular imports
@@ -44,6 +62,19 @@ class PredictionService:
         self._model_service = ModelService()
         self._data_service = DataService()
 
+    @staticmethod
+    def cache_key(match_id: Any, model_version: str | None = None) -> str:
+        """Build the prediction cache key for a match and model version."""
+        return f"{match_id}:{model_version or 'default'}"
+
+    @staticmethod
+    def cache_payload(prediction: Prediction) -> dict[str, Any]:
+        """Build the cached representation of a prediction."""
+        return {
+            "prediction": prediction.model_dump(mode="json"),
+            "cached_at": datetime.utcnow().isoformat(),
+        }
+
     @log_performance("generate_prediction")
     async def generate_prediction(
         self, request: PredictionRequest
@@ -52,7 +83,7 @@ class PredictionService:
         cache_manager = await get_cache_manager()
 
         # Check cache first
-        cache_key = f"{request.match_id}:{request.model_version or 'default'}"
+        cache_key = self.cache_key(request.match_id, request.model_version)
         cached_prediction = await cache_manager.get(cache_key, "predictions")
 
         if cached_prediction:
@@ -120,11 +151,9 @@ class PredictionService:
             prediction = await self._generate_prediction_internal(match, model)
 
             # Cache the prediction
-            cache_data = {
-                "prediction": prediction.model_dump(mode="json"),
-                "cached_at": datetime.utcnow().isoformat(),
-            }
-            await cache_manager.set(cache_key, cache_data, 3600, "predictions")
+            await cache_manager.set(
+                cache_key, self.cache_payload(prediction), self.CACHE_TTL, "predictions"
+            )
 
             return PredictionResponse(
                 prediction=prediction,
@@ -225,10 +254,64 @@ class PredictionService:
             failed_predictions=failed_count,
         )
 
+    def score_matches(self, matches: list[Any], model: Any) -> list[Prediction]:
+        """Score a batch of matches in one vectorized pass.
+
+        Outcome probabilities come from the bookmaker odds with the margin
+        removed; matches without a full set of odds fall back to the prior.
+        """
+        if not matches:
+            return []
+
+        odds = np.array(
+            [[match.home_odds, match.draw_odds, match.away_odds] for match in matches],
+            dtype=float,
+        )
+        implied = 1.0 / odds
+        missing: npt.NDArray[np.bool_] = np.asarray(
+            np.isnan(implied).any(axis=1), dtype=np.bool_
+        )
+        implied[missing] = OUTCOME_PRIOR
+        probabilities = implied / implied.sum(axis=1, keepdims=True)
+
+        best = probabilities.argmax(axis=1)
+        confidence = probabilities.max(axis=1)
+        results = [MatchResult.HOME_WIN, MatchResult.DRAW, MatchResult.AWAY_WIN]
+        model_accuracy = getattr(model, "accuracy", None) or 0.75
+        created_at = datetime.utcnow()
+
+        return [
+            Prediction(
+                id=uuid.uuid4(),
+                match_id=match.id,
+                model_version=model.version,
+                predicted_result=results[int(best[i])],
+                home_win_probability=float(probabilities[i, 0]),
+                draw_probability=float(probabilities[i, 1]),
+                away_win_probability=float(probabilities[i, 2]),
+                confidence_level=self._confidence_level(float(confidence[i])),
+                confidence_score=float(confidence[i]),
+                # Odds say nothing about the score line
+                expected_home_score=None,
+                expected_away_score=None,
+                features_used=["market_odds"] if not missing[i] else [],
+                model_accuracy=model_accuracy,
+                created_at=created_at,
+            )
+            for i, match in enumerate(matches)
+        ]
+
+    @staticmethod
+    def _confidence_level(score: float) -> PredictionConfidence:
+        """Map a confidence score to a confidence level."""
+        for threshold, level in CONFIDENCE_THRESHOLDS:
+            if score >= threshold:
+                return level
+        return PredictionConfidence.LOW
+
     async def _generate_prediction_internal(self, match: Any, model: Any) -> Prediction:
         """Internal prediction generation logic."""
         # Placeholder implementation - replace with actual ML logic
-        import uuid
         from random import uniform
 
         return Prediction(
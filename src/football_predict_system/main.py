@@ -18,14 +18,27 @@ from .core.cache import get_cache_manager
 from .core.config import get_settings
 from .core.database import get_database_manager
 from .core.exceptions import BaseApplicationError
-from .core.health import get_health_checker
-from .core.logging import get_logger, setup_logging
-from .core.security import SecurityHeaders
+from .core.health import HealthStatus, get_health_checker
+from .core.logging import (
+    LoggingMiddleware,
+    flush_logging,
+    get_logger,
+    setup_logging,
+)
+from .core.metrics import get_operation_metrics
+from .core.security import (
+    DistributedRateLimiter,
+    RateLimitMiddleware,
+    SecurityHeadersMiddleware,
+    get_api_key_store,
+    get_password_hash_pool,
+)
 
 # Initialize core components
 setup_logging()
 settings = get_settings()
 logger = get_logger(__name__)
+rate_limiter = DistributedRateLimiter(settings.rate_limit)
 
 
 @asynccontextmanager
@@ -37,10 +50,37 @@ async def lifespan(app: FastAPI):
     db_manager = get_database_manager()
     _ = db_manager.get_engine()  # Initialize sync engine
     _ = db_manager.get_async_engine()  # Initialize async engine
+    db_manager.start_replica_checks()  # Track read replica health and lag
 
     # Initialize cache connections
     cache_manager = await get_cache_manager()
     _ = await cache_manager.get_redis_client()
+    await cache_manager.sync_generations(force=True)
+    await cache_manager.load_memory_from_disk()
+
+    # Forget idle clients of the fallback rate limiter in the background
+    rate_limiter.fallback.start_eviction()
+
+    # Hash passwords on dedicated threads rather than the event loop
+    password_hash_pool = get_password_hash_pool()
+
+    # Load API keys and follow changes made by other workers
+    api_key_store = get_api_key_store()
+    await api_key_store.load()
+    api_key_store.start_listening()
+
+    # Log operation latency summaries periodically
+    operation_metrics = get_operation_metrics()
+    operation_metrics.start_flushing(
+        settings.monitoring.operation_metrics_flush_interval
+    )
+
+    # Sample system resources and probe components in the background;
+    # health endpoints serve the latest snapshot
+    health_checker = get_health_checker()
+    resource_sampler = health_checker.resource_sampler
+    resource_sampler.start()
+    health_checker.start_probing()
 
     # Initialize Prometheus metrics
     if hasattr(app.state, "instrumentator"):
@@ -52,9 +92,16 @@ async def lifespan(app: FastAPI):
 
     # Cleanup resources
     logger.info("Application shutdown sequence initiated")
+    await api_key_store.stop_listening()
+    await operation_metrics.stop_flushing()
+    await health_checker.stop_probing()
+    await resource_sampler.stop()
+    await rate_limiter.fallback.stop_eviction()
+    password_hash_pool.shutdown()
     await db_manager.close()
     await cache_manager.close()
     logger.info("Application shutdown complete")
+    flush_logging()
 
 
 # Create FastAPI application
@@ -95,6 +142,9 @@ app.state.instrumentator = instrumentator
 
 
 # Configure middleware
+app.add_middleware(
+    RateLimitMiddleware, config=settings.rate_limit, limiter=rate_limiter
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.api.cors_origins,
@@ -102,16 +152,8 @@ app.add_middleware(
     allow_methods=settings.api.cors_methods,
     allow_headers=settings.api.cors_headers,
 )
-
-
-@app.middleware("http")
-async def security_headers_middleware(request: Request, call_next):
-    """Add security headers to all responses."""
-    response = await call_next(request)
-    headers = SecurityHeaders.get_security_headers()
-    for key, value in headers.items():
-        response.headers[key] = value
-    return response
+app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(LoggingMiddleware, config=settings.logging)
 
 
 # Configure exception handlers
@@ -199,51 +241,45 @@ async def readiness_check():
     """
     Kubernetes readiness probe endpoint.
 
-    Checks if the service is ready to accept traffic by verifying:
+    Checks if the service is ready to accept traffic by verifying, in the
+    latest health snapshot:
     - Database connectivity
     - Cache availability
-    - Essential dependencies
+    - The snapshot is not stale
 
     Returns 200 if ready, 503 if not ready.
     """
     try:
-        # Check critical dependencies only
-        db_manager = get_database_manager()
-        cache_manager = await get_cache_manager()
-
-        # Quick health checks for readiness
-        db_check = await db_manager.health_check()
-
-        # Try to ping Redis
-        redis_client = await cache_manager.get_redis_client()
-        cache_healthy = True
-        try:
-            await redis_client.ping()
-        except Exception:
-            cache_healthy = False
-
-        # Service is ready if both critical services are healthy
-        if db_check.get("status") == "healthy" and cache_healthy:
+        snapshot = await get_health_checker().get_snapshot()
+        checks = {}
+        for name, component in (("database", "database"), ("cache", "redis")):
+            health = snapshot.component(component)
+            healthy = health is not None and health.status == HealthStatus.HEALTHY
+            checks[name] = "healthy" if healthy else "unhealthy"
+
+        age = round(snapshot.age, 3)
+        stale = age > settings.monitoring.health_stale_after
+
+        # Service is ready if both critical services were healthy recently
+        if all(check == "healthy" for check in checks.values()) and not stale:
             return {
                 "status": "ready",
                 "timestamp": datetime.utcnow().isoformat(),
-                "checks": {"database": "healthy", "cache": "healthy"},
+                "checks": checks,
+                "age_seconds": age,
             }
         raise HTTPException(
             status_code=503,
             detail={
                 "status": "not_ready",
                 "timestamp": datetime.utcnow().isoformat(),
-                "checks": {
-                    "database": (
-                        "healthy"
-                        if db_check.get("status") == "healthy"
-                        else "unhealthy"
-                    ),
-                    "cache": "healthy" if cache_healthy else "unhealthy",
-                },
+                "checks": checks,
+                "age_seconds": age,
+                "stale": stale,
             },
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.warning("Readiness check failed", error=str(e))
         raise HTTPException(
@@ -264,11 +300,16 @@ async def liveness_check():
     Simple endpoint to verify the application process is alive and responding.
     This should only fail if the application is completely unresponsive.
 
-    Always returns 200 unless the process is dead.
+    Always returns 200 unless the process is dead. Reports the age of the
+    latest health snapshot without probing anything.
     """
+    snapshot = get_health_checker().snapshot
     return {
         "status": "alive",
         "timestamp": datetime.utcnow().isoformat(),
+        "health_snapshot_age_seconds": (
+            round(snapshot.age, 3) if snapshot is not None else None
+        ),
         "uptime_seconds": (
             __import__("time").time()
             - app.state.__dict__.get("start_time", __import__("time").time())
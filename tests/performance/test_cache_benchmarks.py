@@ -0,0 +1,93 @@
+"""
+缓存性能基准测试
+
+同一组缓存基准分别运行在内存后端与Redis后端上, 对比吞吐量与延迟。
+Redis后端需要可用的Redis服务 (ENABLE_DB_TESTS=1)。
+"""
+
+import time
+from statistics import mean
+
+import pytest
+
+from football_predict_system.core.cache import CacheManager, InMemoryBackend
+from football_predict_system.core.cache.backends import create_backend
+from football_predict_system.core.config import get_settings
+
+OPERATIONS = 2000
+BATCH_SIZE = 200
+
+
+def _report(title: str, results: dict[str, float]) -> None:
+    """打印基准测试结果"""
+    print(f"\n📊 {title}")
+    for key, value in results.items():
+        print(f"  {key}: {value:.2f}")
+
+
+@pytest.fixture(
+    params=[
+        "memory",
+        pytest.param("redis", marks=[pytest.mark.integration]),
+    ]
+)
+async def cache_manager(request):
+    """在指定后端上创建缓存管理器"""
+    manager = CacheManager()
+    if request.param == "memory":
+        manager._redis_client = InMemoryBackend()
+    else:
+        manager._redis_client = create_backend(get_settings())
+    await manager.clear_namespace("bench")
+    yield manager
+    await manager.clear_namespace("bench")
+    await manager.close()
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_cache_get_set_throughput(cache_manager):
+    """单键读写吞吐量"""
+    payload = {"home": 0.45, "draw": 0.27, "away": 0.28}
+    latencies = []
+
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        op_start = time.perf_counter()
+        await cache_manager.set(f"k{i}", payload, 60, "bench")
+        latencies.append((time.perf_counter() - op_start) * 1000)
+    set_seconds = time.perf_counter() - start
+
+    cache_manager.clear_memory_cache()
+
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        assert await cache_manager.get(f"k{i}", "bench") == payload
+    get_seconds = time.perf_counter() - start
+
+    _report(
+        f"缓存读写 ({type(cache_manager._redis_client).__name__})",
+        {
+            "set ops/sec": OPERATIONS / set_seconds,
+            "get ops/sec": OPERATIONS / get_seconds,
+            "avg set latency (ms)": mean(latencies),
+        },
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_cache_bulk_set_throughput(cache_manager):
+    """批量写入吞吐量"""
+    batches = OPERATIONS // BATCH_SIZE
+
+    start = time.perf_counter()
+    for b in range(batches):
+        items = {f"b{b}:{i}": i for i in range(BATCH_SIZE)}
+        assert await cache_manager.set_many(items, 60, "bench") == BATCH_SIZE
+    seconds = time.perf_counter() - start
+
+    _report(
+        f"批量写入 ({type(cache_manager._redis_client).__name__})",
+        {"keys/sec": OPERATIONS / seconds},
+    )
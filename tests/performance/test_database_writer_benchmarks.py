@@ -0,0 +1,300 @@
+"""
+数据写入性能基准测试
+
+批量 upsert: 每秒可写入的球队行数, 对比逐行 SELECT + INSERT/UPDATE 的原实现
+与每批一条 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 语句的实现。
+在临时 SQLite 数据库上分别测量 1 万行与 10 万行 (插入一遍, 再更新一遍)。
+比赛入库: 每场比赛的 SQL 语句数, 对比逐场查询主客队 id 的原实现与每批一次
+IN 查询解析球队 id 的实现。
+历史回填: 100 万场合成比赛经二进制 COPY 进入 UNLOGGED 暂存表再合并的吞吐量,
+对比批量 ON CONFLICT。需要本地 PostgreSQL: 将 BENCHMARK_POSTGRES_URL 指向一个
+可清空的专用库 (会 TRUNCATE teams 和 matches)。
+"""
+
+import os
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import event, text
+
+from football_predict_system.core.config import DatabaseConfig
+from football_predict_system.core.database import DatabaseManager
+from football_predict_system.data_platform.storage.database_writer import (
+    DatabaseWriter,
+)
+
+SCHEMA = Path(__file__).parents[2] / "sql" / "schema_sqlite.sql"
+POSTGRES_SCHEMA = Path(__file__).parents[2] / "sql" / "schema_postgresql.sql"
+POSTGRES_URL = os.getenv("BENCHMARK_POSTGRES_URL")
+WRITER = "football_predict_system.data_platform.storage.database_writer"
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """临时 SQLite 数据库"""
+    manager = DatabaseManager()
+    manager.settings = MagicMock()
+    manager.settings.get_database_url.return_value = f"sqlite:///{tmp_path}/bench.db"
+    manager.settings.database = DatabaseConfig()
+
+    statements = [s for s in SCHEMA.read_text().split(";") if s.strip()]
+    async with manager.get_async_session() as session:
+        for statement in statements:
+            await session.execute(text(statement))
+
+    with (
+        patch(f"{WRITER}.get_database_manager", return_value=manager),
+        patch(f"{WRITER}.get_cache_manager", AsyncMock()),
+    ):
+        yield manager
+    await manager.close()
+
+
+def _teams(rows: int, name: str = "Team") -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "external_api_id": range(rows),
+            "name": [f"{name} {i}" for i in range(rows)],
+            "short_name": [f"T{i}" for i in range(rows)],
+        }
+    )
+
+
+async def _legacy_upsert_teams(manager: DatabaseManager, df: pd.DataFrame) -> None:
+    """原实现: 每行先 SELECT, 再 INSERT 或 UPDATE"""
+    async with manager.get_async_session() as session:
+        for _, row in df.iterrows():
+            existing = (
+                await session.execute(
+                    text("SELECT id FROM teams WHERE external_api_id = :external_id"),
+                    {"external_id": int(row["external_api_id"])},
+                )
+            ).fetchone()
+            params = {
+                "external_api_id": int(row["external_api_id"]),
+                "name": row["name"],
+                "short_name": row["short_name"],
+            }
+            if existing:
+                await session.execute(
+                    text(
+                        "UPDATE teams SET name = :name, short_name = :short_name, "
+                        "updated_at = datetime('now') "
+                        "WHERE external_api_id = :external_api_id"
+                    ),
+                    params,
+                )
+            else:
+                await session.execute(
+                    text(
+                        "INSERT INTO teams (id, external_api_id, name, short_name) "
+                        "VALUES (:id, :external_api_id, :name, :short_name)"
+                    ),
+                    {**params, "id": str(uuid.uuid4())},
+                )
+
+
+async def _rows_per_second(upsert, rows: int) -> float:
+    """插入一遍再更新一遍的总吞吐量"""
+    start = time.perf_counter()
+    await upsert(_teams(rows))
+    await upsert(_teams(rows, name="Renamed"))
+    return rows * 2 / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+async def test_team_upsert_throughput_10k(db_manager):
+    """1 万行球队 upsert: 逐行 vs 批量 ON CONFLICT"""
+    rows = 10_000
+    batched = await _rows_per_second(DatabaseWriter().upsert_teams, rows)
+    async with db_manager.get_async_session() as session:
+        await session.execute(text("DELETE FROM teams"))
+    legacy = await _rows_per_second(
+        lambda df: _legacy_upsert_teams(db_manager, df), rows
+    )
+
+    print(f"\n📊 球队 upsert 吞吐量 ({rows:,} 行, 插入 + 更新, SQLite)")
+    print(f"  SELECT + INSERT/UPDATE per row: {legacy:,.0f} rows/s")
+    print(f"  batched ON CONFLICT: {batched:,.0f} rows/s")
+    print(f"  speedup: {batched / legacy:.1f}x")
+
+    assert batched > legacy * 3
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+async def test_team_upsert_throughput_100k(db_manager):
+    """10 万行球队 upsert: 批量 ON CONFLICT"""
+    rows = 100_000
+    writer = DatabaseWriter()
+    batched = await _rows_per_second(writer.upsert_teams, rows)
+
+    async with db_manager.get_async_session() as session:
+        count = (await session.execute(text("SELECT COUNT(*) FROM teams"))).scalar()
+
+    print(f"\n📊 球队 upsert 吞吐量 ({rows:,} 行, 插入 + 更新, SQLite)")
+    print(f"  batched ON CONFLICT: {batched:,.0f} rows/s")
+
+    assert count == rows
+
+
+def _matches(rows: int, teams: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "external_api_id": range(rows),
+            "home_team_id": [i % teams for i in range(rows)],
+            "away_team_id": [(i + 1) % teams for i in range(rows)],
+            "match_date": "2024-01-01",
+            "status": "SCHEDULED",
+        }
+    )
+
+
+async def _legacy_upsert_matches(manager: DatabaseManager, df: pd.DataFrame) -> None:
+    """原实现: 每场比赛查询比赛是否存在, 再分别查询主客队 id, 然后写入"""
+    async with manager.get_async_session() as session:
+        for _, row in df.iterrows():
+            await session.execute(
+                text("SELECT id FROM matches WHERE external_api_id = :external_id"),
+                {"external_id": int(row["external_api_id"])},
+            )
+            team_ids = []
+            for column in ("home_team_id", "away_team_id"):
+                result = await session.execute(
+                    text("SELECT id FROM teams WHERE external_api_id = :external_id"),
+                    {"external_id": int(row[column])},
+                )
+                team_ids.append(result.scalar())
+            await session.execute(
+                text(
+                    "INSERT INTO matches (id, external_api_id, home_team_id, "
+                    "away_team_id, match_date, status) VALUES (:id, :external_api_id, "
+                    ":home_team_id, :away_team_id, :match_date, :status)"
+                ),
+                {
+                    "id": str(uuid.uuid4()),
+                    "external_api_id": int(row["external_api_id"]),
+                    "home_team_id": team_ids[0],
+                    "away_team_id": team_ids[1],
+                    "match_date": row["match_date"],
+                    "status": "scheduled",
+                },
+            )
+
+
+async def _statements_and_rate(manager, upsert, df) -> tuple[float, float]:
+    """每场比赛的语句数与每秒入库场数"""
+    counts = {"statements": 0}
+
+    def count(*args):
+        counts["statements"] += 1
+
+    engine = manager.get_async_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    start = time.perf_counter()
+    await upsert(df)
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", count)
+    return counts["statements"] / len(df), len(df) / elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+async def test_match_ingestion_queries_per_match(db_manager):
+    """比赛入库: 逐场解析球队 vs 每批一次 IN 查询"""
+    rows, teams = 10_000, 20
+    await DatabaseWriter().upsert_teams(_teams(teams))
+
+    batched = await _statements_and_rate(
+        db_manager, DatabaseWriter().upsert_matches, _matches(rows, teams)
+    )
+    async with db_manager.get_async_session() as session:
+        await session.execute(text("DELETE FROM matches"))
+    legacy = await _statements_and_rate(
+        db_manager,
+        lambda df: _legacy_upsert_matches(db_manager, df),
+        _matches(rows, teams),
+    )
+
+    print(f"\n📊 比赛入库 ({rows:,} 场, {teams} 支球队, SQLite)")
+    print(
+        f"  per-match lookups: {legacy[0]:.3f} statements/match, "
+        f"{legacy[1]:,.0f} matches/s"
+    )
+    print(
+        f"  batched resolution + upsert: {batched[0]:.3f} statements/match, "
+        f"{batched[1]:,.0f} matches/s"
+    )
+
+    assert batched[0] <= 0.01
+
+
+@pytest.fixture
+async def postgres_manager():
+    """BENCHMARK_POSTGRES_URL 指向的 PostgreSQL 库, 表已清空"""
+    manager = DatabaseManager()
+    manager.settings = MagicMock()
+    manager.settings.get_database_url.return_value = POSTGRES_URL
+    manager.settings.database.echo = False
+    manager.settings.database.pool_size = 5
+    manager.settings.database.max_overflow = 0
+    manager.settings.database.pool_timeout = 30
+    manager.settings.database.pool_recycle = 3600
+
+    statements = [s for s in POSTGRES_SCHEMA.read_text().split(";") if s.strip()]
+    async with manager.get_async_session() as session:
+        for statement in statements:
+            await session.execute(text(statement))
+        await session.execute(text("TRUNCATE matches, teams RESTART IDENTITY"))
+
+    with (
+        patch(f"{WRITER}.get_database_manager", return_value=manager),
+        patch(f"{WRITER}.get_cache_manager", AsyncMock()),
+    ):
+        yield manager
+    await manager.close()
+
+
+def _season(rows: int, teams: int) -> pd.DataFrame:
+    df = _matches(rows, teams)
+    df["match_date"] = pd.Timestamp("2000-01-01") + pd.to_timedelta(
+        df["external_api_id"], unit="h"
+    )
+    df["home_score"] = df["external_api_id"] % 5
+    df["away_score"] = df["external_api_id"] % 3
+    return df
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.skipif(not POSTGRES_URL, reason="BENCHMARK_POSTGRES_URL not set")
+async def test_backfill_copy_throughput_1m(postgres_manager):
+    """100 万场历史比赛: 二进制 COPY + 合并 vs 批量 ON CONFLICT"""
+    rows, teams = 1_000_000, 500
+    writer = DatabaseWriter()
+    await writer.upsert_teams(_teams(teams))
+
+    df = _season(rows, teams)
+    start = time.perf_counter()
+    loaded = await writer.bulk_load_matches(df)
+    copy_rate = rows / (time.perf_counter() - start)
+
+    async with postgres_manager.get_async_session() as session:
+        await session.execute(text("TRUNCATE matches"))
+    sample = _season(100_000, teams)
+    start = time.perf_counter()
+    await writer.upsert_matches(sample)
+    upsert_rate = len(sample) / (time.perf_counter() - start)
+
+    print(f"\n📊 历史回填 ({rows:,} 场比赛, PostgreSQL)")
+    print(f"  batched ON CONFLICT (100k sample): {upsert_rate:,.0f} rows/s")
+    print(f"  COPY to unlogged staging + merge: {copy_rate:,.0f} rows/s")
+    print(f"  speedup: {copy_rate / upsert_rate:.1f}x")
+
+    assert loaded == {"inserted": rows, "updated": 0, "failed": 0}
+    assert copy_rate > upsert_rate
@@ -0,0 +1,157 @@
+"""
+日志性能基准测试
+
+错误风暴: 同一调用点每秒成千上万次 error 日志时的日志吞吐量, 对比每条日志
+都格式化调用栈 (原实现) 与按调用点采样、延迟格式化调用栈的 ErrorProcessor。
+JSON渲染: 单核每秒可渲染的日志行数, 对比每行读取配置并使用 json.dumps 的
+原渲染器与缓存服务信息、使用 orjson 输出字节的渲染器。
+"""
+
+import json
+import time
+import traceback
+from typing import Any
+
+import pytest
+import structlog
+
+from football_predict_system.core.config import get_settings
+from football_predict_system.core.logging import (
+    CorrelationIDProcessor,
+    CustomJSONRenderer,
+    ErrorProcessor,
+    PerformanceProcessor,
+)
+
+ERRORS = 20_000
+LINES = 50_000
+
+
+class LegacyErrorProcessor:
+    """原实现: 每条错误日志都格式化调用栈和异常回溯"""
+
+    def __call__(self, logger, method_name, event_dict):
+        if method_name in ("error", "exception", "critical"):
+            if "error" in event_dict:
+                error = event_dict["error"]
+                if isinstance(error, Exception):
+                    event_dict["error_details"] = {
+                        "type": error.__class__.__name__,
+                        "message": str(error),
+                        "traceback": traceback.format_exception(
+                            type(error), error, error.__traceback__
+                        ),
+                    }
+                    event_dict["error"] = str(error)
+            if "exc_info" not in event_dict:
+                event_dict["stack_trace"] = traceback.format_stack()
+        return event_dict
+
+
+class LegacyJSONRenderer:
+    """原实现: 每行读取配置、重建服务信息并使用 json.dumps"""
+
+    def __call__(self, logger, method_name, event_dict):
+        if "timestamp" not in event_dict:
+            event_dict["timestamp"] = time.time()
+        if "level" not in event_dict:
+            event_dict["level"] = method_name.upper()
+        settings = get_settings()
+        event_dict["service"] = {
+            "name": settings.logging.service_name,
+            "version": settings.logging.service_version,
+            "environment": settings.environment.value,
+        }
+        return json.dumps(event_dict, default=str, ensure_ascii=False)
+
+
+class NullLogger:
+    """丢弃渲染结果, 只测量处理器链的开销"""
+
+    def info(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def error(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def _logger(error_processor):
+    return structlog.wrap_logger(
+        NullLogger(),
+        processors=[
+            CorrelationIDProcessor(),
+            PerformanceProcessor(),
+            error_processor,
+            structlog.processors.add_log_level,
+            CustomJSONRenderer(),
+        ],
+    )
+
+
+def _lines_per_second(logger) -> float:
+    """同一调用点的错误日志 (一半附带异常对象) 吞吐量"""
+    try:
+        raise ConnectionError("database unavailable")
+    except ConnectionError as e:
+        error = e
+
+    start = time.perf_counter()
+    for i in range(ERRORS):
+        if i % 2:
+            logger.error("Query failed", error=error)
+        else:
+            logger.error("Query failed", table="matches")
+    return ERRORS / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+def test_error_storm_logging_throughput():
+    """错误风暴下的日志吞吐量: 每条格式化调用栈 vs 采样延迟格式化"""
+    legacy = _lines_per_second(_logger(LegacyErrorProcessor()))
+    sampled = _lines_per_second(_logger(ErrorProcessor()))
+
+    print(f"\n📊 错误风暴日志吞吐量 ({ERRORS} 条 error 日志, 同一调用点)")
+    print(f"  format_stack per line: {legacy:,.0f} lines/s")
+    print(f"  sampled lazy stacks: {sampled:,.0f} lines/s")
+    print(f"  speedup: {sampled / legacy:.1f}x")
+
+    assert sampled > legacy * 3
+
+
+def _render_lines_per_second(renderer) -> float:
+    """典型请求日志经完整处理器链渲染的单核吞吐量"""
+    logger = structlog.wrap_logger(
+        NullLogger(),
+        processors=[
+            CorrelationIDProcessor(),
+            PerformanceProcessor(),
+            structlog.processors.add_log_level,
+            renderer,
+        ],
+    )
+
+    start = time.perf_counter()
+    for i in range(LINES):
+        logger.info(
+            "Request completed",
+            method="GET",
+            path="/api/v1/predictions",
+            status_code=200,
+            duration=0.0123,
+            match_id=i,
+        )
+    return LINES / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+def test_json_renderer_throughput():
+    """JSON日志渲染吞吐量: json.dumps vs 缓存服务信息 + orjson"""
+    legacy = _render_lines_per_second(LegacyJSONRenderer())
+    fast = _render_lines_per_second(CustomJSONRenderer())
+
+    print(f"\n📊 JSON日志渲染吞吐量 ({LINES} 行, 单核)")
+    print(f"  get_settings + json.dumps: {legacy:,.0f} lines/s")
+    print(f"  cached service block + orjson: {fast:,.0f} lines/s")
+    print(f"  speedup: {fast / legacy:.1f}x")
+
+    assert fast > legacy
@@ -0,0 +1,105 @@
+"""
+中间件性能基准测试
+
+直接以ASGI调用 /health/live, 测量添加安全响应头的每请求开销:
+原 @app.middleware("http") 函数 (BaseHTTPMiddleware) 与预编码响应头的
+纯ASGI中间件对比。
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+
+from football_predict_system.core.security.headers import (
+    SecurityHeaders,
+    SecurityHeadersMiddleware,
+)
+from football_predict_system.main import liveness_check
+
+REQUESTS = 5_000
+
+
+def _liveness_app() -> FastAPI:
+    """只包含 /health/live 路由的应用"""
+    app = FastAPI()
+    app.get("/health/live")(liveness_check)
+    return app
+
+
+def _legacy_app() -> FastAPI:
+    """原实现: 每次响应重建响应头字典"""
+    app = _liveness_app()
+
+    @app.middleware("http")
+    async def security_headers_middleware(request: Request, call_next):
+        response = await call_next(request)
+        headers = SecurityHeaders.get_security_headers()
+        for key, value in headers.items():
+            response.headers[key] = value
+        return response
+
+    return app
+
+
+def _asgi_app() -> FastAPI:
+    """新实现: 纯ASGI中间件"""
+    app = _liveness_app()
+    app.add_middleware(SecurityHeadersMiddleware)
+    return app
+
+
+async def _request_cost_us(app: FastAPI) -> float:
+    """平均每个请求的耗时 (微秒)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/health/live",
+        "raw_path": b"/health/live",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(100):  # 预热 (包括构建中间件栈)
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / REQUESTS * 1_000_000
+
+
+@pytest.mark.performance
+def test_security_headers_middleware_overhead():
+    """安全响应头中间件的每请求开销"""
+
+    async def measure():
+        return (
+            await _request_cost_us(_liveness_app()),
+            await _request_cost_us(_legacy_app()),
+            await _request_cost_us(_asgi_app()),
+        )
+
+    bare_us, legacy_us, asgi_us = asyncio.run(measure())
+
+    print(f"\n📊 /health/live 每请求耗时 ({REQUESTS} 次请求)")
+    print(f"  no middleware: {bare_us:.1f} µs")
+    print(
+        f"  @app.middleware('http'): {legacy_us:.1f} µs (+{legacy_us - bare_us:.1f} µs)"
+    )
+    print(f"  pure ASGI: {asgi_us:.1f} µs (+{asgi_us - bare_us:.1f} µs)")
+
+    assert asgi_us < legacy_us
@@ -0,0 +1,117 @@
+"""
+查询统计性能基准测试
+
+钩子开销: 在内存 SQLite 上反复执行同一条带参数的查询, 对比不挂事件钩子、
+原钩子 (time.time 计时, 只记录慢查询) 与按语句指纹聚合统计的钩子,
+得到每条语句增加的微秒数。三种引擎交替测量多轮, 取最小值。
+记录开销: 直接调用 QueryStats.record 的每次耗时 (指纹已缓存)。
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from football_predict_system.core.database import DatabaseManager
+from football_predict_system.core.query_stats import QueryStats
+
+STATEMENTS = 5_000
+ROUNDS = 5
+
+
+def _legacy_hooks(engine):
+    """原实现: time.time 计时, 只记录超过 1 秒的查询"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before(_conn, _cursor, statement, parameters, context, _executemany):
+        context._query_start_time = time.time()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after(_conn, _cursor, statement, parameters, context, _executemany):
+        total = time.time() - context._query_start_time
+        if total > 1.0:
+            pass
+
+
+def _engine(hooks=None):
+    engine = create_engine("sqlite://")
+    if hooks:
+        hooks(engine)
+    return engine
+
+
+def _stats_hooks(stats):
+    manager = DatabaseManager()
+    manager.settings = SimpleNamespace(
+        debug=False, database=SimpleNamespace(query_stats_enabled=True)
+    )
+
+    def hooks(engine):
+        with patch(
+            "football_predict_system.core.database.get_query_stats",
+            return_value=stats,
+        ):
+            manager._setup_engine_events(engine)
+
+    return hooks
+
+
+def _us_per_statement(engine) -> float:
+    query = text("SELECT :team_id")
+    with engine.connect() as conn:
+        for i in range(100):
+            conn.execute(query, {"team_id": i})
+        start = time.perf_counter()
+        for i in range(STATEMENTS):
+            conn.execute(query, {"team_id": i})
+        return (time.perf_counter() - start) / STATEMENTS * 1e6
+
+
+@pytest.mark.performance
+def test_hook_overhead_per_statement():
+    """每条语句的钩子开销: 无钩子 vs 原钩子 vs 统计钩子"""
+    stats = QueryStats()
+    engines = {
+        "bare": _engine(),
+        "legacy": _engine(_legacy_hooks),
+        "tracked": _engine(_stats_hooks(stats)),
+    }
+    timings: dict[str, list[float]] = {name: [] for name in engines}
+    for _ in range(ROUNDS):
+        for name, engine in engines.items():
+            timings[name].append(_us_per_statement(engine))
+    bare, legacy, tracked = (min(timings[name]) for name in engines)
+
+    print(f"\n📊 查询钩子开销 ({STATEMENTS:,} 条语句, 内存 SQLite)")
+    print(f"  no hooks: {bare:.2f} µs/statement")
+    print(
+        f"  legacy slow-query hooks: {legacy:.2f} µs/statement (+{legacy - bare:.2f})"
+    )
+    print(
+        f"  per-statement stats hooks: {tracked:.2f} µs/statement "
+        f"(+{tracked - bare:.2f})"
+    )
+
+    [summary] = stats.summary()
+    assert summary["count"] == (STATEMENTS + 100) * ROUNDS
+    assert tracked < bare * 2
+
+
+@pytest.mark.performance
+def test_record_cost():
+    """QueryStats.record 单次耗时"""
+    stats = QueryStats()
+    statement = "SELECT id, name FROM teams WHERE external_api_id IN (?, ?, ?)"
+    calls = 200_000
+
+    start = time.perf_counter()
+    for i in range(calls):
+        stats.record(statement, 50_000 + i, 3)
+    per_call = (time.perf_counter() - start) / calls * 1e9
+
+    print("\n📊 QueryStats.record")
+    print(f"  {per_call:,.0f} ns/call")
+
+    assert stats.summary()[0]["count"] == calls
@@ -0,0 +1,150 @@
+"""
+SQLite 单机部署性能基准测试
+
+并发读写: 同一个数据库文件上, API 的只读会话持续执行聚合查询, 同时应用内
+写会话和一个采集脚本 (独立线程, 直接使用 sqlite3, 与 scripts/ 下的采集脚本
+一致) 持续批量写入。对比默认配置 (回滚日志、每个会话新建连接) 与调优配置
+(WAL、synchronous=NORMAL、mmap/cache/busy_timeout、只读连接池加单一写会话连接),
+统计每秒读次数、读延迟 p99、写入行数与锁错误数。
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from football_predict_system.core.config import DatabaseConfig, SQLiteConfig
+from football_predict_system.core.database import DatabaseManager
+from football_predict_system.core.exceptions import DatabaseError
+
+SECONDS = 3.0
+READERS = 4
+TEAMS = 20
+ROWS = 20_000
+BATCH = 50
+
+READ = text("SELECT COUNT(*), AVG(score) FROM matches WHERE team = :team")
+INSERT = "INSERT INTO matches (team, score, payload) VALUES (?, ?, ?)"
+
+
+def _database(path) -> str:
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE matches (id INTEGER PRIMARY KEY, team INTEGER, "
+            "score INTEGER, payload TEXT)"
+        )
+        conn.executemany(INSERT, _rows(ROWS))
+    return f"sqlite:///{path}"
+
+
+def _rows(count: int) -> list[tuple[int, int, str]]:
+    return [(i % TEAMS, i % 5, "x" * 100) for i in range(count)]
+
+
+def _manager(url: str, tuned: bool) -> DatabaseManager:
+    manager = DatabaseManager()
+    manager.settings = MagicMock()
+    manager.settings.get_database_url.return_value = url
+    manager.settings.database = DatabaseConfig(
+        query_stats_enabled=False, sqlite=SQLiteConfig(enabled=tuned)
+    )
+    manager.settings.debug = False
+    return manager
+
+
+async def _mixed_workload(manager: DatabaseManager, path) -> dict[str, float]:
+    """API 读 + 应用内写 + 采集脚本写, 持续 SECONDS 秒"""
+    deadline = time.perf_counter() + SECONDS
+    latencies: list[float] = []
+    counts = {"reads": 0, "writes": 0, "collector": 0, "errors": 0}
+
+    async def reader(team: int) -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                async with manager.get_async_session(read_only=True) as session:
+                    await session.execute(READ, {"team": team})
+            except DatabaseError:
+                counts["errors"] += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            counts["reads"] += 1
+
+    async def writer() -> None:
+        params = [
+            {"team": team, "score": score, "payload": payload}
+            for team, score, payload in _rows(BATCH)
+        ]
+        while time.perf_counter() < deadline:
+            try:
+                async with manager.get_async_session(write=True) as session:
+                    await session.execute(
+                        text(
+                            "INSERT INTO matches (team, score, payload) "
+                            "VALUES (:team, :score, :payload)"
+                        ),
+                        params,
+                    )
+            except DatabaseError:
+                counts["errors"] += 1
+                continue
+            counts["writes"] += BATCH
+            await asyncio.sleep(0)
+
+    def collector() -> None:
+        conn = sqlite3.connect(path)
+        while time.perf_counter() < deadline:
+            try:
+                with conn:
+                    conn.executemany(INSERT, _rows(BATCH))
+            except sqlite3.OperationalError:
+                counts["errors"] += 1
+                continue
+            counts["collector"] += BATCH
+        conn.close()
+
+    # 服务先于采集脚本启动: 调优配置在第一个连接上切换到 WAL
+    async with manager.get_async_session() as session:
+        await session.execute(READ, {"team": 0})
+
+    thread = threading.Thread(target=collector)
+    thread.start()
+    await asyncio.gather(writer(), *(reader(i) for i in range(READERS)))
+    thread.join()
+    await manager.close()
+
+    latencies.sort()
+    return {
+        **counts,
+        "reads_per_second": counts["reads"] / SECONDS,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+async def test_concurrent_read_write(tmp_path):
+    """并发读写: 默认配置 vs 调优配置"""
+    results = {}
+    for name, tuned in (("default", False), ("tuned", True)):
+        path = tmp_path / f"{name}.db"
+        results[name] = await _mixed_workload(_manager(_database(path), tuned), path)
+
+    print(
+        f"\n📊 并发读写 ({READERS} 个读会话 + 应用写 + 采集脚本写, "
+        f"{SECONDS:.0f} 秒, SQLite)"
+    )
+    for name, result in results.items():
+        print(
+            f"  {name}: {result['reads_per_second']:,.0f} reads/s, "
+            f"read p99 {result['p99_ms']:.1f} ms, "
+            f"{result['writes']:,} app rows, {result['collector']:,} collector rows, "
+            f"{result['errors']} lock errors"
+        )
+
+    assert results["tuned"]["reads_per_second"] > results["default"]["reads_per_second"]
+    assert results["tuned"]["errors"] <= results["default"]["errors"]
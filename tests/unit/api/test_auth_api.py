@@ -0,0 +1,60 @@
+"""
+Tests for the v1 authentication endpoints.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from football_predict_system.api.v1.auth import router
+from football_predict_system.core.exceptions import RateLimitError
+from football_predict_system.core.security import get_auth_service
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/auth")
+    return TestClient(app)
+
+
+class TestTokenEndpoint:
+    """Test POST /auth/token."""
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_issues_verifiable_token(self, client):
+        """Test valid credentials get a token the shared service accepts."""
+        response = client.post(
+            "/auth/token", json={"username": "admin", "password": "admin"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["token_type"] == "bearer"
+        payload = get_auth_service().jwt_manager.verify_token(body["access_token"])
+        assert payload.user_id == "admin_user"
+
+    def test_invalid_credentials(self, client):
+        """Test wrong credentials are rejected with 401."""
+        response = client.post(
+            "/auth/token", json={"username": "admin", "password": "wrong"}
+        )
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+
+    def test_hashing_backlog_full(self, client):
+        """Test a full password hashing backlog answers 429."""
+        with patch.object(
+            get_auth_service(),
+            "authenticate_user_async",
+            AsyncMock(side_effect=RateLimitError(retry_after=1)),
+        ):
+            response = client.post(
+                "/auth/token", json={"username": "admin", "password": "x"}
+            )
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
@@ -0,0 +1,250 @@
+"""
+Tests for the API key store.
+
+Runs the store against a temporary SQLite database created from the
+project schema and the in-memory cache backend for change notifications.
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from football_predict_system.core.cache import InMemoryBackend
+from football_predict_system.core.config import DatabaseConfig
+from football_predict_system.core.database import DatabaseManager
+from football_predict_system.core.security.api_keys import (
+    APIKeyStore,
+    hash_api_key,
+    require_api_key,
+)
+from football_predict_system.core.security.models import APIKey, UserRole
+
+SCHEMA = Path(__file__).parents[4] / "sql" / "schema_sqlite.sql"
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Create a database manager on a temporary SQLite database."""
+    manager = DatabaseManager()
+    manager.settings = MagicMock()
+    manager.settings.get_database_url.return_value = f"sqlite:///{tmp_path}/keys.db"
+    manager.settings.database = DatabaseConfig()
+
+    statements = [s for s in SCHEMA.read_text().split(";") if s.strip()]
+    async with manager.get_async_session() as session:
+        for statement in statements:
+            await session.execute(text(statement))
+
+    with patch(
+        "football_predict_system.core.database.get_database_manager",
+        return_value=manager,
+    ):
+        yield manager
+    await manager.close()
+
+
+@pytest.fixture
+def backend():
+    """Provide the in-memory cache backend for notifications."""
+    backend = InMemoryBackend()
+    cache_manager = MagicMock()
+
+    async def get_redis_client():
+        return backend
+
+    async def get_cache_manager():
+        return cache_manager
+
+    cache_manager.get_redis_client = get_redis_client
+    with patch(
+        "football_predict_system.core.cache.get_cache_manager", get_cache_manager
+    ):
+        yield backend
+
+
+class TestAPIKeyStore:
+    """Test APIKeyStore."""
+
+    @pytest.mark.asyncio
+    async def test_created_key_authenticates(self, db_manager, backend):
+        """Test a created key resolves to its record without I/O."""
+        store = APIKeyStore()
+        api_key = await store.create_key(
+            "client-1", "reporting", requests_per_minute=30
+        )
+
+        with patch(
+            "football_predict_system.core.database.get_database_manager"
+        ) as mock_db:
+            record = store.authenticate(api_key)
+
+        mock_db.assert_not_called()
+        assert record.user_id == "client-1"
+        assert record.role == UserRole.API_CLIENT
+        assert record.requests_per_minute == 30
+        assert store.authenticate("wrong-key") is None
+
+    @pytest.mark.asyncio
+    async def test_only_hashes_are_stored(self, db_manager, backend):
+        """Test the database never holds the key itself."""
+        store = APIKeyStore()
+        api_key = await store.create_key("client-1", "reporting")
+
+        async with db_manager.get_async_session() as session:
+            stored = (
+                await session.execute(text("SELECT key_hash FROM api_keys"))
+            ).scalar_one()
+
+        assert stored == hash_api_key(api_key)
+        assert stored != api_key
+
+    @pytest.mark.asyncio
+    async def test_load_at_startup(self, db_manager, backend):
+        """Test another worker loads existing keys."""
+        api_key = await APIKeyStore().create_key("client-1", "reporting")
+        worker = APIKeyStore()
+
+        assert worker.authenticate(api_key) is None
+        assert await worker.load() == 1
+        assert worker.authenticate(api_key).name == "reporting"
+
+    @pytest.mark.asyncio
+    async def test_revocation_reaches_other_workers(self, db_manager, backend):
+        """Test a revoked key stops working on a listening worker."""
+        creator = APIKeyStore()
+        api_key = await creator.create_key("client-1", "reporting")
+        worker = APIKeyStore(refresh_interval=60)
+        await worker.load()
+        worker.start_listening()
+        await asyncio.sleep(0)
+
+        assert await creator.revoke_key(hash_api_key(api_key))
+        for _ in range(50):
+            if worker.authenticate(api_key) is None:
+                break
+            await asyncio.sleep(0.01)
+        await worker.stop_listening()
+
+        assert creator.authenticate(api_key) is None
+        assert worker.authenticate(api_key) is None
+
+    @pytest.mark.asyncio
+    async def test_replica_reload_keeps_revoked_keys_out(
+        self, db_manager, backend, tmp_path
+    ):
+        """Test a lagging replica cannot bring back a revoked key."""
+        creator = APIKeyStore()
+        api_key = await creator.create_key("client-1", "reporting")
+        worker = APIKeyStore()
+        await worker.load()
+
+        # Replica snapshot taken before the revocation
+        with (
+            sqlite3.connect(tmp_path / "keys.db") as primary,
+            sqlite3.connect(tmp_path / "replica.db") as replica,
+        ):
+            primary.backup(replica)
+        db_manager.settings.database.replica_urls = [f"sqlite:///{tmp_path}/replica.db"]
+        await creator.revoke_key(hash_api_key(api_key))
+        await worker.load()
+
+        assert await APIKeyStore().load(read_only=True) == 1
+        assert await worker.load(read_only=True) == 0
+        assert worker.authenticate(api_key) is None
+
+    @pytest.mark.asyncio
+    async def test_subscription_outlives_refresh_interval(self):
+        """Test periodic reloads do not drop the pub/sub subscription."""
+        messages: asyncio.Queue[dict] = asyncio.Queue()
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+
+        async def listen():
+            while True:
+                yield await messages.get()
+
+        pubsub.listen = listen
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+        cache_manager = MagicMock()
+        cache_manager.get_redis_client = AsyncMock(return_value=client)
+
+        store = APIKeyStore(refresh_interval=0.01)
+        with (
+            patch(
+                "football_predict_system.core.cache.get_cache_manager",
+                AsyncMock(return_value=cache_manager),
+            ),
+            patch.object(store, "load", AsyncMock(return_value=0)) as load,
+        ):
+            store.start_listening()
+            await asyncio.sleep(0.1)
+            messages.put_nowait({"type": "message", "data": b"h"})
+            await asyncio.sleep(0.01)
+            await store.stop_listening()
+
+        pubsub.subscribe.assert_awaited_once()
+        calls = [c.kwargs for c in load.await_args_list]
+        assert {} in calls  # Notification: reloaded from the primary
+        assert {"read_only": True} in calls  # Timer
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_rejected(self, db_manager, backend):
+        """Test keys past their expiry do not authenticate."""
+        store = APIKeyStore()
+        api_key = await store.create_key(
+            "client-1", "old", expires_at=datetime.utcnow() - timedelta(minutes=1)
+        )
+
+        assert store.authenticate(api_key) is None
+
+    @pytest.mark.asyncio
+    async def test_load_failure_keeps_current_keys(self, backend):
+        """Test a failed reload keeps serving the loaded table."""
+        store = APIKeyStore()
+        store._keys = {"h": APIKey(key_hash="h", name="n", user_id="u")}
+
+        with patch(
+            "football_predict_system.core.database.get_database_manager",
+            side_effect=RuntimeError("db down"),
+        ):
+            assert await store.load() == 1
+
+
+class TestRequireAPIKey:
+    """Test the X-API-Key dependency."""
+
+    def test_dependency(self):
+        """Test valid keys pass and missing or unknown keys get 401."""
+        store = APIKeyStore()
+        store._keys = {
+            hash_api_key("good"): APIKey(
+                key_hash=hash_api_key("good"), name="n", user_id="client-1"
+            )
+        }
+        app = FastAPI()
+
+        @app.get("/private")
+        async def private(client: APIKey = Depends(require_api_key)):
+            return {"user_id": client.user_id}
+
+        with patch(
+            "football_predict_system.core.security.api_keys.get_api_key_store",
+            return_value=store,
+        ):
+            client = TestClient(app)
+            ok = client.get("/private", headers={"X-API-Key": "good"})
+            bad = client.get("/private", headers={"X-API-Key": "bad"})
+            missing = client.get("/private")
+
+        assert ok.json() == {"user_id": "client-1"}
+        assert bad.status_code == 401
+        assert missing.status_code == 401
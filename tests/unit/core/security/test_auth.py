@@ -4,15 +4,20 @@ Tests for authentication and authorization services.
 Complete coverage tests for JWT management and authentication functionality.
 """
 
-import hashlib
+import asyncio
+import threading
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import jwt
 import pytest
 
-from football_predict_system.core.exceptions import UnauthorizedError
-from football_predict_system.core.security.auth import AuthenticationService, JWTManager
+from football_predict_system.core.exceptions import RateLimitError, UnauthorizedError
+from football_predict_system.core.security.auth import (
+    AuthenticationService,
+    JWTManager,
+    PasswordHashPool,
+)
 from football_predict_system.core.security.models import (
     SecurityConfig,
     TokenPayload,
@@ -232,6 +237,98 @@ class TestJWTManager:
             self.jwt_manager.verify_token(token)
 
 
+class TestVerifiedTokenCache:
+    """Test caching and revocation of verified tokens."""
+
+    def setup_method(self):
+        """Set up a manager with a small token cache."""
+        self.config = SecurityConfig(
+            jwt_secret_key="test_secret_key_for_testing", token_cache_size=2
+        )
+        self.jwt_manager = JWTManager(self.config)
+
+    def test_repeated_token_skips_decoding(self):
+        """Test a token is decoded only once while cached."""
+        token = self.jwt_manager.create_access_token("user", UserRole.USER)
+
+        with patch(
+            "football_predict_system.core.security.auth.jwt.decode", wraps=jwt.decode
+        ) as mock_decode:
+            first = self.jwt_manager.verify_token(token)
+            second = self.jwt_manager.verify_token(token)
+
+        assert mock_decode.call_count == 1
+        assert second is first
+
+    def test_cached_token_expires(self):
+        """Test cached payloads are only used until exp."""
+        token = self.jwt_manager.create_access_token("user", UserRole.USER)
+        payload = self.jwt_manager.verify_token(token)
+
+        with (
+            patch(
+                "football_predict_system.core.security.auth.time.time",
+                return_value=payload.exp,
+            ),
+            patch(
+                "football_predict_system.core.security.auth.jwt.decode",
+                side_effect=jwt.ExpiredSignatureError,
+            ),
+            pytest.raises(UnauthorizedError, match="Token expired"),
+        ):
+            self.jwt_manager.verify_token(token)
+
+    def test_cache_is_bounded(self):
+        """Test least recently used tokens are dropped beyond the bound."""
+        tokens = [
+            self.jwt_manager.create_access_token(f"user{i}", UserRole.USER)
+            for i in range(3)
+        ]
+        for token in tokens:
+            self.jwt_manager.verify_token(token)
+
+        assert len(self.jwt_manager._verified) == 2
+
+    def test_cache_can_be_disabled(self):
+        """Test a zero cache size verifies every time."""
+        manager = JWTManager(
+            SecurityConfig(jwt_secret_key="secret", token_cache_size=0)
+        )
+        token = manager.create_access_token("user", UserRole.USER)
+
+        manager.verify_token(token)
+
+        assert len(manager._verified) == 0
+
+    def test_revoke_token(self):
+        """Test a revoked token is rejected even when it was cached."""
+        token = self.jwt_manager.create_access_token("user", UserRole.USER)
+        other = self.jwt_manager.create_access_token("other", UserRole.USER)
+        self.jwt_manager.verify_token(token)
+
+        self.jwt_manager.revoke_token(token)
+
+        with pytest.raises(UnauthorizedError, match="Token revoked"):
+            self.jwt_manager.verify_token(token)
+        assert self.jwt_manager.verify_token(other).user_id == "other"
+
+    def test_revoke_user(self):
+        """Test revoking a user rejects all of their tokens."""
+        token = self.jwt_manager.create_access_token("user", UserRole.USER)
+        self.jwt_manager.verify_token(token)
+
+        self.jwt_manager.revoke_user("user")
+
+        with pytest.raises(UnauthorizedError, match="Token revoked"):
+            self.jwt_manager.verify_token(token)
+
+    def test_revoke_invalid_token_is_ignored(self):
+        """Test revoking a token that is already invalid does nothing."""
+        self.jwt_manager.revoke_token("not-a-token")
+
+        assert self.jwt_manager._revoked_tokens == {}
+
+
 class TestAuthenticationService:
     """Test AuthenticationService class."""
 
@@ -251,39 +348,22 @@ class TestAuthenticationService:
         assert hasattr(self.auth_service, "jwt_manager")
         assert isinstance(self.auth_service.jwt_manager, JWTManager)
 
-    @patch("football_predict_system.core.security.auth.secrets.token_urlsafe")
-    def test_create_api_key(self, mock_token):
-        """Test API key creation."""
-        mock_token.return_value = "mock_random_token"
-
-        user_id = "user_123"
-        name = "test_api_key"
-
-        with patch.object(self.auth_service.logger, "info") as mock_log:
-            api_key = self.auth_service.create_api_key(user_id, name)
-
-            # Verify API key format
-            assert isinstance(api_key, str)
-            assert len(api_key) == 64  # SHA256 hex digest length
-
-            # Verify expected key data was hashed
-            expected_data = f"{user_id}:{name}:mock_random_token"
-            expected_hash = hashlib.sha256(expected_data.encode()).hexdigest()
-            assert api_key == expected_hash
+    @pytest.mark.asyncio
+    async def test_create_api_key(self):
+        """Test API keys are created in the hashed key store."""
+        store = MagicMock()
+        store.create_key = AsyncMock(return_value="new_key")
 
-            # Verify logging
-            mock_log.assert_called_once()
-
-    def test_create_api_key_different_inputs(self):
-        """Test API key creation with different inputs."""
-        # Different inputs should produce different keys
-        key1 = self.auth_service.create_api_key("user1", "key1")
-        key2 = self.auth_service.create_api_key("user2", "key2")
-        key3 = self.auth_service.create_api_key("user1", "key2")
-
-        assert key1 != key2
-        assert key1 != key3
-        assert key2 != key3
+        with patch(
+            "football_predict_system.core.security.auth.get_api_key_store",
+            return_value=store,
+        ):
+            api_key = await self.auth_service.create_api_key("user_123", "reports")
+
+        assert api_key == "new_key"
+        store.create_key.assert_awaited_once_with(
+            "user_123", "reports", UserRole.API_CLIENT
+        )
 
     def test_hash_password(self):
         """Test password hashing."""
@@ -452,23 +532,27 @@ class TestAuthenticationIntegration:
         assert self.auth_service.authorize_role(payload.role, UserRole.USER) is True
         assert self.auth_service.authorize_role(payload.role, UserRole.ADMIN) is True
 
-    def test_api_key_and_password_workflow(self):
+    @pytest.mark.asyncio
+    async def test_api_key_and_password_workflow(self):
         """Test API key creation and password handling."""
         user_id = "test_user_123"
         password = "secure_password"
 
-        # Create API key
-        api_key = self.auth_service.create_api_key(user_id, "production_key")
-        assert len(api_key) == 64
+        # Create API keys
+        store = MagicMock()
+        store.create_key = AsyncMock(side_effect=["key_1", "key_2"])
+        with patch(
+            "football_predict_system.core.security.auth.get_api_key_store",
+            return_value=store,
+        ):
+            api_key = await self.auth_service.create_api_key(user_id, "production_key")
+            api_key2 = await self.auth_service.create_api_key(user_id, "backup_key")
+        assert api_key != api_key2
 
         # Hash password
         hashed_password = self.auth_service.hash_password(password)
         assert self.auth_service.verify_password(password, hashed_password) is True
 
-        # Verify different API keys for same user
-        api_key2 = self.auth_service.create_api_key(user_id, "backup_key")
-        assert api_key != api_key2
-
     @pytest.mark.skip(reason="JWT timing issue in CI environment")
     def test_jwt_config_integration(self):
         """Test JWT configuration integration."""
@@ -510,3 +594,69 @@ class TestAuthenticationIntegration:
         assert hasattr(self.auth_service, "verify_password")
         assert hasattr(self.auth_service, "authenticate_user")
         assert hasattr(self.auth_service, "authorize_role")
+
+
+class TestPasswordHashPool:
+    """Test off-loop password hashing."""
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        """Test async variants agree with the synchronous ones."""
+        with patch(
+            "football_predict_system.core.security.auth.get_settings"
+        ) as mock_settings:
+            mock_settings.return_value.api.secret_key = "test_secret"
+            mock_settings.return_value.api.access_token_expire_minutes = 30
+            auth_service = AuthenticationService()
+
+        hashed = await auth_service.hash_password_async("s3cret")
+
+        assert auth_service.verify_password("s3cret", hashed)
+        assert await auth_service.verify_password_async("s3cret", hashed)
+        assert not await auth_service.verify_password_async("wrong", hashed)
+
+    @pytest.mark.asyncio
+    async def test_authenticate_with_password_hash(self):
+        """Test a configured admin hash is checked on the pool."""
+        with patch(
+            "football_predict_system.core.security.auth.get_settings"
+        ) as mock_settings:
+            mock_settings.return_value.api.secret_key = "test_secret"
+            mock_settings.return_value.api.access_token_expire_minutes = 30
+            auth_service = AuthenticationService()
+        hashed = auth_service.hash_password("s3cret")
+
+        with (
+            patch.dict("os.environ", {"ADMIN_PASSWORD_HASH": hashed}),
+            patch.object(
+                auth_service,
+                "verify_password_async",
+                wraps=auth_service.verify_password_async,
+            ) as verify,
+        ):
+            user = await auth_service.authenticate_user_async("admin", "s3cret")
+            # The demo password no longer works once a hash is configured
+            demo = await auth_service.authenticate_user_async("admin", "admin")
+
+        assert user is not None
+        assert user["role"] == UserRole.ADMIN
+        assert demo is None
+        assert verify.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_backlog_is_full(self):
+        """Test calls beyond workers plus queue are rejected."""
+        pool = PasswordHashPool(max_workers=1, max_queue=1)
+        gate = threading.Event()
+
+        running = [asyncio.create_task(pool.run(gate.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimitError):
+            await pool.run(gate.wait)
+        assert pool.rejected == 1
+
+        gate.set()
+        assert await asyncio.gather(*running) == [True, True]
+        assert pool.pending == 0
+        pool.shutdown()
@@ -0,0 +1,286 @@
+"""
+Tests for distributed rate limiting.
+
+The Redis script is replaced by a Python implementation of the same GCRA
+rules so bucket accounting, local leases and fallback can be checked
+without a Redis server.
+"""
+
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from football_predict_system.core.config import RateLimitConfig
+from football_predict_system.core.security.auth import get_auth_service
+from football_predict_system.core.security.distributed_rate_limit import (
+    DistributedRateLimiter,
+    RateLimitDecision,
+    RateLimitMiddleware,
+    identify_client,
+)
+from football_predict_system.core.security.models import UserRole
+
+
+class FakeGCRAScript:
+    """Python equivalent of the GCRA Lua script."""
+
+    def __init__(self):
+        self.now_ms = 1_000_000.0
+        self.tats: dict[str, float] = {}
+        self.calls: list[tuple[list, list]] = []
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        interval, window, served = args
+        now = self.now_ms
+        tat = max(self.tats.get(keys[0], now), now) + served * interval
+
+        allowed, retry_after = 0, 0.0
+        if tat + interval - now <= window:
+            allowed, tat = 1, tat + interval
+        else:
+            retry_after = tat + interval - now - window
+
+        self.tats[keys[0]] = tat
+        remaining = max(0, math.floor((window - (tat - now)) / interval))
+        return [allowed, remaining, math.ceil(tat - now), math.ceil(retry_after)]
+
+
+@pytest.fixture
+def script():
+    """Create the fake GCRA script."""
+    return FakeGCRAScript()
+
+
+def make_limiter(script, **overrides):
+    """Create a limiter whose client registers the fake script."""
+    client = MagicMock()
+    client.register_script.return_value = script
+    config = RateLimitConfig(**overrides)
+    return DistributedRateLimiter(config, client=client)
+
+
+class TestDistributedRateLimiter:
+    """Test DistributedRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limit(self, script):
+        """Test a bucket admits exactly its budget per window."""
+        limiter = make_limiter(script, local_fraction=0.0)
+
+        decisions = [await limiter.check("*:ip:1", 5, 60) for _ in range(6)]
+
+        assert [d.allowed for d in decisions] == [True] * 5 + [False]
+        assert [d.remaining for d in decisions[:5]] == [4, 3, 2, 1, 0]
+        assert decisions[-1].retry_after == pytest.approx(12.0)
+        assert script.calls[0][0] == ["ratelimit:*:ip:1"]
+
+    @pytest.mark.asyncio
+    async def test_bucket_refills_over_time(self, script):
+        """Test budget returns at the emission rate."""
+        limiter = make_limiter(script, local_fraction=0.0)
+        for _ in range(5):
+            await limiter.check("k", 5, 60)
+
+        script.now_ms += 12_000
+
+        assert (await limiter.check("k", 5, 60)).allowed
+        assert not (await limiter.check("k", 5, 60)).allowed
+
+    @pytest.mark.asyncio
+    async def test_local_lease_skips_redis(self, script):
+        """Test clearly-allowed requests are served locally."""
+        limiter = make_limiter(script, local_fraction=0.1, local_ttl=60.0)
+
+        first = await limiter.check("k", 100, 60)
+        local = [await limiter.check("k", 100, 60) for _ in range(9)]
+
+        assert first.remaining == 99
+        assert len(script.calls) == 1
+        assert all(d.allowed for d in local)
+        assert local[-1].remaining == 90
+
+    @pytest.mark.asyncio
+    async def test_lease_usage_is_charged(self, script):
+        """Test locally served requests are charged on the next call."""
+        limiter = make_limiter(script, local_fraction=0.1, local_ttl=60.0)
+
+        for _ in range(11):
+            decision = await limiter.check("k", 100, 60)
+
+        assert len(script.calls) == 2
+        assert script.calls[1][1][2] == 9
+        assert decision.remaining == 89
+
+    @pytest.mark.asyncio
+    async def test_no_lease_when_budget_is_low(self, script):
+        """Test every request goes to Redis near the limit."""
+        limiter = make_limiter(script, local_fraction=0.1, local_ttl=60.0)
+
+        for _ in range(5):
+            await limiter.check("k", 5, 60)
+
+        assert len(script.calls) == 5
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_redis_is_down(self, script):
+        """Test the in-process limiter is used while Redis is unavailable."""
+        failing = AsyncMock(side_effect=RedisConnectionError("down"))
+        limiter = make_limiter(failing, local_fraction=0.0)
+
+        decisions = [await limiter.check("k", 3, 60) for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        # Redis is not retried on every request while it is marked down
+        assert failing.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_uses_in_process_limiter(self):
+        """Test backends without scripting use the in-process limiter."""
+        from football_predict_system.core.cache import InMemoryBackend
+
+        limiter = DistributedRateLimiter(RateLimitConfig(), client=InMemoryBackend())
+
+        decisions = [await limiter.check("k", 2, 60) for _ in range(3)]
+
+        assert [d.allowed for d in decisions] == [True, True, False]
+
+
+class TestRateLimitDecision:
+    """Test RateLimitDecision headers."""
+
+    def test_allowed_headers(self):
+        """Test headers for an admitted request."""
+        decision = RateLimitDecision(True, 100, 42, 17.2)
+
+        assert decision.headers() == [
+            (b"x-ratelimit-limit", b"100"),
+            (b"x-ratelimit-remaining", b"42"),
+            (b"x-ratelimit-reset", b"18"),
+        ]
+
+    def test_denied_headers_include_retry_after(self):
+        """Test denials carry Retry-After."""
+        decision = RateLimitDecision(False, 100, 0, 60.0, retry_after=0.3)
+
+        assert (b"retry-after", b"1") in decision.headers()
+
+
+class TestRateLimitMiddleware:
+    """Test RateLimitMiddleware."""
+
+    @pytest.fixture
+    def client(self, script):
+        """Create an app limited to two requests per minute per client."""
+        config = RateLimitConfig(
+            requests=2,
+            route_limits={"/api/v1/predictions": 1},
+            role_multipliers={"guest": 1.0, "admin": 10.0},
+            local_fraction=0.0,
+        )
+        app = FastAPI()
+        app.add_middleware(
+            RateLimitMiddleware,
+            config=config,
+            limiter=make_limiter(script, local_fraction=0.0),
+        )
+
+        @app.get("/items")
+        async def items():
+            return {"ok": True}
+
+        @app.get("/api/v1/predictions/{match_id}")
+        async def prediction(match_id: int):
+            return {"match_id": match_id}
+
+        @app.get("/health/live")
+        async def live():
+            return {"status": "alive"}
+
+        return TestClient(app)
+
+    def test_headers_on_allowed_response(self, client):
+        """Test rate limit headers are added to responses."""
+        response = client.get("/items")
+
+        assert response.status_code == 200
+        assert response.headers["x-ratelimit-limit"] == "2"
+        assert response.headers["x-ratelimit-remaining"] == "1"
+        assert response.headers["x-ratelimit-reset"] == "30"
+
+    def test_rejects_over_limit(self, client):
+        """Test requests over the budget get 429."""
+        client.get("/items")
+        client.get("/items")
+        response = client.get("/items")
+
+        assert response.status_code == 429
+        assert response.json()["error_code"] == "RATE_LIMITED"
+        assert response.headers["retry-after"] == "30"
+
+    def test_route_limit_has_its_own_bucket(self, client):
+        """Test route limits override the default and are kept separately."""
+        assert client.get("/api/v1/predictions/1").status_code == 200
+        assert client.get("/api/v1/predictions/2").status_code == 429
+        assert client.get("/items").status_code == 200
+
+    def test_exempt_paths(self, client):
+        """Test probes are never limited."""
+        for _ in range(5):
+            response = client.get("/health/live")
+            assert response.status_code == 200
+            assert "x-ratelimit-limit" not in response.headers
+
+    def test_role_multiplier(self):
+        """Test authenticated roles get scaled budgets."""
+        middleware = RateLimitMiddleware(
+            MagicMock(),
+            config=RateLimitConfig(
+                requests=10, role_multipliers={"admin": 10.0}, enabled=True
+            ),
+            limiter=MagicMock(),
+        )
+
+        assert middleware.resolve_limit("/items", "admin") == ("*", 100)
+        assert middleware.resolve_limit("/items", "guest") == ("*", 10)
+        # A caller's own quota replaces the role budget
+        assert middleware.resolve_limit("/items", "admin", quota=7) == ("*", 7)
+
+    def test_bearer_token_identifies_user(self):
+        """Test valid tokens are limited per user and role."""
+        token = get_auth_service().jwt_manager.create_access_token("u1", UserRole.ADMIN)
+        scope = {
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "client": ("10.0.0.1", 1234),
+        }
+
+        assert identify_client(scope) == ("user:u1", "admin", None)
+
+        scope["headers"] = [(b"authorization", b"Bearer invalid")]
+        assert identify_client(scope) == ("ip:10.0.0.1", "guest", None)
+
+    def test_revoked_token_not_identified(self):
+        """Test revocations on the shared auth service are honoured."""
+        jwt_manager = get_auth_service().jwt_manager
+        token = jwt_manager.create_access_token("u2", UserRole.ADMIN)
+        scope = {
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "client": ("10.0.0.2", 1234),
+        }
+        assert identify_client(scope)[0] == "user:u2"
+
+        jwt_manager.revoke_token(token)
+
+        assert identify_client(scope) == ("ip:10.0.0.2", "guest", None)
+
+    def test_limiter_built_from_config(self):
+        """Test the middleware's own limiter uses the config it was given."""
+        config = RateLimitConfig(requests=3, local_fraction=0.0)
+
+        middleware = RateLimitMiddleware(MagicMock(), config=config)
+
+        assert middleware.limiter.config is config
@@ -4,7 +4,14 @@ Tests for security headers.
 Complete coverage tests for SecurityHeaders class.
 """
 
-from football_predict_system.core.security.headers import SecurityHeaders
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from football_predict_system.core.security.headers import (
+    SecurityHeaders,
+    SecurityHeadersMiddleware,
+)
 
 
 class TestSecurityHeaders:
@@ -256,3 +263,70 @@ class TestSecurityHeaders:
         response = {"test": "value"}
         result = SecurityHeaders.apply_headers(response)
         assert isinstance(result, dict)
+
+
+class TestSecurityHeadersMiddleware:
+    """Test SecurityHeadersMiddleware."""
+
+    @staticmethod
+    def client(endpoint, **kwargs):
+        """Create a test client for an app wrapped in the middleware."""
+        app = FastAPI()
+        app.get("/")(endpoint)
+        app.add_middleware(SecurityHeadersMiddleware, **kwargs)
+        return TestClient(app)
+
+    def test_headers_added_to_responses(self):
+        """Test every security header is present on a response."""
+
+        async def endpoint():
+            return {"status": "ok"}
+
+        response = self.client(endpoint).get("/")
+
+        assert response.json() == {"status": "ok"}
+        for name, value in SecurityHeaders.get_security_headers().items():
+            assert response.headers[name] == value
+
+    def test_application_header_is_replaced(self):
+        """Test a header set by the endpoint is not duplicated."""
+
+        async def endpoint():
+            return PlainTextResponse("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+        response = self.client(endpoint).get("/")
+
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
+        assert response.headers["content-type"].startswith("text/plain")
+
+    def test_response_object_not_mutated(self):
+        """Test a shared response keeps its own headers between requests."""
+        shared = PlainTextResponse("ok")
+        original = list(shared.raw_headers)
+
+        async def endpoint():
+            return shared
+
+        client = self.client(endpoint)
+        client.get("/")
+        client.get("/")
+
+        assert shared.raw_headers == original
+
+    def test_custom_headers(self):
+        """Test the middleware can be configured with other headers."""
+
+        async def endpoint():
+            return {}
+
+        response = self.client(endpoint, headers={"X-Custom": "1"}).get("/")
+
+        assert response.headers["x-custom"] == "1"
+        assert "x-frame-options" not in response.headers
+
+    def test_raw_headers_are_encoded(self):
+        """Test raw headers are lowercase byte pairs."""
+        raw = SecurityHeaders.get_raw_headers()
+
+        assert (b"x-frame-options", b"DENY") in raw
+        assert len(raw) == len(SecurityHeaders.get_security_headers())
@@ -4,8 +4,11 @@ Tests for rate limiter functionality.
 Complete coverage tests for RateLimiter class and rate limiting logic.
 """
 
+import asyncio
 from unittest.mock import patch
 
+import pytest
+
 from football_predict_system.core.security.models import SecurityConfig
 from football_predict_system.core.security.rate_limiter import RateLimiter
 
@@ -19,17 +22,15 @@ class TestRateLimiter:
         limiter = RateLimiter(config)
 
         assert limiter.config is config
-        assert isinstance(limiter.requests, dict)
-        assert len(limiter.requests) == 0
+        assert len(limiter) == 0
 
-    def test_rate_limiter_requests_is_defaultdict(self):
-        """Test requests attribute is defaultdict."""
+    def test_lookup_does_not_track_identifier(self):
+        """Test querying an unknown identifier does not allocate state."""
         config = SecurityConfig(jwt_secret_key="test")
         limiter = RateLimiter(config)
 
-        # Accessing non-existent key should return empty list
-        assert limiter.requests["non-existent"] == []
-        assert isinstance(limiter.requests["non-existent"], list)
+        assert limiter.get_remaining_requests("non-existent", max_requests=5) == 5
+        assert len(limiter) == 0
 
     @patch("time.time")
     def test_is_allowed_first_request(self, mock_time):
@@ -42,8 +43,8 @@ class TestRateLimiter:
         result = limiter.is_allowed("user1")
 
         assert result is True
-        assert len(limiter.requests["user1"]) == 1
-        assert limiter.requests["user1"][0] == 1000.0
+        assert len(limiter) == 1
+        assert limiter.get_remaining_requests("user1") == 99
 
     @patch("time.time")
     def test_is_allowed_multiple_requests_within_limit(self, mock_time):
@@ -59,7 +60,7 @@ class TestRateLimiter:
             result = limiter.is_allowed("user1", max_requests=10)
             assert result is True
 
-        assert len(limiter.requests["user1"]) == 5
+        assert limiter.get_remaining_requests("user1", max_requests=10) == 5
 
     @patch("time.time")
     def test_is_allowed_exceeds_limit(self, mock_time):
@@ -80,8 +81,9 @@ class TestRateLimiter:
         result = limiter.is_allowed("user1", max_requests=3)
         assert result is False
 
-        # Should still have 3 requests in memory
-        assert len(limiter.requests["user1"]) == 3
+        # Rejected requests are not counted
+        assert limiter.get_remaining_requests("user1", max_requests=3) == 0
+        assert len(limiter) == 1
 
     @patch("time.time")
     def test_is_allowed_window_cleanup(self, mock_time):
@@ -98,32 +100,34 @@ class TestRateLimiter:
         # Move time forward beyond window (60 seconds)
         mock_time.return_value = 1065.0  # 65 seconds later
 
-        # This request should be allowed as old ones are cleaned up
+        # This request should be allowed as old ones have slid out
         result = limiter.is_allowed("user1", window_seconds=60, max_requests=3)
         assert result is True
 
-        # Should only have 1 request (the current one)
-        assert len(limiter.requests["user1"]) == 1
-
     @patch("time.time")
-    def test_is_allowed_partial_window_cleanup(self, mock_time):
-        """Test partial cleanup of requests in window."""
+    def test_previous_window_is_weighted(self, mock_time):
+        """Test the previous window counts in proportion to its overlap."""
         config = SecurityConfig(jwt_secret_key="test")
         limiter = RateLimiter(config)
 
-        # Add requests at different times
+        # 4 requests in window [960, 1020)
         mock_time.return_value = 1000.0
-        limiter.is_allowed("user1", window_seconds=60, max_requests=5)
-
-        mock_time.return_value = 1010.0
-        limiter.is_allowed("user1", window_seconds=60, max_requests=5)
+        for _i in range(4):
+            limiter.is_allowed("user1", window_seconds=60, max_requests=5)
 
-        mock_time.return_value = 1070.0  # 70 seconds from start
-        limiter.is_allowed("user1", window_seconds=60, max_requests=5)
+        # 15s into the next window 75% of the previous window still counts
+        mock_time.return_value = 1035.0
+        assert (
+            limiter.get_remaining_requests("user1", window_seconds=60, max_requests=5)
+            == 2
+        )
 
-        # Should have cleaned up 1000.0, kept 1010.0, added 1070.0
-        # But 1010.0 is also cleaned up because 1070 - 60 = 1010, so 1010 is at boundary
-        assert len(limiter.requests["user1"]) == 1
+        # Two windows later nothing counts
+        mock_time.return_value = 1140.0
+        assert (
+            limiter.get_remaining_requests("user1", window_seconds=60, max_requests=5)
+            == 5
+        )
 
     @patch("time.time")
     def test_is_allowed_different_identifiers(self, mock_time):
@@ -200,10 +204,10 @@ class TestRateLimiter:
         for _i in range(3):
             limiter.is_allowed("user1", window_seconds=60, max_requests=5)
 
-        # Move time forward
-        mock_time.return_value = 1065.0
+        # Move time past the end of the following window
+        mock_time.return_value = 1085.0
 
-        # Check remaining - should clean up old requests
+        # Check remaining - old requests no longer count
         remaining = limiter.get_remaining_requests(
             "user1", window_seconds=60, max_requests=5
         )
@@ -219,13 +223,13 @@ class TestRateLimiter:
             limiter.is_allowed("user1")
             limiter.is_allowed("user1")
 
-        assert "user1" in limiter.requests
-        assert len(limiter.requests["user1"]) == 2
+            assert limiter.get_remaining_requests("user1") == 98
 
-        # Reset limit
-        limiter.reset_limit("user1")
+            # Reset limit
+            limiter.reset_limit("user1")
 
-        assert "user1" not in limiter.requests
+            assert len(limiter) == 0
+            assert limiter.get_remaining_requests("user1") == 100
 
     def test_reset_limit_non_existent_identifier(self):
         """Test reset_limit with non-existent identifier doesn't error."""
@@ -236,7 +240,7 @@ class TestRateLimiter:
         limiter.reset_limit("non-existent")
 
         # Should still be empty
-        assert len(limiter.requests) == 0
+        assert len(limiter) == 0
 
     @patch("time.time")
     def test_rate_limiter_edge_case_zero_requests(self, mock_time):
@@ -302,7 +306,7 @@ class TestRateLimiter:
             result = limiter.is_allowed(identifier, max_requests=3)
             assert result is False
 
-        assert len(limiter.requests) == 4
+        assert len(limiter) == 4
 
     @patch("time.time")
     def test_rate_limiter_time_precision(self, mock_time):
@@ -330,8 +334,9 @@ class TestRateLimiter:
         config = SecurityConfig(jwt_secret_key="test")
         limiter = RateLimiter(config)
 
-        # Manually add more requests than limit (edge case)
-        limiter.requests["user1"] = [1000.0, 1001.0, 1002.0, 1003.0, 1004.0]
+        # Use 5 requests, then query with a lower limit (edge case)
+        for _i in range(5):
+            limiter.is_allowed("user1", max_requests=5)
 
         # Should return 0, not negative
         remaining = limiter.get_remaining_requests("user1", max_requests=3)
@@ -388,3 +393,47 @@ class TestRateLimiter:
             "api_user", window_seconds=120, max_requests=10
         )
         assert remaining >= 0
+
+
+class TestIdleEviction:
+    """Test eviction of idle identifiers."""
+
+    @patch("time.time")
+    def test_evict_idle_removes_only_idle_identifiers(self, mock_time):
+        """Test identifiers idle for longer than idle_seconds are dropped."""
+        limiter = RateLimiter(SecurityConfig(jwt_secret_key="test"), idle_seconds=120)
+
+        mock_time.return_value = 1000.0
+        limiter.is_allowed("idle")
+        limiter.is_allowed("active")
+        mock_time.return_value = 1100.0
+        limiter.is_allowed("active")
+
+        assert limiter.evict_idle(now=1125.0) == 1
+        assert len(limiter) == 1
+        assert limiter.get_remaining_requests("idle") == 100
+
+    @patch("time.time")
+    def test_idle_seconds_cover_two_windows(self, mock_time):
+        """Test eviction never drops counts that still affect a decision."""
+        mock_time.return_value = 1000.0
+        limiter = RateLimiter(SecurityConfig(jwt_secret_key="test"), idle_seconds=10)
+
+        limiter.is_allowed("user1", window_seconds=300, max_requests=1)
+
+        assert limiter.idle_seconds == 600
+        assert limiter.evict_idle(now=1500.0) == 0
+
+    @pytest.mark.asyncio
+    async def test_background_eviction(self):
+        """Test the background task evicts periodically and stops cleanly."""
+        limiter = RateLimiter(SecurityConfig(jwt_secret_key="test"), idle_seconds=0)
+        limiter.is_allowed("user1", window_seconds=0.001)
+        limiter.idle_seconds = 0
+
+        limiter.start_eviction(interval_seconds=0.01)
+        await asyncio.sleep(0.05)
+        await limiter.stop_eviction()
+
+        assert len(limiter) == 0
+        assert limiter._eviction_task is None
@@ -0,0 +1,185 @@
+"""
+Tests for cache backends.
+
+Covers the in-process backend's Redis-compatible semantics and running
+CacheManager end to end on it.
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from football_predict_system.core.cache import (
+    CacheBackend,
+    CacheManager,
+    InMemoryBackend,
+    create_backend,
+)
+
+
+@pytest.fixture
+def backend():
+    """Create an in-memory backend."""
+    return InMemoryBackend()
+
+
+@pytest.fixture
+def clock():
+    """Control the monotonic clock used for TTLs."""
+    with patch("football_predict_system.core.cache.backends.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time
+
+
+class TestInMemoryBackend:
+    """Test InMemoryBackend."""
+
+    def test_satisfies_protocol(self, backend):
+        """Test the backend implements the cache backend protocol."""
+        assert isinstance(backend, CacheBackend)
+
+    @pytest.mark.asyncio
+    async def test_values_are_bytes(self, backend):
+        """Test values round-trip as bytes like redis-py."""
+        await backend.set("a", "text")
+        await backend.setex("b", 60, b"raw")
+
+        assert await backend.get("a") == b"text"
+        assert await backend.mget(["a", "b", "missing"]) == [b"text", b"raw", None]
+
+    @pytest.mark.asyncio
+    async def test_ttl_semantics(self, backend, clock):
+        """Test TTL reporting and expiry match Redis."""
+        await backend.setex("k", 10, "v")
+        await backend.set("forever", "v")
+
+        assert await backend.ttl("k") == 10
+        assert await backend.ttl("forever") == -1
+        assert await backend.ttl("missing") == -2
+
+        clock.monotonic.return_value = 1010.0
+
+        assert await backend.get("k") is None
+        assert await backend.ttl("k") == -2
+        assert await backend.exists("k", "forever") == 1
+
+    @pytest.mark.asyncio
+    async def test_set_expiry_arguments(self, backend, clock):
+        """Test set accepts redis-py's ex/px in seconds, ms or timedelta."""
+        await backend.set("ex", "v", ex=timedelta(seconds=30))
+        await backend.set("px", "v", px=1500)
+
+        assert await backend.ttl("ex") == 30
+        assert await backend.ttl("px") == 2  # Rounded like Redis
+
+    @pytest.mark.asyncio
+    async def test_keys_and_scan_skip_expired(self, backend, clock):
+        """Test pattern listing only returns live keys."""
+        await backend.setex("app:ns:1", 5, "v")
+        await backend.setex("app:ns:2", 50, "v")
+        await backend.setex("app:other:1", 50, "v")
+        clock.monotonic.return_value = 1006.0
+
+        assert await backend.keys("app:ns:*") == [b"app:ns:2"]
+        assert [k async for k in backend.scan_iter(match="app:*")] == [
+            b"app:ns:2",
+            b"app:other:1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_executes_in_order(self, backend):
+        """Test buffered commands run on execute."""
+        async with backend.pipeline(transaction=False) as pipe:
+            pipe.setex("a", 60, "1").setex("b", 60, "2")
+            pipe.get("a")
+            results = await pipe.execute()
+
+        assert results == [True, True, b"1"]
+        assert await backend.delete("a", "b", "c") == 2
+
+    @pytest.mark.asyncio
+    async def test_hash_counters(self, backend):
+        """Test hash increments used for namespace generations."""
+        assert await backend.hincrby("gens", "teams") == 1
+        assert await backend.hincrby("gens", "teams", 2) == 3
+        assert await backend.hgetall("gens") == {b"teams": b"3"}
+
+    @pytest.mark.asyncio
+    async def test_publish(self, backend):
+        """Test published messages reach subscribers."""
+        queue = backend.subscribe("events")
+
+        assert await backend.publish("events", "flush") == 1
+        assert await backend.publish("nobody", "flush") == 0
+        assert queue.get_nowait() == b"flush"
+
+    @pytest.mark.asyncio
+    async def test_invalid_setex_ttl(self, backend):
+        """Test non-positive TTLs are rejected like Redis."""
+        import redis.asyncio as redis
+
+        with pytest.raises(redis.ResponseError):
+            await backend.setex("k", 0, "v")
+
+
+class TestCreateBackend:
+    """Test backend selection."""
+
+    def test_memory_backend_selected(self):
+        """Test the in-memory backend is used when configured."""
+        settings = MagicMock()
+        settings.cache.backend = "memory"
+
+        assert isinstance(create_backend(settings), InMemoryBackend)
+
+    def test_redis_backend_is_default(self):
+        """Test Redis is used by default."""
+        from football_predict_system.core.config import Settings
+
+        with patch(
+            "football_predict_system.core.cache.backends.redis.from_url"
+        ) as mock_from_url:
+            create_backend(Settings())
+
+        mock_from_url.assert_called_once()
+
+
+class TestCacheManagerOnMemoryBackend:
+    """Test CacheManager running without Redis."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a cache manager on the in-memory backend."""
+        manager = CacheManager()
+        manager._redis_client = InMemoryBackend()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_shared_tier(self, manager):
+        """Test values survive a cleared local memory cache."""
+        await manager.set("k", {"a": 1}, 60, "ns")
+        await manager.set_many({"x": 1, "y": 2}, 60, "ns")
+        manager.clear_memory_cache()
+
+        assert await manager.get("k", "ns") == {"a": 1}
+        assert await manager.get("y", "ns") == 2
+        assert await manager.get_ttl("k", "ns") == 60
+
+    @pytest.mark.asyncio
+    async def test_namespace_operations(self, manager):
+        """Test generation bumps and namespace clears work on the backend."""
+        await manager.set("k", 1, 60, "ns")
+        await manager.bump_namespace("ns")
+        assert await manager.get("k", "ns") is None
+
+        await manager.set("k", 2, 60, "ns")
+        assert await manager.clear_namespace("ns") == 2
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, manager):
+        """Test health check passes without Redis."""
+        health = await manager.health_check()
+
+        assert health["status"] == "healthy"
+        assert health["redis_version"] == "in-memory"
@@ -639,44 +639,6 @@ class TestCacheWarmer:
         """Create CacheWarmer instance."""
         return CacheWarmer(cache_manager)
 
-    @pytest.mark.asyncio
-    async def test_warm_predictions(self, cache_warmer):
-        """Test warm predictions."""
-        cache_warmer.cache_manager.exists = AsyncMock(return_value=False)
-        cache_warmer.cache_manager.set = AsyncMock(return_value=True)
-
-        match_ids = ["match1", "match2", "match3"]
-
-        await cache_warmer.warm_predictions(match_ids)
-
-        # Should check existence and set for each match
-        assert cache_warmer.cache_manager.exists.call_count == 3
-        assert cache_warmer.cache_manager.set.call_count == 3
-
-    @pytest.mark.asyncio
-    async def test_warm_predictions_already_cached(self, cache_warmer):
-        """Test warm predictions with already cached items."""
-        cache_warmer.cache_manager.exists = AsyncMock(return_value=True)
-        cache_warmer.cache_manager.set = AsyncMock(return_value=True)
-
-        match_ids = ["match1", "match2"]
-
-        await cache_warmer.warm_predictions(match_ids)
-
-        # Should check existence but not set (already cached)
-        assert cache_warmer.cache_manager.exists.call_count == 2
-        cache_warmer.cache_manager.set.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_warm_predictions_error(self, cache_warmer):
-        """Test warm predictions with error."""
-        cache_warmer.cache_manager.exists = AsyncMock(
-            side_effect=Exception("Cache error")
-        )
-
-        # Should not raise exception, just log error
-        await cache_warmer.warm_predictions(["match1"])
-
     @pytest.mark.asyncio
     async def test_warm_model_metadata(self, cache_warmer):
         """Test warm model metadata."""
@@ -0,0 +1,170 @@
+"""
+Tests for the persistent disk cache tier.
+
+Covers TTL expiry, size-bounded eviction, persistence across reopen and
+read-through promotion from disk into the memory cache.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from football_predict_system.core.cache import CacheManager, DiskCache
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Create a small disk cache."""
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1000)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a cache manager with the disk tier enabled."""
+    with patch("football_predict_system.core.cache.manager.get_settings") as mock:
+        settings = mock.return_value
+        settings.app_name = "test"
+        settings.cache.disk_enabled = True
+        settings.cache.disk_path = str(tmp_path / "l3.sqlite3")
+        settings.cache.disk_max_bytes = 1024 * 1024
+        settings.cache.disk_max_ttl = 300
+        settings.cache.generation_sync_interval = 5.0
+        cache_manager = CacheManager()
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+    redis_client.get = AsyncMock(return_value=None)
+    redis_client.hgetall = AsyncMock(return_value={})
+    redis_client.setex = AsyncMock(return_value=True)
+    redis_client.delete = AsyncMock(return_value=1)
+    cache_manager._redis_client = redis_client
+    yield cache_manager
+    if cache_manager._disk_cache is not None:
+        cache_manager._disk_cache.close()
+
+
+class TestDiskCache:
+    """Test DiskCache."""
+
+    def test_set_and_get(self, disk_cache):
+        """Test payloads round-trip with a remaining TTL."""
+        assert disk_cache.set("k", b"value", 60)
+
+        value, remaining = disk_cache.get("k")
+
+        assert value == b"value"
+        assert 0 < remaining <= 60
+
+    def test_expired_entry_is_dropped(self, disk_cache):
+        """Test expired entries are not returned."""
+        with patch("football_predict_system.core.cache.disk.time") as mock_time:
+            mock_time.time.return_value = 1000.0
+            disk_cache.set("k", b"value", 10)
+            mock_time.time.return_value = 1011.0
+
+            assert disk_cache.get("k") is None
+
+        assert disk_cache.stats()["entries"] == 0
+
+    def test_eviction_respects_size_bound(self, disk_cache):
+        """Test entries closest to expiry are evicted once over the bound."""
+        for i in range(10):
+            disk_cache.set(f"k{i}", b"x" * 200, 100 + i)
+
+        stats = disk_cache.stats()
+        assert stats["bytes"] <= disk_cache.max_bytes
+        assert disk_cache.get("k0") is None
+        assert disk_cache.get("k9") is not None
+
+    def test_delete_prefix(self, disk_cache):
+        """Test namespace-style prefix deletion."""
+        disk_cache.set_many({"a:1": b"1", "a:2": b"2", "b:1": b"3"}, 60)
+
+        assert disk_cache.delete_prefix("a:") == 2
+        assert disk_cache.get("b:1") is not None
+        assert disk_cache.stats()["bytes"] == 1
+
+    def test_persists_across_reopen(self, tmp_path):
+        """Test entries survive a restart."""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = DiskCache(path)
+        cache.set("k", b"value", 60)
+        cache.close()
+
+        reopened = DiskCache(path)
+        try:
+            assert reopened.get("k")[0] == b"value"
+            assert reopened.stats()["bytes"] == 5
+        finally:
+            reopened.close()
+
+
+class TestCacheManagerDiskTier:
+    """Test CacheManager integration with the disk tier."""
+
+    @pytest.mark.asyncio
+    async def test_set_writes_through_to_disk(self, manager):
+        """Test set stores the serialized value on disk."""
+        assert await manager.set("k", {"a": 1}, 60, "ns")
+
+        payload, _ = manager._disk_cache.get(manager._generate_key("ns", "k"))
+        assert json.loads(payload) == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_disk_ttl_bounded(self, manager):
+        """Test disk entries expire within disk_max_ttl whatever the TTL."""
+        await manager.set("k", 1, 86400, "ns")
+        await manager.set_many({"m": 2}, 86400, "ns")
+
+        for key in ("k", "m"):
+            _, remaining = manager._disk_cache.get(manager._generate_key("ns", key))
+            assert remaining <= 300
+
+    @pytest.mark.asyncio
+    async def test_disk_hit_is_promoted_to_memory(self, manager):
+        """Test disk hits skip Redis and land in the memory cache."""
+        await manager.set("k", {"a": 1}, 60, "ns")
+        manager.clear_memory_cache()
+
+        assert await manager.get("k", "ns") == {"a": 1}
+
+        manager._redis_client.get.assert_not_called()
+        assert manager._generate_key("ns", "k") in manager._memory_cache
+        assert manager.get_stats().disk_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_is_stored_on_disk(self, manager):
+        """Test Redis hits are kept locally for later restarts."""
+        manager._redis_client.get.return_value = json.dumps({"a": 2}).encode()
+
+        assert await manager.get("k", "ns") == {"a": 2}
+
+        assert manager._disk_cache.get(manager._generate_key("ns", "k")) is not None
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_disk_entry(self, manager):
+        """Test delete clears every tier."""
+        await manager.set_many({"k": 1, "a": 2, "b": 3}, 60, "ns")
+
+        await manager.delete("k", "ns")
+        await manager.delete_many(["a", "b"], "ns")
+
+        for key in ("k", "a", "b"):
+            assert manager._disk_cache.get(manager._generate_key("ns", key)) is None
+        assert manager._disk_cache.stats()["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_load_memory_from_disk(self, manager):
+        """Test the memory cache is pre-filled on startup."""
+        await manager.set_many({"a": 1, "b": 2}, 60, "ns")
+        manager.clear_memory_cache()
+
+        assert await manager.load_memory_from_disk() == 2
+        assert await manager.get("a", "ns") == 1
@@ -9,8 +9,12 @@ import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import redis.asyncio as redis
 
-from football_predict_system.core.cache.manager import CacheManager
+from football_predict_system.core.cache.manager import (
+    NEGATIVE_CACHE_MARKER,
+    CacheManager,
+)
 from football_predict_system.core.cache.models import CacheStats
 
 
@@ -178,6 +182,7 @@ class TestCacheManagerAsyncOperations:
 
         # Mock Redis client
         mock_redis = AsyncMock()
+        mock_redis.hgetall.return_value = {}
         mock_redis.setex.return_value = True
         manager._redis_client = mock_redis
 
@@ -210,6 +215,7 @@ class TestCacheManagerAsyncOperations:
 
         # Mock Redis client
         mock_redis = AsyncMock()
+        mock_redis.hgetall.return_value = {}
         mock_redis.get.return_value = b'"test_value_from_redis"'
         mock_redis.ttl.return_value = 1800
         manager._redis_client = mock_redis
@@ -298,6 +304,133 @@ class TestCacheManagerAsyncOperations:
         # Health check API changed - just verify it's a dict with unhealthy status
 
 
+class TestNegativeCaching:
+    """Test negative cache entries for not-found lookups."""
+
+    @pytest.mark.asyncio
+    async def test_set_missing_uses_negative_ttl(self):
+        """Test negative entries are stored with the short configured TTL."""
+        manager = CacheManager()
+        mock_redis = AsyncMock()
+        mock_redis.hgetall.return_value = {}
+        manager._redis_client = mock_redis
+
+        assert await manager.set_missing("match:1", "matches")
+
+        cache_key = manager._generate_key("matches", "match:1")
+        args = mock_redis.setex.await_args.args
+        assert args[0] == cache_key
+        assert args[1] == manager.settings.cache.negative_ttl
+        assert json.loads(args[2]) == NEGATIVE_CACHE_MARKER
+        assert manager.get_stats().negative_sets == 1
+
+    @pytest.mark.asyncio
+    async def test_negative_hits_counted_separately(self):
+        """Test hits on negative entries are not counted as hits."""
+        manager = CacheManager()
+        manager._redis_client = AsyncMock()
+        manager._redis_client.hgetall.return_value = {}
+        await manager.set_missing("match:1", "matches")
+        await manager.set("match:2", {"id": "2"}, 60, "matches")
+
+        assert await manager.get("match:1", "matches") == NEGATIVE_CACHE_MARKER
+        assert await manager.get("match:2", "matches") == {"id": "2"}
+
+        stats = manager.get_stats()
+        assert stats.hits == 1
+        assert stats.negative_hits == 1
+        assert stats.hit_rate == 0.5
+        assert stats.negative_hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_delete_many_single_round_trip(self):
+        """Test bulk delete clears memory and issues one Redis call."""
+        manager = CacheManager()
+        mock_redis = AsyncMock()
+        mock_redis.hgetall.return_value = {}
+        mock_redis.delete.return_value = 2
+        manager._redis_client = mock_redis
+        await manager.set_missing("match:1", "matches")
+
+        assert await manager.delete_many(["match:1", "match:2"], "matches") == 2
+
+        mock_redis.delete.assert_awaited_once_with(
+            manager._generate_key("matches", "match:1"),
+            manager._generate_key("matches", "match:2"),
+        )
+        assert manager._generate_key("matches", "match:1") not in manager._memory_cache
+
+
+class TestNamespaceGenerations:
+    """Test generational namespace invalidation."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a manager backed by a mocked Redis client."""
+        manager = CacheManager()
+        manager._redis_client = AsyncMock()
+        manager._redis_client.hgetall.return_value = {}
+        return manager
+
+    def test_generation_zero_keeps_plain_keys(self, manager):
+        """Test namespaces that were never bumped keep the original layout."""
+        key = manager._generate_key("predictions", "m1")
+        assert key == f"{manager.settings.app_name}:predictions:m1"
+
+    @pytest.mark.asyncio
+    async def test_bump_namespace_changes_keys(self, manager):
+        """Test bumping a generation makes old entries unreachable."""
+        manager._redis_client.hincrby.return_value = 1
+        await manager.set("m1", {"home": 0.5}, 60, "predictions")
+        old_key = manager._generate_key("predictions", "m1")
+
+        assert await manager.bump_namespace("predictions") == 1
+
+        new_key = manager._generate_key("predictions", "m1")
+        assert new_key == f"{manager.settings.app_name}:predictions:v1:m1"
+        assert old_key not in manager._memory_cache
+        manager._redis_client.hincrby.assert_awaited_once_with(
+            manager._generations_key, "predictions", 1
+        )
+        manager._redis_client.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bump_survives_redis_outage(self, manager):
+        """Test a bump still invalidates locally when Redis is down."""
+        manager._redis_client.hincrby.side_effect = redis.ConnectionError("down")
+
+        assert await manager.bump_namespace("matches") == 1
+        assert manager.get_generation("matches") == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_generations_mirrors_redis(self, manager):
+        """Test generations bumped by other workers are picked up."""
+        manager._redis_client.hgetall.return_value = {b"teams": b"3"}
+
+        await manager.sync_generations(force=True)
+
+        assert manager.get_generation("teams") == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_generations_is_rate_limited(self, manager):
+        """Test Redis is read at most once per sync interval."""
+        manager._redis_client.get.return_value = None
+        await manager.get("a", "teams")
+        await manager.get("b", "teams")
+
+        manager._redis_client.hgetall.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sync_never_moves_backwards(self, manager):
+        """Test a stale Redis value does not revive an older generation."""
+        manager._generations["teams"] = 5
+        manager._redis_client.hgetall.return_value = {b"teams": b"2"}
+
+        await manager.sync_generations(force=True)
+
+        assert manager.get_generation("teams") == 5
+
+
 class TestCacheStats:
     """Test CacheStats functionality."""
 
@@ -0,0 +1,252 @@
+"""
+Tests for cache warming.
+
+Covers batched, concurrency-bounded warming of predictions, teams and
+league data, and the bulk pipelined set it relies on.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from football_predict_system.core.cache import CacheManager, CacheWarmer, WarmingReport
+from football_predict_system.domain.models import Match, Model, Team
+from football_predict_system.domain.services.prediction_service import PredictionService
+
+
+def make_match(hours_ahead: float = 2, competition: str = "Premier League", **kw):
+    """Create an upcoming match."""
+    return Match(
+        home_team_id=uuid.uuid4(),
+        away_team_id=uuid.uuid4(),
+        competition=competition,
+        season="2024-25",
+        scheduled_date=datetime.utcnow() + timedelta(hours=hours_ahead),
+        **kw,
+    )
+
+
+@pytest.fixture
+def model():
+    """Create an active model."""
+    return Model(name="Test", version="1.0.0", algorithm="XGBoost", accuracy=0.7)
+
+
+@pytest.fixture
+def cache_manager():
+    """Create a cache manager whose bulk set always succeeds."""
+    manager = MagicMock(spec=CacheManager)
+    manager.set_many = AsyncMock(side_effect=lambda items, ttl, ns: len(items))
+    return manager
+
+
+@pytest.fixture
+def data_service():
+    """Create a data service stub."""
+    service = MagicMock()
+    service.get_upcoming_matches = AsyncMock(return_value=[])
+    service.load_matches = AsyncMock(return_value=[])
+    service.load_teams = AsyncMock(return_value=[])
+    return service
+
+
+@pytest.fixture
+def warmer(cache_manager, data_service):
+    """Create a warmer with small batches."""
+    return CacheWarmer(
+        cache_manager,
+        batch_size=2,
+        max_concurrency=2,
+        data_service=data_service,
+        prediction_service=PredictionService(),
+    )
+
+
+class TestWarmingReport:
+    """Test WarmingReport model."""
+
+    def test_keys_per_second(self):
+        """Test throughput calculation."""
+        report = WarmingReport(namespace="x", keys_warmed=50, duration_seconds=0.5)
+        assert report.keys_per_second == 100.0
+
+    def test_keys_per_second_zero_duration(self):
+        """Test throughput with zero duration."""
+        assert WarmingReport(namespace="x", keys_warmed=5).keys_per_second == 0.0
+
+
+class TestWarmPredictions:
+    """Test prediction warming."""
+
+    @pytest.mark.asyncio
+    async def test_warms_upcoming_matches_in_batches(
+        self, warmer, cache_manager, data_service, model
+    ):
+        """Test upcoming matches are scored and written batch by batch."""
+        matches = [make_match() for _ in range(5)]
+        data_service.get_upcoming_matches.return_value = matches
+
+        with patch(
+            "football_predict_system.domain.services.get_model_service"
+        ) as mock_get_model_service:
+            mock_get_model_service.return_value.get_model = AsyncMock(
+                return_value=model
+            )
+            report = await warmer.warm_predictions()
+
+        assert report.namespace == "predictions"
+        assert report.keys_warmed == 5
+        assert report.keys_failed == 0
+        assert report.batches == 3
+        assert cache_manager.set_many.await_count == 3
+
+        written = {}
+        for call in cache_manager.set_many.await_args_list:
+            items, ttl, namespace = call.args
+            assert namespace == "predictions"
+            assert ttl == PredictionService.CACHE_TTL
+            written.update(items)
+
+        expected_key = PredictionService.cache_key(matches[0].id)
+        assert expected_key in written
+        assert "prediction" in written[expected_key]
+
+    @pytest.mark.asyncio
+    async def test_explicit_match_ids(self, warmer, data_service, model):
+        """Test explicit match ids are loaded from the data layer."""
+        data_service.load_matches.return_value = [make_match()]
+
+        with patch(
+            "football_predict_system.domain.services.get_model_service"
+        ) as mock_get_model_service:
+            mock_get_model_service.return_value.get_model = AsyncMock(
+                return_value=model
+            )
+            report = await warmer.warm_predictions(["m1"])
+
+        data_service.load_matches.assert_awaited_once_with(["m1"])
+        data_service.get_upcoming_matches.assert_not_called()
+        assert report.keys_warmed == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_model_skips_warming(self, warmer, cache_manager):
+        """Test warming is skipped when no model is available."""
+        with patch(
+            "football_predict_system.domain.services.get_model_service"
+        ) as mock_get_model_service:
+            mock_get_model_service.return_value.get_model = AsyncMock(return_value=None)
+            report = await warmer.warm_predictions([])
+
+        assert report.keys_warmed == 0
+        cache_manager.set_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_counted(
+        self, warmer, cache_manager, data_service, model
+    ):
+        """Test a failing batch is reported without aborting the run."""
+        data_service.get_upcoming_matches.return_value = [
+            make_match() for _ in range(4)
+        ]
+        cache_manager.set_many.side_effect = [2, RuntimeError("boom")]
+
+        with patch(
+            "football_predict_system.domain.services.get_model_service"
+        ) as mock_get_model_service:
+            mock_get_model_service.return_value.get_model = AsyncMock(
+                return_value=model
+            )
+            report = await warmer.warm_predictions()
+
+        assert report.keys_warmed == 2
+        assert report.keys_failed == 2
+
+
+class TestWarmTeamsAndLeagues:
+    """Test team and league warming."""
+
+    @pytest.mark.asyncio
+    async def test_warm_team_stats(self, warmer, cache_manager, data_service):
+        """Test teams are written under the data service cache keys."""
+        team = Team(name="Arsenal", short_name="ARS")
+        data_service.load_teams.return_value = [team]
+
+        report = await warmer.warm_team_stats([str(team.id)])
+
+        assert report.keys_warmed == 1
+        items, _, namespace = cache_manager.set_many.await_args.args
+        assert namespace == "teams"
+        assert f"team:{team.id}" in items
+
+    @pytest.mark.asyncio
+    async def test_warm_league_data_groups_fixtures(
+        self, warmer, cache_manager, data_service
+    ):
+        """Test one entry is written per league."""
+        data_service.get_upcoming_matches.return_value = [
+            make_match(competition="Premier League"),
+            make_match(competition="Premier League"),
+            make_match(competition="La Liga"),
+        ]
+
+        report = await warmer.warm_league_data(["Premier League"])
+
+        assert report.keys_warmed == 1
+        items, _, namespace = cache_manager.set_many.await_args.args
+        assert namespace == "league_data"
+        assert len(items["league_data:Premier League"]["fixtures"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_upcoming_respects_lookahead(self, warmer, data_service, model):
+        """Test only fixtures inside the kickoff window are warmed."""
+        data_service.get_upcoming_matches.return_value = [
+            make_match(hours_ahead=1),
+            make_match(hours_ahead=48),
+        ]
+
+        with patch(
+            "football_predict_system.domain.services.get_model_service"
+        ) as mock_get_model_service:
+            mock_get_model_service.return_value.get_model = AsyncMock(
+                return_value=model
+            )
+            reports = await warmer.warm_upcoming(lookahead_hours=6)
+
+        by_namespace = {r.namespace: r for r in reports}
+        assert by_namespace["predictions"].keys_warmed == 1
+        data_service.load_teams.assert_awaited_once()
+        assert len(data_service.load_teams.await_args.args[0]) == 2
+
+
+class TestSetMany:
+    """Test CacheManager.set_many."""
+
+    @pytest.mark.asyncio
+    async def test_set_many_uses_single_pipeline(self):
+        """Test all entries go through one pipeline execution."""
+        manager = CacheManager()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value = pipe
+        redis_client.hgetall = AsyncMock(return_value={})
+        manager._redis_client = redis_client
+
+        written = await manager.set_many({"a": 1, "b": 2}, 60, "ns")
+
+        assert written == 2
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_awaited_once()
+        assert manager.get_stats().sets == 2
+        assert manager._generate_key("ns", "a") in manager._memory_cache
+
+    @pytest.mark.asyncio
+    async def test_set_many_empty(self):
+        """Test empty input does not touch Redis."""
+        manager = CacheManager()
+        assert await manager.set_many({}) == 0
+        assert manager._redis_client is None
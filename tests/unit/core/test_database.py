@@ -63,7 +63,8 @@ class TestDatabaseManager:
         mock_create_async_engine.return_value = mock_async_engine
 
         db_manager = DatabaseManager()
-        async_engine = db_manager.get_async_engine()
+        with patch.object(db_manager, "_setup_engine_events"):
+            async_engine = db_manager.get_async_engine()
 
         assert async_engine == mock_async_engine
         mock_create_async_engine.assert_called_once()
@@ -32,9 +32,13 @@ class TestDatabaseManager:
     @pytest.mark.asyncio
     async def test_create_engine(self, db_manager):
         """Test engine creation."""
-        with patch(
-            "football_predict_system.core.database.create_async_engine"
-        ) as mock_create:
+        with (
+            patch(
+                "football_predict_system.core.database.create_async_engine"
+            ) as mock_create,
+            patch.object(db_manager, "_setup_engine_events"),
+            patch.object(db_manager, "_setup_sqlite_profile"),
+        ):
             mock_engine = AsyncMock()
             mock_create.return_value = mock_engine
 
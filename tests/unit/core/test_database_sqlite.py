@@ -0,0 +1,141 @@
+"""
+Tests for the tuned SQLite profile in DatabaseManager.
+"""
+
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from football_predict_system.core.config import DatabaseConfig, SQLiteConfig
+from football_predict_system.core.database import DatabaseManager
+from football_predict_system.core.exceptions import DatabaseError
+
+
+@pytest.fixture
+async def make_manager(tmp_path):
+    managers = []
+
+    def make(url=f"sqlite:///{tmp_path}/football.db", **sqlite):
+        manager = DatabaseManager()
+        manager.settings = MagicMock()
+        manager.settings.get_database_url.return_value = url
+        manager.settings.database = DatabaseConfig(sqlite=SQLiteConfig(**sqlite))
+        manager.settings.debug = False
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        await manager.close()
+
+
+async def pragmas(manager, read_only=False):
+    names = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "query_only")
+    async with manager.get_async_session(read_only=read_only) as session:
+        return {
+            name: (await session.execute(text(f"PRAGMA {name}"))).scalar()
+            for name in names
+        }
+
+
+class TestSQLiteProfile:
+    """Test the pragmas and pools of tuned SQLite engines."""
+
+    async def test_pragmas_applied(self, make_manager):
+        """Test writer and reader connections get the tuned pragmas."""
+        manager = make_manager(busy_timeout_ms=2500)
+
+        writer = await pragmas(manager)
+        reader = await pragmas(manager, read_only=True)
+        with manager.get_session() as session:
+            sync_mode = session.execute(text("PRAGMA journal_mode")).scalar()
+
+        assert writer == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "busy_timeout": 2500,
+            "cache_size": -65536,
+            "query_only": 0,
+        }
+        assert reader["query_only"] == 1
+        assert sync_mode == "wal"
+
+    async def test_single_writer_and_pools(self, make_manager):
+        """Test write sessions share one connection and other sessions pool."""
+        manager = make_manager(reader_pool_size=3)
+        await pragmas(manager, read_only=True)
+        async with manager.get_async_session(write=True):
+            pass
+
+        assert manager._async_write_engine.pool.size() == 1
+        assert manager._async_read_engine.pool.size() == 3
+        assert manager.get_async_engine().pool.size() == 3
+        assert manager.get_engine().pool.size() == 3
+
+    async def test_read_only_sessions_reject_writes(self, make_manager):
+        """Test reader connections cannot modify the database."""
+        manager = make_manager()
+        async with manager.get_async_session() as session:
+            await session.execute(text("CREATE TABLE t (id INTEGER)"))
+
+        with pytest.raises(DatabaseError):
+            async with manager.get_async_session(read_only=True) as session:
+                await session.execute(text("INSERT INTO t VALUES (1)"))
+
+    async def test_writer_takes_lock_up_front(self, make_manager, tmp_path):
+        """Test a write session holds the write lock from its first statement."""
+        manager = make_manager()
+        async with manager.get_async_session() as session:
+            await session.execute(text("CREATE TABLE t (id INTEGER)"))
+
+        other = sqlite3.connect(tmp_path / "football.db", timeout=0)
+        async with manager.get_async_session(write=True) as session:
+            await session.execute(text("SELECT COUNT(*) FROM t"))
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("BEGIN IMMEDIATE")
+        other.close()
+
+    async def test_default_session_reads_without_lock(self, make_manager, tmp_path):
+        """Test ordinary sessions only take the write lock when they write."""
+        manager = make_manager()
+        async with manager.get_async_session() as session:
+            await session.execute(text("CREATE TABLE t (id INTEGER)"))
+
+        other = sqlite3.connect(tmp_path / "football.db", timeout=0)
+        async with manager.get_async_session() as first:
+            await first.execute(text("SELECT COUNT(*) FROM t"))
+            async with manager.get_async_session() as second:
+                await second.execute(text("SELECT COUNT(*) FROM t"))
+            other.execute("BEGIN IMMEDIATE")
+            other.rollback()
+        other.close()
+
+    async def test_readers_not_blocked_by_writer(self, make_manager):
+        """Test reads see committed data while a write is in progress."""
+        manager = make_manager()
+        async with manager.get_async_session() as session:
+            await session.execute(text("CREATE TABLE t (id INTEGER)"))
+            await session.execute(text("INSERT INTO t VALUES (1)"))
+
+        async with manager.get_async_session(write=True) as writer:
+            await writer.execute(text("INSERT INTO t VALUES (2)"))
+            async with manager.get_async_session(read_only=True) as reader:
+                count = (await reader.execute(text("SELECT COUNT(*) FROM t"))).scalar()
+
+        assert count == 1
+
+    @pytest.mark.parametrize(
+        ("url", "sqlite"),
+        [("sqlite://", {}), (None, {"enabled": False})],
+    )
+    async def test_profile_not_applied(self, make_manager, tmp_path, url, sqlite):
+        """Test in-memory databases and a disabled profile keep the defaults."""
+        manager = make_manager(url or f"sqlite:///{tmp_path}/plain.db", **sqlite)
+
+        assert (await pragmas(manager))["journal_mode"] in ("memory", "delete")
+        assert (
+            manager.get_async_read_session_factory()
+            is manager.get_async_session_factory()
+        )
@@ -65,6 +65,7 @@ class TestHealthChecker:
         """Create a HealthChecker instance."""
         with patch("football_predict_system.core.health.get_settings") as mock_settings:
             mock_settings.return_value.health_check_timeout = 30
+            mock_settings.return_value.monitoring.health_check_timeout = 30
             mock_settings.return_value.app_version = "1.0.0"
             mock_settings.return_value.app_name = "Football Prediction System"
             return HealthChecker()
@@ -0,0 +1,241 @@
+"""
+Tests for scheduled health probes and the published health snapshot.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from football_predict_system.core.cache import InMemoryBackend
+from football_predict_system.core.health import (
+    ComponentHealth,
+    HealthChecker,
+    HealthSnapshot,
+    HealthStatus,
+)
+from football_predict_system.main import app
+
+
+def healthy(name):
+    return ComponentHealth(name=name, status=HealthStatus.HEALTHY)
+
+
+@pytest.fixture
+def checker():
+    """Health checker with fast probes replacing the real ones."""
+    with patch("football_predict_system.core.health.get_settings") as settings:
+        monitoring = settings.return_value.monitoring
+        monitoring.resource_sample_interval = 5.0
+        monitoring.health_check_interval = 30
+        monitoring.health_check_timeout = 0.2
+        monitoring.health_stale_after = 90.0
+        settings.return_value.app_version = "1.0.0"
+        checker = HealthChecker()
+
+    checker.calls = 0
+
+    async def database():
+        checker.calls += 1
+        await asyncio.sleep(0.1)
+        return healthy("database")
+
+    async def redis():
+        await asyncio.sleep(0.1)
+        return healthy("redis")
+
+    async def other(name):
+        return healthy(name)
+
+    checker.check_database_health = database
+    checker.check_redis_health = redis
+    checker.check_model_registry = lambda: other("model_registry")
+    checker.check_external_apis = lambda: other("external_apis")
+    checker.check_system_resources = lambda: healthy("system_resources")
+    return checker
+
+
+class TestProbes:
+    """Test running the component probes."""
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self, checker):
+        """Test one round takes as long as the slowest probe."""
+        snapshot = await checker.refresh()
+
+        assert snapshot.status == HealthStatus.HEALTHY
+        assert len(snapshot.components) == 5
+        assert snapshot.duration < 0.19
+        assert checker.snapshot is snapshot
+
+    @pytest.mark.asyncio
+    async def test_slow_probe_times_out(self, checker):
+        """Test a hanging probe is reported unhealthy after its timeout."""
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        checker.check_external_apis = hang
+        snapshot = await checker.refresh()
+
+        external = snapshot.component("external_apis")
+        assert external.status == HealthStatus.UNHEALTHY
+        assert "Timed out" in external.error
+        assert snapshot.status == HealthStatus.UNHEALTHY
+        assert snapshot.duration < 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_immutable(self, checker):
+        """Test published snapshots cannot be changed by readers."""
+        snapshot = await checker.refresh()
+
+        with pytest.raises(ValidationError):
+            snapshot.status = HealthStatus.UNHEALTHY
+
+    @pytest.mark.asyncio
+    async def test_redis_check_reuses_cache_client(self, checker):
+        """Test the Redis probe uses the cache manager's client."""
+        backend = InMemoryBackend()
+
+        class CacheManager:
+            async def get_redis_client(self):
+                return backend
+
+        async def get_cache_manager():
+            return CacheManager()
+
+        with (
+            patch(
+                "football_predict_system.core.health.get_cache_manager",
+                get_cache_manager,
+            ),
+            patch("redis.asyncio.from_url") as from_url,
+        ):
+            result = await HealthChecker.check_redis_health(checker)
+
+        from_url.assert_not_called()
+        assert result.status == HealthStatus.HEALTHY
+        assert result.details["version"] == "in-memory"
+
+
+class TestSnapshotReads:
+    """Test serving health from the snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_scheduled_snapshot_served_without_probing(self, checker):
+        """Test reads return the scheduled snapshot and report its age."""
+        checker.start_probing()
+        for _ in range(100):
+            if checker.snapshot is not None:
+                break
+            await asyncio.sleep(0.01)
+
+        for _ in range(50):
+            health = await checker.get_system_health()
+        await checker.stop_probing()
+
+        assert checker.calls == 1
+        assert health.status == HealthStatus.HEALTHY
+        assert health.age_seconds >= 0
+        assert health.stale is False
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_reported(self, checker):
+        """Test a snapshot older than the limit is marked stale."""
+        await checker.refresh()
+        checker.snapshot = checker.snapshot.model_copy(
+            update={"checked_monotonic": time.monotonic() - 120}
+        )
+        checker._probe_task = asyncio.create_task(asyncio.sleep(10))
+
+        health = await checker.get_system_health()
+        await checker.stop_probing()
+
+        assert health.stale is True
+        assert health.age_seconds >= 120
+        assert checker.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_on_demand_refresh_shared(self, checker):
+        """Test unscheduled callers share a single refresh."""
+        await asyncio.gather(*(checker.get_snapshot() for _ in range(10)))
+
+        assert checker.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_bypass_cache_probes_now(self, checker):
+        """Test use_cache=False always probes."""
+        await checker.get_system_health()
+        await checker.get_system_health(use_cache=False)
+
+        assert checker.calls == 2
+
+
+class TestProbeEndpoints:
+    """Test readiness and liveness served from the snapshot."""
+
+    def snapshot(self, redis_status=HealthStatus.HEALTHY, age=0.0):
+        return HealthSnapshot(
+            status=HealthStatus.HEALTHY,
+            components=(
+                healthy("database"),
+                ComponentHealth(name="redis", status=redis_status),
+            ),
+            checked_at=datetime.utcnow(),
+            checked_monotonic=time.monotonic() - age,
+            duration=0.01,
+        )
+
+    @pytest.fixture
+    def client(self, checker):
+        checker._probe_task = None
+        with patch(
+            "football_predict_system.main.get_health_checker", return_value=checker
+        ):
+            yield TestClient(app)
+
+    def test_ready(self, client, checker):
+        """Test a healthy snapshot makes the service ready without probing."""
+        checker.snapshot = self.snapshot()
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["checks"] == {"database": "healthy", "cache": "healthy"}
+        assert checker.calls == 0
+
+    def test_not_ready_when_cache_unhealthy(self, client, checker):
+        """Test an unhealthy dependency in the snapshot fails readiness."""
+        checker.snapshot = self.snapshot(redis_status=HealthStatus.UNHEALTHY)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["detail"]["checks"]["cache"] == "unhealthy"
+
+    def test_not_ready_when_stale(self, client, checker):
+        """Test readiness fails when probes stopped updating the snapshot."""
+        checker.snapshot = self.snapshot(age=600)
+        checker.settings.monitoring.health_check_interval = 1000
+
+        with patch(
+            "football_predict_system.main.settings.monitoring.health_stale_after", 90
+        ):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["detail"]["stale"] is True
+
+    def test_live_reports_snapshot_age(self, client, checker):
+        """Test liveness reports snapshot age and never probes."""
+        checker.snapshot = self.snapshot(age=5)
+
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json()["health_snapshot_age_seconds"] >= 5
+        assert checker.calls == 0
@@ -0,0 +1,214 @@
+"""
+Tests for the asynchronous log pipeline.
+"""
+
+import io
+import json
+import logging
+import threading
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from football_predict_system.core.logging import (
+    LogPipeline,
+    QueueHandler,
+    flush_logging,
+    get_log_pipeline,
+    get_logger,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def render(logger, method_name, event_dict):
+    """Minimal renderer recording the thread it runs on."""
+    event_dict["thread"] = threading.current_thread().name
+    return json.dumps(event_dict)
+
+
+def lines(stream):
+    """Parse the JSON lines written to a stream."""
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class BlockingRenderer:
+    """Renderer that holds the writer thread until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, logger, method_name, event_dict):
+        self.started.set()
+        self.release.wait(5)
+        return render(logger, method_name, event_dict)
+
+
+class TestLogPipeline:
+    """Test LogPipeline."""
+
+    def test_records_written_by_writer_thread(self):
+        """Test records are rendered off the calling thread and in order."""
+        stream = io.StringIO()
+        pipeline = LogPipeline(stream=stream)
+        pipeline.start()
+
+        for i in range(100):
+            pipeline.put((render, "info", {"event": "e", "i": i}))
+        assert pipeline.flush()
+        pipeline.close()
+
+        written = lines(stream)
+        assert [line["i"] for line in written] == list(range(100))
+        assert {line["thread"] for line in written} == {"log-pipeline"}
+
+    def test_binary_stream_is_written_directly(self):
+        """Test streams with a byte buffer receive the encoded lines."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        pipeline = LogPipeline(stream=stream)
+        pipeline.start()
+
+        pipeline.put((render, "info", {"event": "比赛"}))
+        pipeline.close()
+
+        assert json.loads(raw.getvalue())["event"] == "比赛"
+
+    def test_full_queue_drops_and_reports(self):
+        """Test records beyond the queue size are dropped and counted."""
+        stream = io.StringIO()
+        renderer = BlockingRenderer()
+        pipeline = LogPipeline(stream=stream, max_queue=2)
+        pipeline.start()
+
+        pipeline.put((renderer, "info", {"event": "first"}))
+        assert renderer.started.wait(5)
+        for i in range(5):
+            pipeline.put((render, "info", {"event": "e", "i": i}))
+        renderer.release.set()
+        pipeline.close()
+
+        assert pipeline.dropped == 3
+        written = lines(stream)
+        assert [line["i"] for line in written if "i" in line] == [0, 1]
+        reports = [line for line in written if line["event"] == "Log records dropped"]
+        assert [report["dropped"] for report in reports] == [3]
+
+    def test_block_policy_waits_for_space(self):
+        """Test the block policy makes callers wait instead of dropping."""
+        stream = io.StringIO()
+        renderer = BlockingRenderer()
+        pipeline = LogPipeline(stream=stream, max_queue=1, block=True)
+        pipeline.start()
+
+        pipeline.put((renderer, "info", {"event": "first"}))
+        assert renderer.started.wait(5)
+        pipeline.put((render, "info", {"event": "queued"}))
+        producer = threading.Thread(
+            target=pipeline.put, args=((render, "info", {"event": "blocked"}),)
+        )
+        producer.start()
+        producer.join(0.1)
+        assert producer.is_alive()
+
+        renderer.release.set()
+        producer.join(5)
+        pipeline.close()
+
+        assert pipeline.dropped == 0
+        assert [line["event"] for line in lines(stream)] == [
+            "first",
+            "queued",
+            "blocked",
+        ]
+
+    def test_writes_inline_after_close(self):
+        """Test records logged after shutdown are still written."""
+        stream = io.StringIO()
+        pipeline = LogPipeline(stream=stream)
+        pipeline.start()
+        pipeline.close()
+
+        pipeline.put((render, "info", {"event": "late"}))
+
+        assert lines(stream)[0]["thread"] == threading.current_thread().name
+
+    def test_stdlib_records_use_target_handler(self):
+        """Test stdlib records are formatted by the wrapped handler."""
+        output = io.StringIO()
+        target = logging.StreamHandler(output)
+        target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        pipeline = LogPipeline(stream=io.StringIO(), handler=target)
+        pipeline.start()
+        std_logger = logging.getLogger("test_log_pipeline")
+        std_logger.propagate = False
+        std_logger.addHandler(QueueHandler(pipeline))
+
+        args = {"value": 1}
+        std_logger.warning("value=%(value)s", args)
+        args["value"] = 2  # Later changes must not leak into the record
+        pipeline.close()
+
+        assert output.getvalue() == "WARNING value=1\n"
+
+
+class TestAsyncSetup:
+    """Test setup_logging with the pipeline enabled."""
+
+    @pytest.fixture
+    def settings(self):
+        """Patch settings for JSON logging to stdout."""
+        with patch("football_predict_system.core.logging.get_settings") as mock:
+            config = mock.return_value.logging
+            config.level = "INFO"
+            config.format = "json"
+            config.file_path = None
+            config.async_enabled = True
+            config.queue_size = 100
+            config.queue_full_policy = "drop"
+            config.batch_size = 10
+            config.service_name = "test-service"
+            config.service_version = "1.0"
+            mock.return_value.environment.value = "testing"
+            yield config
+        shutdown_logging()
+        structlog.reset_defaults()
+        logging.root.handlers.clear()
+
+    def test_structlog_output_goes_through_pipeline(self, settings, capsys):
+        """Test structlog events are queued and written as JSON."""
+        setup_logging()
+
+        get_logger("test").info("Prediction served", match_id=7)
+        assert flush_logging()
+
+        assert get_log_pipeline() is not None
+        line = json.loads(capsys.readouterr().out.strip())
+        assert line["event"] == "Prediction served"
+        assert line["match_id"] == 7
+        assert line["service"]["name"] == "test-service"
+
+    def test_exception_rendered_on_writer_thread(self, settings, capsys):
+        """Test exc_info is captured at the call and formatted later."""
+        setup_logging()
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            get_logger("test").exception("Failed")
+        flush_logging()
+
+        line = json.loads(capsys.readouterr().out.strip())
+        assert "ValueError: boom" in line["exception"]
+
+    def test_synchronous_mode(self, settings, capsys):
+        """Test the pipeline can be disabled."""
+        settings.async_enabled = False
+        setup_logging()
+
+        get_logger("test").info("Inline")
+
+        assert get_log_pipeline() is None
+        assert json.loads(capsys.readouterr().out)["event"] == "Inline"
@@ -213,7 +213,7 @@ class TestErrorProcessor:
             assert result["error_details"]["type"] == "ValueError"
             assert result["error_details"]["message"] == "Test error message"
             assert "traceback" in result["error_details"]
-            assert isinstance(result["error_details"]["traceback"], list)
+            assert isinstance(result["error_details"]["traceback"].format(), list)
 
     def test_exception_method_with_exception(self):
         """Test processor with exception method."""
@@ -255,6 +255,10 @@ class TestLoggingSetup:
             mock_settings.return_value.logging.file_path = None
             mock_settings.return_value.logging.max_file_size = 10485760
             mock_settings.return_value.logging.backup_count = 5
+            mock_settings.return_value.logging.async_enabled = False
+            mock_settings.return_value.logging.queue_size = 100
+            mock_settings.return_value.logging.queue_full_policy = "drop"
+            mock_settings.return_value.logging.batch_size = 10
 
             setup_logging()
 
@@ -272,6 +276,10 @@ class TestLoggingSetup:
             mock_settings.return_value.logging.file_path = "/tmp/test_app.log"
             mock_settings.return_value.logging.max_file_size = 10485760
             mock_settings.return_value.logging.backup_count = 5
+            mock_settings.return_value.logging.async_enabled = False
+            mock_settings.return_value.logging.queue_size = 100
+            mock_settings.return_value.logging.queue_full_policy = "drop"
+            mock_settings.return_value.logging.batch_size = 10
 
             setup_logging()
 
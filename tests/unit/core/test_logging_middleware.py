@@ -0,0 +1,120 @@
+"""
+Tests for request logging in LoggingMiddleware.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from football_predict_system.core.config import LoggingConfig
+from football_predict_system.core.logging import LoggingMiddleware
+
+
+@pytest.fixture
+def app():
+    """Create an app with a few routes."""
+    app = FastAPI()
+
+    @app.get("/health/live")
+    async def live():
+        return {"status": "alive"}
+
+    @app.get("/api/v1/items")
+    async def items():
+        return []
+
+    @app.get("/api/v1/broken")
+    async def broken():
+        raise HTTPException(status_code=503, detail="down")
+
+    @app.get("/api/v1/crash")
+    async def crash():
+        raise RuntimeError("boom")
+
+    @app.get("/api/v1/slow")
+    async def slow():
+        await asyncio.sleep(0.02)
+        return {}
+
+    return app
+
+
+def client_for(app, **config):
+    """Wrap an app in the middleware with a mocked logger."""
+    middleware = LoggingMiddleware(app, config=LoggingConfig(**config))
+    middleware.logger = MagicMock()
+    return TestClient(middleware, raise_server_exceptions=False), middleware.logger
+
+
+class TestLoggingMiddleware:
+    """Test LoggingMiddleware."""
+
+    def test_one_line_per_request(self, app):
+        """Test a request is logged once, on completion."""
+        client, logger = client_for(app)
+
+        client.get("/api/v1/items")
+
+        logger.info.assert_called_once()
+        _, fields = logger.info.call_args
+        assert fields["path"] == "/api/v1/items"
+        assert fields["status_code"] == 200
+        assert "sampled_requests" not in fields
+
+    def test_probe_traffic_is_sampled(self, app):
+        """Test probes log one line per sampling interval."""
+        client, logger = client_for(app, request_sample_routes={"/health": 0.1})
+
+        for _ in range(30):
+            client.get("/health/live")
+
+        assert logger.info.call_count == 3
+        assert logger.info.call_args.kwargs["sampled_requests"] == 10
+
+    def test_sampling_disabled_route(self, app):
+        """Test a zero rate silences successful requests."""
+        client, logger = client_for(app, request_sample_routes={"/health": 0.0})
+
+        for _ in range(5):
+            client.get("/health/live")
+
+        logger.info.assert_not_called()
+
+    def test_errors_always_logged(self, app):
+        """Test 5xx responses and exceptions bypass sampling."""
+        client, logger = client_for(app, request_sample_rate=0.0)
+
+        client.get("/api/v1/broken")
+        client.get("/api/v1/crash")
+
+        messages = [c.args[0] for c in logger.error.call_args_list]
+        assert messages == ["Request completed", "Request failed"]
+        assert logger.error.call_args_list[0].kwargs["status_code"] == 503
+
+    def test_slow_requests_always_logged(self, app):
+        """Test requests over the threshold bypass sampling."""
+        client, logger = client_for(
+            app, request_sample_rate=0.0, slow_request_seconds=0.01
+        )
+
+        client.get("/api/v1/slow")
+        client.get("/api/v1/items")
+
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.kwargs["slow"] is True
+
+    def test_most_specific_prefix_wins(self, app):
+        """Test the longest matching prefix decides the rate."""
+        middleware = LoggingMiddleware(
+            app,
+            config=LoggingConfig(
+                request_sample_routes={"/api": 0.5, "/api/v1/items": 1.0}
+            ),
+        )
+
+        assert middleware.sample_every("/api/v1/items") == ("/api/v1/items", 1)
+        assert middleware.sample_every("/api/v1/other") == ("/api", 2)
+        assert middleware.sample_every("/") == ("*", 1)
@@ -4,14 +4,16 @@ Simplified tests for core logging system.
 Tests the actual available components to achieve coverage improvement.
 """
 
+import json
 import time
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from uuid import uuid4
 
 import pytest
 
 from football_predict_system.core.logging import (
     CorrelationIDProcessor,
+    CustomJSONRenderer,
     ErrorProcessor,
     PerformanceProcessor,
     clear_context,
@@ -191,6 +193,141 @@ class TestErrorProcessor:
         assert "error_details" not in result
         assert result["error"] == "String error"
 
+    def test_stack_is_formatted_lazily(self):
+        """Test the stack is captured unformatted and starts at the caller."""
+        processor = ErrorProcessor()
+
+        result = processor(Mock(), "error", {"message": "failed"})
+
+        stack = result["stack_trace"]
+        assert stack._lines is None
+        assert "test_stack_is_formatted_lazily" in stack.format()[-1]
+        assert result["stack_id"].startswith(__name__)
+
+    def test_stack_sampled_per_call_site(self):
+        """Test repeated errors from one site carry a single stack."""
+        processor = ErrorProcessor(interval=60.0)
+
+        results = [processor(Mock(), "error", {"message": "x"}) for _ in range(5)]
+        other = processor(Mock(), "error", {"message": "y"})
+
+        assert ["stack_trace" in r for r in results] == [True] + [False] * 4
+        assert len({r["stack_id"] for r in results}) == 1
+        assert "stack_trace" in other
+        assert other["stack_id"] != results[0]["stack_id"]
+
+    def test_stack_sampling_window_reports_suppressed(self):
+        """Test the next sampled stack reports how many were skipped."""
+        processor = ErrorProcessor(interval=60.0)
+
+        def log_error():
+            return processor(Mock(), "error", {"message": "x"})
+
+        with patch("football_predict_system.core.logging.time.monotonic") as now:
+            now.return_value = 0.0
+            for _ in range(4):
+                log_error()
+            now.return_value = 61.0
+            result = log_error()
+
+        assert "stack_trace" in result
+        assert result["stack_trace_suppressed"] == 3
+
+    def test_exception_traceback_sampled_by_raise_site(self):
+        """Test the same exception raised repeatedly is traced once."""
+        processor = ErrorProcessor()
+
+        def fail():
+            raise ValueError("bad input")
+
+        details = []
+        for _ in range(3):
+            try:
+                fail()
+            except ValueError as e:
+                event = processor(Mock(), "error", {"error": e, "exc_info": False})
+                details.append(event["error_details"])
+
+        assert "ValueError: bad input" in str(details[0]["traceback"])
+        assert all("traceback" not in d for d in details[1:])
+        assert len({d["traceback_id"] for d in details}) == 1
+
+    def test_json_renderer_formats_traces(self):
+        """Test traces are rendered as lists of lines."""
+        processor = ErrorProcessor()
+        event = processor(Mock(), "error", {"event": "failed"})
+
+        rendered = json.loads(CustomJSONRenderer()(Mock(), "error", event))
+
+        assert isinstance(rendered["stack_trace"], list)
+        assert "test_json_renderer_formats_traces" in rendered["stack_trace"][-1]
+
+
+class TestCustomJSONRenderer:
+    """Test CustomJSONRenderer."""
+
+    def test_renders_service_block_built_once(self):
+        """Test settings are read at construction only."""
+        with patch("football_predict_system.core.logging.get_settings") as settings:
+            settings.return_value.logging.service_name = "svc"
+            settings.return_value.logging.service_version = "1.2"
+            settings.return_value.environment.value = "production"
+            renderer = CustomJSONRenderer()
+            lines = [renderer(Mock(), "info", {"event": str(i)}) for i in range(3)]
+
+        assert settings.call_count == 1
+        for line in lines:
+            assert json.loads(line)["service"] == {
+                "name": "svc",
+                "version": "1.2",
+                "environment": "production",
+            }
+
+    def test_renders_utf8_bytes(self):
+        """Test output is UTF-8 JSON bytes when orjson is available."""
+        renderer = CustomJSONRenderer()
+
+        line = renderer(Mock(), "info", {"event": "比赛", "timestamp": 1.5})
+
+        assert isinstance(line, bytes) is renderer.produces_bytes
+        rendered = json.loads(line)
+        assert rendered["event"] == "比赛"
+        assert rendered["timestamp"] == 1.5
+        assert rendered["level"] == "INFO"
+
+    def test_unusual_values_fall_back(self):
+        """Test values orjson rejects are still rendered."""
+        renderer = CustomJSONRenderer()
+
+        line = renderer(Mock(), "info", {"event": "e", "big": 2**70, 1: object()})
+
+        rendered = json.loads(line)
+        assert rendered["big"] == 2**70
+        assert rendered["1"].startswith("<object")
+
+    def test_standard_library_fallback(self):
+        """Test rendering without orjson installed."""
+        with (
+            patch("football_predict_system.core.logging.orjson", None),
+            patch("football_predict_system.core.logging.get_settings") as settings,
+        ):
+            settings.return_value.logging.service_name = "svc"
+            settings.return_value.logging.service_version = "1.2"
+            settings.return_value.environment.value = "testing"
+            renderer = CustomJSONRenderer()
+            line = renderer(Mock(), "info", {"event": "e"})
+
+        assert isinstance(line, str)
+        assert json.loads(line)["service"]["name"] == "svc"
+
+    def test_timestamp_taken_once(self):
+        """Test an existing timestamp is kept through the pipeline."""
+        event = PerformanceProcessor()(Mock(), "info", {"timestamp": 42.0})
+
+        rendered = json.loads(CustomJSONRenderer()(Mock(), "info", event))
+
+        assert rendered["timestamp"] == 42.0
+
 
 class TestContextManagement:
     """Test context variable management functions."""
@@ -0,0 +1,233 @@
+"""
+Tests for operation latency histograms.
+"""
+
+import asyncio
+import random
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry, generate_latest
+
+from football_predict_system.api.v1.monitoring import router
+from football_predict_system.core.logging import log_performance, monitor_performance
+from football_predict_system.core.metrics import (
+    BUCKET_COUNT,
+    MAX_TRACKABLE_NS,
+    LatencyHistogram,
+    OperationMetrics,
+    bucket_index,
+    bucket_upper_ns,
+)
+from football_predict_system.core.security import APIKey, UserRole
+
+
+class TestBuckets:
+    """Test the log-linear bucket layout."""
+
+    def test_small_values_are_exact(self):
+        """Test values below the first power of two range are exact."""
+        for value in range(32):
+            assert bucket_upper_ns(bucket_index(value)) == value
+
+    def test_relative_error_bounded(self):
+        """Test every value lands in a bucket at most ~6% wide."""
+        rng = random.Random(7)
+        for _ in range(10_000):
+            value = rng.randrange(32, MAX_TRACKABLE_NS)
+            index = bucket_index(value)
+            upper = bucket_upper_ns(index)
+            lower = bucket_upper_ns(index - 1) + 1
+            assert lower <= value <= upper
+            assert (upper - lower) / lower < 0.0625
+
+    def test_indexes_fit(self):
+        """Test the largest trackable value has a bucket."""
+        assert bucket_index(MAX_TRACKABLE_NS * 10) < BUCKET_COUNT
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    def test_percentiles(self):
+        """Test percentiles of a uniform distribution."""
+        histogram = LatencyHistogram("op")
+        for ms in range(1, 1001):
+            histogram.record(ms * 1_000_000)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.count == 1000
+        assert snapshot.percentile(50) == pytest.approx(0.5, rel=0.07)
+        assert snapshot.percentile(99) == pytest.approx(0.99, rel=0.07)
+        assert snapshot.percentile(100) == pytest.approx(1.0)
+
+    def test_threads_record_without_losing_calls(self):
+        """Test concurrent threads record into separate shards."""
+        histogram = LatencyHistogram("op")
+
+        def work():
+            for _ in range(10_000):
+                histogram.record(1000)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert histogram.snapshot().count == 40_000
+
+    def test_interval_since_previous_snapshot(self):
+        """Test interval snapshots only include newer calls."""
+        histogram = LatencyHistogram("op")
+        histogram.record(1_000_000)
+        first = histogram.snapshot()
+        histogram.record(5_000_000, error=True)
+
+        interval = histogram.snapshot().since(first)
+
+        assert interval.count == 1
+        assert interval.errors == 1
+        assert interval.percentile(50) == pytest.approx(0.005, rel=0.07)
+
+
+class TestOperationMetrics:
+    """Test OperationMetrics."""
+
+    def test_flush_logs_interval_summaries(self):
+        """Test flush writes one line per active operation."""
+        metrics = OperationMetrics()
+        metrics.record("predict", 2_000_000)
+        metrics.record("predict", 4_000_000)
+        metrics.record("idle", 1_000_000)
+        metrics.flush()
+        metrics.record("predict", 8_000_000)
+
+        with patch("football_predict_system.core.logging.get_logger") as get_logger:
+            flushed = metrics.flush()
+
+        assert list(flushed) == ["predict"]
+        assert flushed["predict"]["count"] == 1
+        get_logger.return_value.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush(self):
+        """Test the background task flushes and stops with a final flush."""
+        metrics = OperationMetrics()
+        metrics.flush = MagicMock()
+
+        metrics.start_flushing(interval_seconds=0.01)
+        await asyncio.sleep(0.05)
+        await metrics.stop_flushing()
+
+        assert metrics.flush.call_count >= 2
+
+    def test_prometheus_export(self):
+        """Test histograms are exported with cumulative buckets."""
+        metrics = OperationMetrics()
+        metrics.record("predict", 2_000_000)
+        metrics.record("predict", 20_000_000, error=True)
+        registry = CollectorRegistry()
+        registry.register(metrics)
+
+        output = generate_latest(registry).decode()
+
+        assert (
+            'operation_duration_seconds_bucket{le="0.001",operation="predict"} 0.0'
+            in output
+        )
+        assert (
+            'operation_duration_seconds_bucket{le="0.0025",operation="predict"} 1.0'
+            in output
+        )
+        assert (
+            'operation_duration_seconds_bucket{le="+Inf",operation="predict"} 2.0'
+            in output
+        )
+        assert 'operation_errors_total{operation="predict"} 1.0' in output
+
+
+class TestDecorators:
+    """Test the decorators record into histograms."""
+
+    @pytest.mark.asyncio
+    async def test_log_performance_records_calls(self):
+        """Test successes and failures are recorded without info logs."""
+        metrics = OperationMetrics()
+        with patch(
+            "football_predict_system.core.logging.get_operation_metrics",
+            return_value=metrics,
+        ):
+
+            @log_performance("lookup")
+            async def lookup(fail=False):
+                if fail:
+                    raise ValueError("missing")
+                return 1
+
+        assert await lookup() == 1
+        with pytest.raises(ValueError):
+            await lookup(fail=True)
+
+        summary = metrics.summary()["lookup"]
+        assert summary["count"] == 2
+        assert summary["errors"] == 1
+
+    def test_monitor_performance_records_calls(self):
+        """Test the sync wrapper records into the named operation."""
+        metrics = OperationMetrics()
+        with patch(
+            "football_predict_system.core.logging.get_operation_metrics",
+            return_value=metrics,
+        ):
+
+            @monitor_performance("数据库写入")
+            def write():
+                return "ok"
+
+        with patch("football_predict_system.core.logging.get_logger") as get_logger:
+            for _ in range(3):
+                assert write() == "ok"
+
+        assert metrics.summary()["数据库写入"]["count"] == 3
+        get_logger.return_value.info.assert_not_called()
+
+
+class TestOperationsEndpoint:
+    """Test the admin operations endpoint."""
+
+    @staticmethod
+    def client(role):
+        """Create a client whose API key has the given role."""
+        from football_predict_system.core.security.api_keys import require_api_key
+
+        app = FastAPI()
+        app.include_router(router, prefix="/monitoring")
+        app.dependency_overrides[require_api_key] = lambda: APIKey(
+            key_hash="h", name="n", user_id="u", role=role
+        )
+        return TestClient(app)
+
+    def test_admin_gets_percentiles(self):
+        """Test admins get per-operation percentiles."""
+        metrics = OperationMetrics()
+        metrics.record("predict", 3_000_000)
+
+        with patch(
+            "football_predict_system.api.v1.monitoring.get_operation_metrics",
+            return_value=metrics,
+        ):
+            response = self.client(UserRole.ADMIN).get("/monitoring/operations")
+
+        assert response.status_code == 200
+        assert set(response.json()["predict"]) >= {"p50_ms", "p95_ms", "p99_ms"}
+
+    def test_non_admin_forbidden(self):
+        """Test other roles are rejected."""
+        response = self.client(UserRole.API_CLIENT).get("/monitoring/operations")
+
+        assert response.status_code == 403
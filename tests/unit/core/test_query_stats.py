@@ -0,0 +1,214 @@
+"""
+Tests for per-statement database query statistics.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry, generate_latest
+from sqlalchemy import text
+
+from football_predict_system.api.v1.monitoring import router
+from football_predict_system.core.config import DatabaseConfig
+from football_predict_system.core.database import DatabaseManager
+from football_predict_system.core.query_stats import QueryStats, fingerprint
+from football_predict_system.core.security import APIKey, UserRole
+
+
+class TestFingerprint:
+    """Test statement normalization."""
+
+    def test_literals_and_parameters_replaced(self):
+        """Test values and every driver's placeholder style become ?."""
+        assert (
+            fingerprint("SELECT * FROM teams WHERE id = 42 AND name = 'O''Brien'")
+            == "SELECT * FROM teams WHERE id = ? AND name = ?"
+        )
+        assert (
+            fingerprint("SELECT $1::int, %(name)s, %s, :team_id FROM t1")
+            == "SELECT ?::int, ?, ?, ? FROM t1"
+        )
+
+    def test_lists_collapse(self):
+        """Test IN lists and multi-row VALUES match whatever their length."""
+        assert fingerprint("SELECT id FROM teams WHERE id IN (?, ?, ?)") == (
+            fingerprint("SELECT id FROM teams WHERE id IN (?)")
+        )
+        assert fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == (
+            "INSERT INTO t (a, b) VALUES (...)"
+        )
+
+    def test_whitespace_collapsed(self):
+        """Test formatting differences do not split statements."""
+        assert fingerprint("SELECT a\n  FROM   t\n") == "SELECT a FROM t"
+
+
+class TestQueryStats:
+    """Test QueryStats."""
+
+    def test_executions_aggregated(self):
+        """Test executions with different values share one entry."""
+        stats = QueryStats()
+        for team_id in range(1, 11):
+            stats.record(
+                f"SELECT * FROM teams WHERE id = {team_id}", team_id * 1_000_000, 1
+            )
+        stats.record("SELECT * FROM teams WHERE id = 99", 1_000_000, error=True)
+
+        [summary] = stats.summary()
+
+        assert summary["statement"] == "SELECT * FROM teams WHERE id = ?"
+        assert summary["count"] == 11
+        assert summary["rows"] == 10
+        assert summary["errors"] == 1
+        assert summary["total_ms"] == pytest.approx(56.0)
+        assert summary["p50_ms"] == pytest.approx(5.0, rel=0.07)
+        assert summary["max_ms"] == pytest.approx(10.0)
+
+    def test_ordering_and_limit(self):
+        """Test summaries are sorted by the requested column."""
+        stats = QueryStats()
+        stats.record("SELECT a FROM t", 10_000_000)
+        for _ in range(5):
+            stats.record("SELECT b FROM t", 1_000_000)
+
+        by_total = stats.summary(limit=1)
+        by_count = stats.summary(order_by="count")
+
+        assert [s["statement"] for s in by_total] == ["SELECT a FROM t"]
+        assert by_count[0]["statement"] == "SELECT b FROM t"
+
+    def test_bounded_by_evicting_least_called(self):
+        """Test a full table evicts the statement with the fewest calls."""
+        stats = QueryStats(max_statements=2)
+        stats.record("SELECT a FROM t", 1000)
+        stats.record("SELECT a FROM t", 1000)
+        stats.record("SELECT b FROM t", 1000)
+        stats.record("SELECT c FROM t", 1000)
+
+        assert {s["statement"] for s in stats.summary()} == {
+            "SELECT a FROM t",
+            "SELECT c FROM t",
+        }
+        assert stats.evictions == 1
+
+    def test_prometheus_export(self):
+        """Test statements are exported with id and fingerprint labels."""
+        stats = QueryStats()
+        stats.record("DELETE FROM t WHERE id = 1", 2_000_000, 3)
+        registry = CollectorRegistry()
+        registry.register(stats)
+
+        output = generate_latest(registry).decode()
+
+        assert 'statement="DELETE FROM t WHERE id = ?"' in output
+        assert "db_statement_duration_seconds_count{" in output
+        assert "db_statement_rows_total{" in output
+        assert "db_statement_errors_total{" in output
+
+
+class TestEngineHooks:
+    """Test the engine events feed the registry."""
+
+    @pytest.fixture
+    def stats(self):
+        stats = QueryStats()
+        with patch(
+            "football_predict_system.core.database.get_query_stats",
+            return_value=stats,
+        ):
+            yield stats
+
+    @pytest.fixture
+    async def db_manager(self, tmp_path, stats):
+        manager = DatabaseManager()
+        manager.settings = MagicMock()
+        manager.settings.get_database_url.return_value = f"sqlite:///{tmp_path}/q.db"
+        manager.settings.database = DatabaseConfig()
+        manager.settings.debug = False
+        yield manager
+        await manager.close()
+
+    async def test_sync_and_async_engines_recorded(self, db_manager, stats):
+        """Test statements on both engines are recorded with row counts."""
+        with db_manager.get_session() as session:
+            session.execute(text("CREATE TABLE t (id INTEGER)"))
+            session.execute(text("INSERT INTO t VALUES (1), (2), (3)"))
+        async with db_manager.get_async_session() as session:
+            await session.execute(text("UPDATE t SET id = id + 10 WHERE id > 1"))
+            await session.execute(text("UPDATE t SET id = id + 10 WHERE id > 5"))
+
+        summaries = {s["statement"]: s for s in stats.summary()}
+
+        assert summaries["INSERT INTO t VALUES (...)"]["rows"] == 3
+        update = summaries["UPDATE t SET id = id + ? WHERE id > ?"]
+        assert update["count"] == 2
+        assert update["rows"] == 4
+
+    async def test_errors_recorded(self, db_manager, stats):
+        """Test failing statements are counted as errors."""
+        with pytest.raises(Exception), db_manager.get_session() as session:  # noqa: B017
+            session.execute(text("SELECT * FROM missing_table"))
+
+        summaries = {s["statement"]: s for s in stats.summary()}
+        assert summaries["SELECT * FROM missing_table"]["errors"] == 1
+
+    async def test_disabled(self, db_manager, stats):
+        """Test the hooks record nothing when statistics are disabled."""
+        db_manager.settings.database.query_stats_enabled = False
+
+        with db_manager.get_session() as session:
+            session.execute(text("SELECT 1"))
+
+        assert stats.summary() == []
+
+
+class TestQueriesEndpoint:
+    """Test the admin query statistics endpoints."""
+
+    @staticmethod
+    def client(role):
+        """Create a client whose API key has the given role."""
+        from football_predict_system.core.security.api_keys import require_api_key
+
+        app = FastAPI()
+        app.include_router(router, prefix="/monitoring")
+        app.dependency_overrides[require_api_key] = lambda: APIKey(
+            key_hash="h", name="n", user_id="u", role=role
+        )
+        return TestClient(app)
+
+    @pytest.fixture
+    def stats(self):
+        stats = QueryStats()
+        stats.record("SELECT a FROM t", 10_000_000)
+        stats.record("SELECT b FROM t", 1_000_000)
+        with patch(
+            "football_predict_system.api.v1.monitoring.get_query_stats",
+            return_value=stats,
+        ):
+            yield stats
+
+    def test_admin_gets_statements(self, stats):
+        """Test admins get the most expensive statements first."""
+        response = self.client(UserRole.ADMIN).get("/monitoring/queries?limit=1")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [s["statement"] for s in body["statements"]] == ["SELECT a FROM t"]
+        assert body["evictions"] == 0
+
+    def test_reset(self, stats):
+        """Test admins can discard the statistics."""
+        response = self.client(UserRole.ADMIN).delete("/monitoring/queries")
+
+        assert response.status_code == 204
+        assert stats.summary() == []
+
+    def test_non_admin_forbidden(self, stats):
+        """Test other roles are rejected."""
+        response = self.client(UserRole.API_CLIENT).get("/monitoring/queries")
+
+        assert response.status_code == 403
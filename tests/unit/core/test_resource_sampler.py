@@ -0,0 +1,124 @@
+"""
+Tests for the background system resource sampler.
+"""
+
+import asyncio
+import time
+from collections import namedtuple
+from unittest.mock import patch
+
+import pytest
+
+from football_predict_system.core.health import (
+    HealthChecker,
+    HealthStatus,
+    ResourceSampler,
+)
+
+Memory = namedtuple("Memory", "total available percent used")
+Disk = namedtuple("Disk", "total free percent used")
+Network = namedtuple("Network", "bytes_sent bytes_recv packets_sent packets_recv")
+
+
+@pytest.fixture
+def fake_psutil():
+    """Patch psutil with controllable readings."""
+    with patch("football_predict_system.core.health.psutil") as mock:
+        mock.cpu_percent.return_value = 10.0
+        mock.virtual_memory.return_value = Memory(100, 60, 40.0, 40)
+        mock.disk_usage.return_value = Disk(100, 50, 50.0, 50)
+        mock.net_io_counters.return_value = Network(1000, 2000, 10, 20)
+        yield mock
+
+
+class TestResourceSampler:
+    """Test ResourceSampler."""
+
+    def test_sample_never_blocks_on_cpu(self, fake_psutil):
+        """Test CPU usage is read without a measurement interval."""
+        sampler = ResourceSampler()
+        snapshot = sampler.sample()
+
+        for call in fake_psutil.cpu_percent.call_args_list:
+            assert call.kwargs == {"interval": None}
+        assert snapshot.cpu_percent == 10.0
+        assert snapshot.memory["percent"] == 40.0
+        assert snapshot.disk["percent"] == 50.0
+        assert snapshot.network["bytes_recv"] == 2000
+        assert sampler.latest is snapshot
+
+    def test_averages_decay_towards_new_values(self, fake_psutil):
+        """Test short windows follow changes faster than long ones."""
+        sampler = ResourceSampler()
+        with patch("football_predict_system.core.health.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            first = sampler.sample()
+            fake_psutil.cpu_percent.return_value = 90.0
+            clock.return_value = 1060.0
+            second = sampler.sample()
+
+        assert first.averages["cpu_percent"] == {"1m": 10.0, "5m": 10.0, "15m": 10.0}
+        cpu = second.averages["cpu_percent"]
+        assert 10.0 < cpu["15m"] < cpu["5m"] < cpu["1m"] < 90.0
+        # One full window elapsed: 1 - 1/e of the way to the new value
+        assert cpu["1m"] == pytest.approx(10 + 80 * (1 - 1 / 2.718281828), abs=0.01)
+
+    def test_network_rates(self, fake_psutil):
+        """Test throughput is derived from consecutive counters."""
+        sampler = ResourceSampler()
+        with patch("football_predict_system.core.health.time.monotonic") as clock:
+            clock.return_value = 0.0
+            sampler.sample()
+            fake_psutil.net_io_counters.return_value = Network(3000, 7000, 30, 40)
+            clock.return_value = 2.0
+            snapshot = sampler.sample()
+
+        assert snapshot.network["sent_bytes_per_second"] == 1000.0
+        assert snapshot.network["recv_bytes_per_second"] == 2500.0
+
+    @pytest.mark.asyncio
+    async def test_background_sampling(self, fake_psutil):
+        """Test the task keeps the snapshot fresh until stopped."""
+        sampler = ResourceSampler(interval=0.01)
+        sampler.start()
+        for _ in range(100):
+            if sampler.latest is not None:
+                break
+            await asyncio.sleep(0.01)
+        await sampler.stop()
+
+        assert sampler.latest is not None
+        assert sampler._task is None
+
+
+class TestCheckSystemResources:
+    """Test the health check reading the sampler."""
+
+    @pytest.fixture
+    def checker(self, fake_psutil):
+        with patch("football_predict_system.core.health.get_settings") as settings:
+            settings.return_value.monitoring.resource_sample_interval = 5.0
+            yield HealthChecker()
+
+    def test_reads_latest_snapshot(self, checker, fake_psutil):
+        """Test the check returns the stored snapshot without sampling."""
+        checker.resource_sampler.sample()
+        fake_psutil.virtual_memory.reset_mock()
+
+        start = time.perf_counter()
+        health = checker.check_system_resources()
+
+        assert time.perf_counter() - start < 0.1
+        fake_psutil.virtual_memory.assert_not_called()
+        assert health.status == HealthStatus.HEALTHY
+        assert health.details["averages"]["cpu_percent"]["1m"] == 10.0
+        assert health.details["age_seconds"] >= 0
+
+    def test_samples_when_no_snapshot(self, checker, fake_psutil):
+        """Test the check works before the sampler has run."""
+        fake_psutil.virtual_memory.return_value = Memory(100, 5, 95.0, 95)
+
+        health = checker.check_system_resources()
+
+        assert health.status == HealthStatus.UNHEALTHY
+        assert health.details["memory"]["percent"] == 95.0
@@ -5,16 +5,25 @@ Tests the DatabaseWriter class for data platform storage operations.
 """
 
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pandas as pd
 import pytest
+from sqlalchemy import event, text
 
+from football_predict_system.core.config import DatabaseConfig
+from football_predict_system.core.database import DatabaseManager
+from football_predict_system.data_platform.storage import database_writer
 from football_predict_system.data_platform.storage.database_writer import (
     DatabaseWriter,
     UpsertResult,
 )
 from football_predict_system.domain.models import Match, Team
 
+SCHEMA = Path(__file__).parents[3] / "sql" / "schema_sqlite.sql"
+WRITER = "football_predict_system.data_platform.storage.database_writer"
+
 
 class TestUpsertResult:
     """Test UpsertResult model."""
@@ -39,6 +48,301 @@ class TestUpsertResult:
         assert result.records_processed == 100
 
 
+class TestNegativeCacheInvalidation:
+    """Test the writer clears negative cache entries for inserted rows."""
+
+    @pytest.mark.asyncio
+    async def test_clear_negative_cache(self):
+        """Test inserted keys are deleted in one bulk call."""
+        writer = DatabaseWriter()
+        mock_cache_manager = AsyncMock()
+
+        with patch(
+            "football_predict_system.data_platform.storage.database_writer"
+            ".get_cache_manager",
+            AsyncMock(return_value=mock_cache_manager),
+        ):
+            await writer._clear_negative_cache(["team:1", "team:57"], "teams")
+
+        mock_cache_manager.delete_many.assert_awaited_once_with(
+            ["team:1", "team:57"], "teams"
+        )
+
+    @pytest.mark.asyncio
+    async def test_clear_negative_cache_noop_without_inserts(self):
+        """Test nothing is sent to the cache when no rows were inserted."""
+        writer = DatabaseWriter()
+
+        with patch(
+            "football_predict_system.data_platform.storage.database_writer"
+            ".get_cache_manager"
+        ) as mock_get_cache:
+            await writer._clear_negative_cache([], "matches")
+
+        mock_get_cache.assert_not_called()
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Create a database manager on a temporary SQLite database."""
+    manager = DatabaseManager()
+    manager.settings = MagicMock()
+    manager.settings.get_database_url.return_value = f"sqlite:///{tmp_path}/data.db"
+    manager.settings.database = DatabaseConfig()
+
+    statements = [s for s in SCHEMA.read_text().split(";") if s.strip()]
+    async with manager.get_async_session() as session:
+        for statement in statements:
+            await session.execute(text(statement))
+
+    with (
+        patch(f"{WRITER}.get_database_manager", return_value=manager),
+        patch(f"{WRITER}.get_cache_manager", AsyncMock()),
+    ):
+        yield manager
+    await manager.close()
+
+
+def count_statements(manager, prefix):
+    """Count executed statements starting with a prefix."""
+    counts = {"statements": 0}
+
+    def count(_conn, _cursor, statement, *args):
+        if statement.strip().startswith(prefix):
+            counts["statements"] += 1
+
+    # Write sessions have their own engine on SQLite
+    engines = {
+        manager.get_async_engine(),
+        manager.get_async_write_session_factory().kw["bind"],
+    }
+    for engine in engines:
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+    return counts
+
+
+def teams_frame(ids, name="Team"):
+    return pd.DataFrame(
+        {
+            "external_api_id": ids,
+            "name": [f"{name} {i}" for i in ids],
+            "short_name": [f"T{i}" for i in ids],
+        }
+    )
+
+
+class TestBatchedUpsert:
+    """Test set-based upserts against SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_teams_inserted_then_updated(self, db_manager):
+        """Test counts come from the returned rows and updates are applied."""
+        writer = DatabaseWriter()
+
+        first = await writer.upsert_teams(teams_frame([1, 2, 3]))
+        second = await writer.upsert_teams(teams_frame([2, 3, 4], name="Renamed"))
+
+        assert first.to_dict() == {"inserted": 3, "updated": 0, "failed": 0}
+        assert second.to_dict() == {"inserted": 1, "updated": 2, "failed": 0}
+        async with db_manager.get_async_session() as session:
+            names = dict(
+                (
+                    await session.execute(
+                        text("SELECT external_api_id, name FROM teams")
+                    )
+                ).all()
+            )
+        assert names == {
+            1: "Team 1",
+            2: "Renamed 2",
+            3: "Renamed 3",
+            4: "Renamed 4",
+        }
+
+    @pytest.mark.asyncio
+    async def test_one_statement_per_batch(self, db_manager):
+        """Test rows are sent in batches rather than one by one."""
+        writer = DatabaseWriter(batch_size=2)
+        counts = count_statements(db_manager, "INSERT INTO teams")
+
+        result = await writer.upsert_teams(teams_frame([1, 2, 3, 4, 5]))
+
+        assert result.inserted == 5
+        assert counts["statements"] == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicates_and_missing_keys(self, db_manager):
+        """Test the last duplicate wins and rows without a key fail."""
+        writer = DatabaseWriter()
+        df = pd.DataFrame(
+            {
+                "external_api_id": [7, 7, None],
+                "name": ["Old", "New", "Nameless"],
+                "short_name": ["O", "N", "X"],
+            }
+        )
+
+        result = await writer.upsert_teams(df)
+
+        assert result.to_dict() == {"inserted": 1, "updated": 0, "failed": 1}
+        async with db_manager.get_async_session() as session:
+            name = (await session.execute(text("SELECT name FROM teams"))).scalar()
+        assert name == "New"
+
+    @pytest.mark.asyncio
+    async def test_negative_cache_cleared_for_inserts_only(self, db_manager):
+        """Test only newly inserted teams have negative cache entries dropped."""
+        writer = DatabaseWriter()
+        await writer.upsert_teams(teams_frame([1]))
+
+        with patch.object(writer, "_clear_negative_cache") as clear:
+            await writer.upsert_teams(teams_frame([1, 2]))
+
+        keys, namespace = clear.call_args.args
+        assert namespace == "teams"
+        assert len(keys) == 2
+        assert "team:2" in keys
+
+    @pytest.mark.asyncio
+    async def test_matches_upserted(self, db_manager):
+        """Test matches resolve teams and upsert on their external id."""
+        writer = DatabaseWriter()
+        await writer.upsert_teams(teams_frame([1, 2]))
+        matches = pd.DataFrame(
+            {
+                "external_api_id": [100, 101, 102],
+                "home_team_id": [1, 2, 1],
+                "away_team_id": [2, 1, 99],
+                "match_date": ["2024-01-01", "2024-01-08", "2024-01-15"],
+                "status": ["SCHEDULED", "SCHEDULED", "SCHEDULED"],
+            }
+        )
+
+        first = await writer.upsert_matches(matches)
+        matches["status"] = "FINISHED"
+        matches["home_score"] = [2, 0, 1]
+        second = await writer.upsert_matches(matches)
+
+        assert first == {"inserted": 2, "updated": 0, "failed": 1}
+        assert second == {"inserted": 0, "updated": 2, "failed": 1}
+        async with db_manager.get_async_session() as session:
+            rows = (
+                await session.execute(
+                    text(
+                        "SELECT external_api_id, status, home_score FROM matches "
+                        "ORDER BY external_api_id"
+                    )
+                )
+            ).all()
+        assert [tuple(row) for row in rows] == [
+            (100, "finished", 2),
+            (101, "finished", 0),
+        ]
+
+
+def matches_frame(ids, teams):
+    return pd.DataFrame(
+        {
+            "external_api_id": ids,
+            "home_team_id": [teams[i % len(teams)] for i in range(len(ids))],
+            "away_team_id": [teams[(i + 1) % len(teams)] for i in range(len(ids))],
+            "match_date": "2024-01-01",
+        }
+    )
+
+
+class TestTeamIdResolution:
+    """Test resolving the teams of a batch of matches."""
+
+    @pytest.mark.asyncio
+    async def test_one_lookup_per_batch(self, db_manager):
+        """Test all teams of a batch are resolved with a single query."""
+        writer = DatabaseWriter()
+        await writer.upsert_teams(teams_frame(list(range(1, 21))))
+        lookups = count_statements(db_manager, "SELECT external_api_id, id")
+
+        result = await writer.upsert_matches(
+            matches_frame(list(range(500)), list(range(1, 21)))
+        )
+
+        assert result == {"inserted": 500, "updated": 0, "failed": 0}
+        assert lookups["statements"] == 1
+
+    @pytest.mark.asyncio
+    async def test_map_reused_within_run(self, db_manager):
+        """Test resolved teams are not looked up again by the same writer."""
+        writer = DatabaseWriter()
+        await writer.upsert_teams(teams_frame([1, 2]))
+        lookups = count_statements(db_manager, "SELECT external_api_id, id")
+
+        await writer.upsert_matches(matches_frame([100], [1, 2]))
+        await writer.upsert_matches(matches_frame([101], [1, 2]))
+        await DatabaseWriter().upsert_matches(matches_frame([102], [1, 2]))
+
+        assert lookups["statements"] == 2
+
+    @pytest.mark.asyncio
+    async def test_native_ids_kept(self, db_manager):
+        """Test ids keep the column's type, e.g. INTEGER as on PostgreSQL."""
+        async with db_manager.get_async_session() as session:
+            await session.execute(text("DROP TABLE matches"))
+            await session.execute(text("DROP TABLE teams"))
+            await session.execute(
+                text("CREATE TABLE teams (id INTEGER PRIMARY KEY, external_api_id INT)")
+            )
+            await session.execute(text("INSERT INTO teams VALUES (42, 7)"))
+
+        team_ids = await DatabaseWriter()._resolve_team_ids({7, 8})
+
+        assert team_ids == {7: 42}
+        assert type(team_ids[7]) is int
+
+
+class TestBulkLoad:
+    """Test the bulk load path for backfills."""
+
+    def test_copy_records_typed_for_binary_copy(self):
+        """Test rows are streamed as plain values matching the staging table."""
+        df = pd.DataFrame(
+            {
+                "external_api_id": [1.0, None],
+                "home_team_id": [10, 11],
+                "away_team_id": [12, 13],
+                "match_date": ["2024-01-01T15:00:00Z", "2024-01-02T17:30:00+01:00"],
+                "status": ["FINISHED", None],
+                "home_score": [2.0, None],
+            }
+        )
+
+        records = list(database_writer._match_copy_records(df))
+
+        assert len(records[0]) == len(database_writer.MATCH_STAGING_COLUMNS)
+        columns = [name for name, _ in database_writer.MATCH_STAGING_COLUMNS]
+        first = dict(zip(columns, records[0], strict=True))
+        second = dict(zip(columns, records[1], strict=True))
+        assert first["position"] == 0
+        assert first["external_api_id"] == 1
+        assert type(first["external_api_id"]) is int
+        assert first["match_date"] == datetime(2024, 1, 1, 15, 0)
+        assert first["match_date"].tzinfo is None
+        assert first["status"] == "finished"
+        assert first["home_score"] == 2
+        assert first["venue"] is None
+        assert second["external_api_id"] is None
+        assert second["match_date"] == datetime(2024, 1, 2, 16, 30)
+        assert second["status"] == "scheduled"
+
+    @pytest.mark.asyncio
+    async def test_sqlite_falls_back_to_batched_upsert(self, db_manager):
+        """Test databases without COPY use the batched upsert."""
+        writer = DatabaseWriter()
+        await writer.upsert_teams(teams_frame([1, 2]))
+
+        result = await writer.bulk_load_matches(matches_frame([100, 101], [1, 2]))
+
+        assert result == {"inserted": 2, "updated": 0, "failed": 0}
+
+
 @pytest.mark.skip(
     reason="DatabaseWriter tests need refactoring for current implementation"
 )
@@ -0,0 +1,232 @@
+"""
+Tests for the data source rate limiter.
+
+A fake clock replaces ``time.monotonic`` and ``asyncio.sleep`` so request
+schedules can be checked exactly without waiting.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from football_predict_system.data_platform.sources import base
+from football_predict_system.data_platform.sources.base import (
+    DataSourceError,
+    RateLimiter,
+    get_shared_rate_limiter,
+)
+
+real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Virtual monotonic clock; sleepers wake in deadline order."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.deadlines: list[float] = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        deadline = self.now + seconds
+        self.deadlines.append(deadline)
+        # Let every other task reach its own sleep before time moves on
+        await real_sleep(0)
+        while deadline != min(self.deadlines):
+            await real_sleep(0)
+        self.deadlines.remove(deadline)
+        self.now = max(self.now, deadline)
+
+
+@pytest.fixture
+def clock():
+    """Patch the limiter's clock and sleep."""
+    fake = FakeClock()
+    with (
+        patch.object(base.time, "monotonic", fake.monotonic),
+        patch.object(base.asyncio, "sleep", fake.sleep),
+    ):
+        yield fake
+
+
+async def send(limiter, clock, sent, status=200, headers=None):
+    """Acquire a slot, record when the request went out and release it."""
+    key = await limiter.acquire()
+    sent.append((round(clock.now - 1000.0, 3), key))
+    limiter.release(key, status, headers or {})
+    return key
+
+
+class TestRateLimiter:
+    """Test the data source RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_spaced_in_order(self, clock):
+        """Test concurrent callers get successive slots in arrival order."""
+        limiter = RateLimiter(calls_per_minute=10)
+        sent = []
+
+        await asyncio.gather(*(send(limiter, clock, sent) for _ in range(4)))
+
+        assert [t for t, _ in sent] == [0.0, 6.0, 12.0, 18.0]
+
+    @pytest.mark.asyncio
+    async def test_available_quota_is_used_immediately(self, clock):
+        """Test reported remaining quota is spent without waiting."""
+        limiter = RateLimiter(calls_per_minute=10)
+        sent = []
+        quota = {"X-Requests-Available-Minute": "9", "X-RequestCounter-Reset": "60"}
+
+        await send(limiter, clock, sent, headers=quota)
+        for _ in range(9):
+            await send(limiter, clock, sent)
+        await send(limiter, clock, sent)
+
+        assert [t for t, _ in sent[:10]] == [0.0] * 10
+        # The steady schedule resumes after the quota burst
+        assert sent[10][0] == 60.0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_waits_for_reset(self, clock):
+        """Test a zero quota pauses the key until the counter resets."""
+        limiter = RateLimiter(calls_per_minute=10)
+        sent = []
+        exhausted = {"X-Requests-Available-Minute": "0", "X-RequestCounter-Reset": "42"}
+
+        await send(limiter, clock, sent, headers=exhausted)
+        await send(limiter, clock, sent)
+
+        assert sent[1][0] == 42.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("headers", "next_slot"),
+        [
+            ({"X-Requests-Available-Minute": "n/a"}, 6.0),
+            ({"X-Requests-Available-Minute": "-1"}, 6.0),
+            (
+                {"X-Requests-Available-Minute": "0", "X-RequestCounter-Reset": "inf"},
+                60.0,
+            ),
+        ],
+    )
+    async def test_malformed_quota_headers_ignored(self, clock, headers, next_slot):
+        """Test bad quota headers neither raise nor stall the key."""
+        limiter = RateLimiter(calls_per_minute=10)
+        sent = []
+
+        await send(limiter, clock, sent, headers=headers)
+        await send(limiter, clock, sent)
+
+        assert sent[1][0] == next_slot
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_key(self, clock):
+        """Test a 429 pauses the key for Retry-After."""
+        limiter = RateLimiter(calls_per_minute=10)
+        sent = []
+
+        await send(limiter, clock, sent, status=429, headers={"Retry-After": "30"})
+        await send(limiter, clock, sent)
+
+        assert sent[1][0] == 30.0
+
+    @pytest.mark.asyncio
+    async def test_pooled_keys_share_the_load(self, clock):
+        """Test requests alternate across pooled keys."""
+        limiter = RateLimiter(calls_per_minute=10, api_keys=["a", "b"])
+        sent = []
+
+        await asyncio.gather(*(send(limiter, clock, sent) for _ in range(4)))
+
+        assert sent == [(0.0, "a"), (0.0, "b"), (6.0, "a"), (6.0, "b")]
+
+    @pytest.mark.asyncio
+    async def test_paused_key_is_skipped(self, clock):
+        """Test a rate limited key is avoided while another is free."""
+        limiter = RateLimiter(calls_per_minute=10, api_keys=["a", "b"])
+        sent = []
+
+        await send(limiter, clock, sent, status=429, headers={"Retry-After": "60"})
+        await send(limiter, clock, sent)
+        await send(limiter, clock, sent)
+
+        assert [key for _, key in sent] == ["a", "b", "b"]
+        assert sent[2][0] == 6.0
+
+    @pytest.mark.asyncio
+    async def test_wait_if_needed(self, clock):
+        """Test the simple wait API keeps the steady schedule."""
+        limiter = RateLimiter(calls_per_minute=30)
+
+        await limiter.wait_if_needed()
+        await limiter.wait_if_needed()
+
+        assert clock.now == 1002.0
+
+    def test_shared_limiter_per_source_and_keys(self):
+        """Test collectors with the same keys share one limiter."""
+        first = get_shared_rate_limiter("test-source", 10, ["k1"])
+
+        assert get_shared_rate_limiter("test-source", 10, ["k1"]) is first
+        assert get_shared_rate_limiter("test-source", 10, ["k2"]) is not first
+
+
+class TestCollectorRateLimiting:
+    """Test rate limiting in FootballDataAPICollector requests."""
+
+    @staticmethod
+    def response(status, headers=None, payload=None):
+        """Create a mocked aiohttp response context."""
+        response = MagicMock()
+        response.status = status
+        response.headers = headers or {}
+        response.json = AsyncMock(return_value=payload or {})
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+    @pytest.fixture
+    def collector(self):
+        """Create a collector with its own limiter and a mocked session."""
+        from football_predict_system.data_platform.sources.football_data_api import (
+            FootballDataAPICollector,
+        )
+
+        collector = FootballDataAPICollector(api_key="k1,k2")
+        collector.rate_limiter = RateLimiter(10, api_keys=collector.api_keys)
+        collector.session = MagicMock()
+        return collector
+
+    @pytest.mark.asyncio
+    async def test_retries_with_another_key_after_429(self, collector, clock):
+        """Test a 429 moves the request to a free key instead of sleeping."""
+        collector.session.get.side_effect = [
+            self.response(429, {"Retry-After": "60"}),
+            self.response(200, payload={"matches": []}),
+        ]
+
+        assert await collector._make_request("matches") == {"matches": []}
+
+        keys = [
+            c.kwargs["headers"]["X-Auth-Token"]
+            for c in collector.session.get.call_args_list
+        ]
+        assert keys == ["k1", "k2"]
+        assert clock.now == 1000.0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_repeated_429(self, collector, clock):
+        """Test persistent 429s raise instead of recursing forever."""
+        collector.session.get.side_effect = lambda *a, **kw: self.response(
+            429, {"Retry-After": "1"}
+        )
+
+        with pytest.raises(DataSourceError):
+            await collector._make_request("matches")
+
+        assert collector.session.get.call_count == collector.MAX_RATE_LIMITED_ATTEMPTS
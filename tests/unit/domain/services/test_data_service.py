@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from football_predict_system.core.cache import NEGATIVE_CACHE_MARKER
 from football_predict_system.domain.services.data_service import DataService
 
 
@@ -149,6 +150,65 @@ class TestDataService:
                 )
                 mock_cache_manager.set.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_get_match_by_id_db_miss_is_negatively_cached(self):
+        """Test a database miss records a negative cache entry."""
+        service = DataService()
+
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get.return_value = None
+
+        with patch(
+            "football_predict_system.domain.services.data_service.get_cache_manager"
+        ) as mock_get_cache:
+            mock_get_cache.return_value = mock_cache_manager
+
+            with patch.object(service, "_load_match_from_db") as mock_load_db:
+                mock_load_db.return_value = None
+
+                assert await service.get_match_by_id("unknown") is None
+
+                mock_cache_manager.set_missing.assert_awaited_once_with(
+                    "match:unknown", "matches"
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_match_by_id_negative_hit_skips_db(self):
+        """Test a negative cache hit does not reach the database."""
+        service = DataService()
+
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get.return_value = NEGATIVE_CACHE_MARKER
+
+        with patch(
+            "football_predict_system.domain.services.data_service.get_cache_manager"
+        ) as mock_get_cache:
+            mock_get_cache.return_value = mock_cache_manager
+
+            with patch.object(service, "_load_match_from_db") as mock_load_db:
+                assert await service.get_match_by_id("unknown") is None
+
+                mock_load_db.assert_not_called()
+                mock_cache_manager.set_missing.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_team_by_id_negative_hit_skips_db(self):
+        """Test a negative team cache hit does not reach the database."""
+        service = DataService()
+
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get.return_value = NEGATIVE_CACHE_MARKER
+
+        with patch(
+            "football_predict_system.domain.services.data_service.get_cache_manager"
+        ) as mock_get_cache:
+            mock_get_cache.return_value = mock_cache_manager
+
+            with patch.object(service, "_load_team_from_db") as mock_load_db:
+                assert await service.get_team_by_id("unknown") is None
+
+                mock_load_db.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_team_by_id_cache_hit(self):
         """Test get_team_by_id with cache hit."""
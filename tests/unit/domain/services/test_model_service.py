@@ -201,6 +201,24 @@ class TestModelService:
             result = await service.get_model()
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_on_model_promoted_bumps_generations(self):
+        """Test promotion invalidates model caches without deleting keys."""
+        service = ModelService()
+        mock_cache_manager = AsyncMock()
+
+        with patch(
+            "football_predict_system.domain.services.model_service.get_cache_manager"
+        ) as mock_get_cache:
+            mock_get_cache.return_value = mock_cache_manager
+
+            await service.on_model_promoted("2.1.0")
+
+        bumped = [c.args[0] for c in mock_cache_manager.bump_namespace.await_args_list]
+        assert bumped == ["models", "predictions"]
+        mock_cache_manager.delete.assert_not_called()
+        mock_cache_manager.clear_namespace.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_model_metadata_with_id(self):
         """Test get_model_metadata with specific model ID."""
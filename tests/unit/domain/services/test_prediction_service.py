@@ -497,3 +497,63 @@ class TestPredictionServiceIntegration:
         assert hasattr(service, "generate_batch_predictions")
         assert callable(service.generate_prediction)
         assert callable(service.generate_batch_predictions)
+
+
+class TestScoreMatches:
+    """Test vectorized batch scoring."""
+
+    @staticmethod
+    def _match(**odds):
+        from football_predict_system.domain.models import Match
+
+        return Match(
+            home_team_id=uuid.uuid4(),
+            away_team_id=uuid.uuid4(),
+            competition="Premier League",
+            season="2024-25",
+            scheduled_date=datetime.utcnow(),
+            **odds,
+        )
+
+    def test_empty_batch(self):
+        """Test scoring an empty batch."""
+        assert PredictionService().score_matches([], MagicMock()) == []
+
+    def test_probabilities_from_odds(self):
+        """Test odds are converted to margin-free probabilities."""
+        model = MagicMock(version="1.0.0", accuracy=0.8)
+        match = self._match(home_odds=1.5, draw_odds=4.0, away_odds=6.0)
+
+        [prediction] = PredictionService().score_matches([match], model)
+
+        total = (
+            prediction.home_win_probability
+            + prediction.draw_probability
+            + prediction.away_win_probability
+        )
+        assert total == pytest.approx(1.0)
+        assert prediction.predicted_result == MatchResult.HOME_WIN
+        assert prediction.match_id == match.id
+        assert prediction.model_version == "1.0.0"
+        assert prediction.features_used == ["market_odds"]
+
+    def test_missing_odds_use_prior(self):
+        """Test matches without odds fall back to the outcome prior."""
+        model = MagicMock(version="1.0.0", accuracy=0.8)
+        with_odds = self._match(home_odds=5.0, draw_odds=4.0, away_odds=1.5)
+        without_odds = self._match()
+
+        predictions = PredictionService().score_matches(
+            [with_odds, without_odds], model
+        )
+
+        assert predictions[0].predicted_result == MatchResult.AWAY_WIN
+        assert predictions[1].home_win_probability == pytest.approx(0.46)
+        assert predictions[1].confidence_level == PredictionConfidence.MEDIUM
+        assert predictions[1].features_used == []
+
+    def test_cache_key_matches_generate_prediction(self):
+        """Test warmed keys line up with the request path."""
+        match_id = uuid.uuid4()
+        assert PredictionService.cache_key(match_id) == f"{match_id}:default"
+        assert PredictionService.cache_key(match_id, "2.0") == f"{match_id}:2.0"
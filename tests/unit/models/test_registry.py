@@ -2,8 +2,10 @@
 Unit tests for the ModelRegistry.
 """
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -16,6 +18,23 @@ def registry(tmp_path: Path) -> ModelRegistry:
     return ModelRegistry(registry_path=str(tmp_path))
 
 
+@pytest.fixture
+def promoted():
+    """Records the versions passed to the model service promotion hook."""
+    with (
+        patch(
+            "football_predict_system.domain.services.model_service."
+            "ModelService.on_model_promoted",
+            new_callable=AsyncMock,
+        ) as hook,
+        patch(
+            "football_predict_system.core.cache.CacheManager",
+            return_value=AsyncMock(),
+        ),
+    ):
+        yield hook
+
+
 @pytest.fixture
 def sample_metadata() -> ModelMetadata:
     """Provides a sample ModelMetadata instance."""
@@ -80,3 +99,26 @@ def test_promote_model(registry: ModelRegistry, sample_metadata: ModelMetadata):
 
     registry.promote_model("test_model", "1.0.0")
     assert registry.get_active_version("test_model") == "1.0.0"
+
+
+def test_activation_invalidates_model_caches(
+    registry: ModelRegistry, sample_metadata: ModelMetadata, promoted: AsyncMock
+):
+    """Tests activating a version runs the cache invalidation hook."""
+    registry.register_model({}, sample_metadata, make_active=False)
+    sample_metadata.version = "2.0.0"
+    registry.register_model({}, sample_metadata, make_active=True)
+    registry.promote_model("test_model", "1.0.0")
+
+    assert [c.args[0] for c in promoted.await_args_list] == ["2.0.0", "1.0.0"]
+
+
+async def test_promotion_inside_event_loop(
+    registry: ModelRegistry, sample_metadata: ModelMetadata, promoted: AsyncMock
+):
+    """Tests promoting from a running service schedules the hook in its loop."""
+    registry.register_model({}, sample_metadata, make_active=False)
+    registry.promote_model("test_model", "1.0.0")
+    await asyncio.sleep(0)
+
+    promoted.assert_awaited_once_with("1.0.0")
@@ -173,10 +173,8 @@ class TestMiddleware:
 
         # Basic security headers check
         headers = response.headers
-        # Common security headers that might be present
-
-        # At least verify response has headers
-        assert len(headers) > 0
+        assert headers["x-content-type-options"] == "nosniff"
+        assert headers["x-frame-options"] == "DENY"
 
     def test_cors_middleware(self, client):
         """Test CORS middleware."""